@@ -2,44 +2,83 @@
 import streamlit as st
 from typing import List, Dict
 from datetime import datetime
+import dataclasses
 import pandas as pd
 
 from core.logging import get_logger
-from utils.helpers import format_currency
-from utils.db_utils import get_records
 from services.validation_service import validation_service
-from app.utils.formatters import format_currency, format_date, get_payment_type_color, get_status_color
-from app.styles.theme import VALIDATION_COLORS, get_status_style
+from app.utils.formatters import (
+    format_currency,
+    format_date,
+    format_validation_errors_df,
+    get_payment_type_color,
+    get_status_color
+)
+from app.styles.theme import get_validation_styles
 
 logger = get_logger(__name__)
 
+# Upper bound on rows sent to the frontend grid per rerun
+MAX_RENDERED_ROWS = 5000
+
+# Columns sent to the frontend grid; nested fields stay server-side
+DISPLAY_COLUMNS = [
+    "payee_name", "cnpj", "payment_type",
+    "competence", "value", "status",
+    "is_valid", "validation_date"
+]
+
+# Explicit column dtypes so pandas skips per-column type inference
+STATUS_COLUMN_DTYPES = {
+    "payee_name": "string",
+    "filename": "string",
+    "cnpj": "string",
+    "payment_type": "category",
+    "competence": "string",
+    "value": "float64",
+    "status": "category",
+    "validation_date": "datetime64[ns, UTC]",
+    "is_valid": "boolean"
+}
+
+@st.cache_data(ttl=60, max_entries=16, show_spinner=False)
+def _load_status_results() -> List[Dict]:
+    """Load combined extraction/validation status (cached across reruns)"""
+    return validation_service.get_combined_validation_status()
+
+@st.fragment
 def status_section():
     """Display status of document processing and validation"""
     try:
         st.header("Processing Status", divider="rainbow")
         
+        if st.button("Refresh", key="status_refresh"):
+            _load_status_results.clear()
+        
         # Get combined results
-        results = validation_service.get_combined_validation_status()
+        results = _load_status_results()
         
         if not results:
             st.info("No documents have been processed yet.")
             return
             
         # Create DataFrame for display
-        df = pd.DataFrame(results)
+        df = pd.DataFrame.from_records(results).astype(STATUS_COLUMN_DTYPES, copy=False)
         
-        # Add styling for payment types and status
-        def style_payment_type(val):
-            color = get_payment_type_color(val)
-            return f'background-color: {color}; color: white; border-radius: 4px; padding: 2px 6px'
-            
-        def style_status(val):
-            color = VALIDATION_COLORS.get(val, VALIDATION_COLORS["DEFAULT"])
-            return f'background-color: {color}; color: white; border-radius: 4px; padding: 2px 6px'
+        # Bound render cost by only sending a window of rows to the frontend
+        # and project away columns (e.g. validation_errors) that are never shown
+        df_view = df[DISPLAY_COLUMNS]
+        if len(df) > MAX_RENDERED_ROWS:
+            start = st.slider("Start row", 0, len(df) - MAX_RENDERED_ROWS, 0)
+            df_view = df_view.iloc[start:start + MAX_RENDERED_ROWS]
+        
+        # Precompute status cell styles once for the rendered window
+        status_styles = get_validation_styles(df_view["status"])
+        styled_view = df_view.style.apply(lambda _: status_styles, subset=["status"])
         
         # Configure column display with enhanced styling
         st.dataframe(
-            df,
+            styled_view,
             column_config={
                 "payee_name": st.column_config.TextColumn(
                     "Payee Name",
@@ -91,11 +130,7 @@ def status_section():
             },
             hide_index=True,
             use_container_width=True,
-            column_order=[
-                "payee_name", "cnpj", "payment_type", 
-                "competence", "value", "status", 
-                "is_valid", "validation_date"
-            ]
+            column_order=DISPLAY_COLUMNS
         )
         
         # Add summary statistics with enhanced styling
@@ -104,8 +139,13 @@ def status_section():
         # Summary metrics with custom styling
         col1, col2, col3 = st.columns(3)
         
+        # Count validation outcomes with boolean masks
+        is_valid = df["is_valid"]
+        valid_count = int(is_valid.eq(True).to_numpy(na_value=False).sum())
+        invalid_count = int(is_valid.eq(False).to_numpy(na_value=False).sum())
+        pending_count = int(is_valid.isna().to_numpy().sum())
+        
         with col1:
-            valid_count = len([r for r in results if r.get("is_valid") is True])
             st.metric(
                 "Valid Documents", 
                 valid_count,
@@ -114,7 +154,6 @@ def status_section():
             )
             
         with col2:
-            invalid_count = len([r for r in results if r.get("is_valid") is False])
             st.metric(
                 "Invalid Documents", 
                 invalid_count,
@@ -123,7 +162,6 @@ def status_section():
             )
             
         with col3:
-            pending_count = len([r for r in results if r.get("is_valid") is None])
             st.metric(
                 "Pending Documents", 
                 pending_count,
@@ -132,18 +170,24 @@ def status_section():
             )
 
         # Add error details with improved styling
-        if any(r.get("validation_errors") for r in results):
+        has_errors = df["validation_errors"].map(bool)
+        if has_errors.any():
             st.divider()
             st.subheader("Validation Details 🔍")
             
-            for result in results:
-                if result.get("validation_errors"):
-                    with st.expander(f"📄 {result['filename']}"):
-                        for error in result["validation_errors"]:
-                            st.error(
-                                f"**{error['field'].title()}**: {error['error']}", 
-                                icon="⚠️"
-                            )
+            # Flatten every error into one frame, keeping the source row index
+            exploded = df.loc[has_errors, ["filename", "validation_errors"]].explode("validation_errors")
+            errors = pd.DataFrame.from_records(
+                [
+                    error if isinstance(error, dict) else dataclasses.asdict(error)
+                    for error in exploded["validation_errors"]
+                ],
+                index=exploded.index
+            )
+            
+            for row_index, group in errors.groupby(level=0, sort=False):
+                with st.expander(f"📄 {df.at[row_index, 'filename']}"):
+                    st.error(format_validation_errors_df(group), icon="⚠️")
 
     except Exception as e:
         st.error(f"Error loading status: {str(e)}", icon="🚨")
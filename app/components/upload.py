@@ -1,29 +1,50 @@
 """Upload component for document processing"""
 import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 from typing import List, Optional, Dict
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, Future
+import hashlib
 
 from core.logging import get_logger
 from core.exceptions import PDFError, ValidationError, DatabaseError, ExtractionError
 from models.db.extraction import PDFExtraction
 from services.document_processor import document_processor
 from repositories.extraction import extraction_repository
+from app.components.status import _load_status_results
+from app.components.validation import _load_extractions
 
 logger = get_logger(__name__)
 
-def handle_upload(uploaded_file) -> Optional[Dict]:
-    """Handle file upload with proper error handling and status tracking"""
+# Upper bound on files processed concurrently (LLM + DB latency bound)
+MAX_UPLOAD_WORKERS = 8
+
+@st.cache_data(
+    ttl="1h",
+    max_entries=200,
+    show_spinner=False,
+    hash_funcs={bytes: lambda b: hashlib.sha256(b).hexdigest()}
+)
+def _extract_document(content: bytes, filename: str) -> PDFExtraction:
+    """Run document extraction, memoized on the PDF content hash"""
+    return document_processor.process_document(
+        content=content,
+        filename=filename
+    )
+
+def process_upload(filename: str, content: bytes) -> Dict:
+    """Process a PDF and persist its extraction (no UI calls, runs on upload workers)"""
+    extraction = _extract_document(content, filename)
+    return extraction_repository.create_extraction(extraction)
+
+def handle_upload(filename: str, future: Future) -> Optional[Dict]:
+    """Handle file upload result with proper error handling and status tracking"""
     try:
-        with st.spinner(f"Processing {uploaded_file.name}..."):
-            extraction = document_processor.process_document(
-                content=uploaded_file.getvalue(),
-                filename=uploaded_file.name
-            )
-            saved_extraction = extraction_repository.create_extraction(extraction)
-            st.success(f"Successfully processed {uploaded_file.name}")
-            # Switch to status tab automatically
-            st.session_state.active_tab = "Status"
-            return saved_extraction
+        saved_extraction = future.result()
+        st.success(f"Successfully processed {filename}")
+        # Switch to status tab automatically
+        st.session_state.active_tab = "Status"
+        return saved_extraction
     except PDFError as pe:
         st.error(f"PDF Error: {str(pe)}")
         logger.error(f"PDF processing failed", exc_info=pe)
@@ -38,6 +59,7 @@ def handle_upload(uploaded_file) -> Optional[Dict]:
         logger.error(f"Unexpected error during processing", exc_info=e)
     return None
 
+@st.fragment
 def upload_section():
     """Handle file upload section"""
     st.header("Upload Documents")
@@ -49,14 +71,37 @@ def upload_section():
     )
     
     if uploaded_files:
-        with st.spinner('Processing files...'):
-            extraction_results = []
-            for uploaded_file in uploaded_files:
-                result = handle_upload(uploaded_file)
-                if result:
-                    extraction_results.append(result)
+        with st.spinner(f'Processing {len(uploaded_files)} files...'):
+            # Overlap LLM/DB I/O across files; UI updates stay on the script thread.
+            # Workers get the session's ScriptRunContext so the st.cache_data
+            # lookup in _extract_document runs inside the session.
+            with ThreadPoolExecutor(
+                max_workers=min(MAX_UPLOAD_WORKERS, len(uploaded_files)),
+                initializer=add_script_run_ctx,
+                initargs=(None, get_script_run_ctx())
+            ) as executor:
+                futures = [
+                    (
+                        uploaded_file.name,
+                        executor.submit(
+                            process_upload,
+                            uploaded_file.name,
+                            uploaded_file.getvalue()
+                        )
+                    )
+                    for uploaded_file in uploaded_files
+                ]
+                
+                extraction_results = []
+                for filename, future in futures:
+                    result = handle_upload(filename, future)
+                    if result:
+                        extraction_results.append(result)
             
             if extraction_results:
+                # Invalidate cached reads so other tabs pick up the new rows
+                _load_status_results.clear()
+                _load_extractions.clear()
                 st.success(f"Successfully processed {len(extraction_results)} files")
                 # Provide feedback and guidance
-                st.info("👉 Check the Status tab to view processing results")
\ No newline at end of file
+                st.info("👉 Check the Status tab to view processing results")
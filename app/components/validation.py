@@ -2,38 +2,62 @@
 import streamlit as st
 from typing import List, Dict
 from datetime import datetime
+import pandas as pd
 
 from core.logging import get_logger
 from services.validation_service import validation_service
-from utils.db_utils import get_records
-from app.utils.formatters import format_currency, get_payment_type_color, format_validation_errors
+from utils.db_utils import get_extractions_with_validations
+from app.utils.formatters import get_payment_type_color, format_validation_errors
+from app.components.status import _load_status_results
 
 logger = get_logger(__name__)
 
+@st.cache_data(ttl=60, max_entries=16, show_spinner=False)
+def _load_extractions() -> List[Dict]:
+    """Load all extractions with embedded validation results, newest first (cached across reruns)"""
+    return get_extractions_with_validations()
+
+def _recent_validations(extractions: List[Dict], limit: int = 5) -> List[Dict]:
+    """Get the most recent validation results embedded in the extractions"""
+    validations = [
+        validation
+        for extraction in extractions
+        for validation in extraction.get("validation_results") or []
+    ]
+    validations.sort(key=lambda v: v.get("validated_at") or "", reverse=True)
+    return validations[:limit]
+
+@st.fragment
 def validation_section():
     """Validation section of the application"""
     st.header("🔍 Validation")
     
+    if st.button("Refresh", key="validation_refresh"):
+        _load_extractions.clear()
+    
     try:
-        # Get all extractions with proper order parameter
-        extractions = get_records(
-            "pdf_extractions",
-            order={
-                "field": "extracted_at",
-                "direction": "desc"
-            }
-        )
+        # Get all extractions (cached)
+        extractions = _load_extractions()
         
         if not extractions:
             st.info("No documents available for validation.")
             return
         
+        df = pd.DataFrame.from_records(
+            extractions,
+            columns=[
+                "file_name", "payee_name", "valor",
+                "payment_type", "status", "confidence_score"
+            ]
+        )
+        
         # Display metrics in columns
         col1, col2, col3 = st.columns(3)
         
-        total = len(extractions)
-        pending = len([e for e in extractions if e.get('status') == 'extracted'])
-        validated = len([e for e in extractions if e.get('status') == 'validated'])
+        statuses = df["status"].to_numpy()
+        total = len(df)
+        pending = int((statuses == 'extracted').sum())
+        validated = int((statuses == 'validated').sum())
         
         with col1:
             st.metric("Total Documents", total)
@@ -47,16 +71,19 @@ def validation_section():
             st.subheader("Documents for Validation")
             
             # Prepare data for display
-            data = []
-            for ext in extractions:
-                data.append({
-                    "File": ext["file_name"],
-                    "Provider": ext["payee_name"],
-                    "Amount": format_currency(ext["valor"]),
-                    "Type": ext["payment_type"],
-                    "Status": ext["status"],
-                    "Confidence": f"{float(ext.get('confidence_score', 0)) * 100:.1f}%"
-                })
+            # Per-cell string formatting is cheaper as a comprehension than Series ops
+            df["confidence_score"] = [
+                f"{0.0 if pd.isna(score) else float(score) * 100:.1f}%"
+                for score in df["confidence_score"].tolist()
+            ]
+            data = df.rename(columns={
+                "file_name": "File",
+                "payee_name": "Provider",
+                "valor": "Amount",
+                "payment_type": "Type",
+                "status": "Status",
+                "confidence_score": "Confidence"
+            })
 
             # Display as dataframe with formatting
             st.dataframe(
@@ -71,8 +98,9 @@ def validation_section():
                         "Provider",
                         width="medium"
                     ),
-                    "Amount": st.column_config.TextColumn(
+                    "Amount": st.column_config.NumberColumn(
                         "Amount",
+                        format="R$ %.2f",
                         width="small"
                     ),
                     "Type": st.column_config.TextColumn(
@@ -105,6 +133,8 @@ def validation_section():
                     with st.spinner("Validating documents..."):
                         try:
                             results = validation_service.validate_all_pending()
+                            _load_extractions.clear()
+                            _load_status_results.clear()
                             st.success(f"Successfully validated {len(results)} documents")
                             st.rerun()  # Refresh the page
                         except Exception as e:
@@ -112,14 +142,7 @@ def validation_section():
                             logger.error("Validation failed", exc_info=e)
         
         # Show validation history if available
-        validation_results = get_records(
-            "validation_results",
-            order={
-                "field": "validated_at",
-                "direction": "desc"
-            },
-            limit=5
-        )
+        validation_results = _recent_validations(extractions, limit=5)
         
         if validation_results:
             st.divider()
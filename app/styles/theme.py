@@ -1,5 +1,6 @@
 """UI style definitions"""
 from typing import Dict
+import pandas as pd
 
 VALIDATION_COLORS = {
     "VALID": "#28a745",    # Green
@@ -8,35 +9,54 @@ VALIDATION_COLORS = {
     "DEFAULT": "#6c757d"   # Gray
 }
 
+# Lowercase keys so raw status values map without per-cell normalization
+_VALIDATION_COLOR_MAP = {
+    status.lower(): color
+    for status, color in VALIDATION_COLORS.items()
+    if status != "DEFAULT"
+}
+
+_STATUS_STYLES = {
+    "extracted": {
+        "background-color": "#90EE90",
+        "color": "#006400",
+        "padding": "4px 8px",
+        "border-radius": "4px",
+        "font-weight": "bold"
+    },
+    "validated": {
+        "background-color": "#87CEEB",
+        "color": "#00008B",
+        "padding": "4px 8px",
+        "border-radius": "4px",
+        "font-weight": "bold"
+    },
+    "failed": {
+        "background-color": "#FFB6C1",
+        "color": "#8B0000",
+        "padding": "4px 8px",
+        "border-radius": "4px",
+        "font-weight": "bold"
+    },
+    "pending": {
+        "background-color": "#FFE4B5",
+        "color": "#8B4513",
+        "padding": "4px 8px",
+        "border-radius": "4px",
+        "font-weight": "bold"
+    }
+}
+
 def get_status_style(status: str) -> Dict[str, str]:
     """Get status display style"""
-    return {
-        "extracted": {
-            "background-color": "#90EE90",
-            "color": "#006400",
-            "padding": "4px 8px",
-            "border-radius": "4px",
-            "font-weight": "bold"
-        },
-        "validated": {
-            "background-color": "#87CEEB",
-            "color": "#00008B",
-            "padding": "4px 8px",
-            "border-radius": "4px",
-            "font-weight": "bold"
-        },
-        "failed": {
-            "background-color": "#FFB6C1",
-            "color": "#8B0000",
-            "padding": "4px 8px",
-            "border-radius": "4px",
-            "font-weight": "bold"
-        },
-        "pending": {
-            "background-color": "#FFE4B5",
-            "color": "#8B4513",
-            "padding": "4px 8px",
-            "border-radius": "4px",
-            "font-weight": "bold"
-        }
-    }.get(status, {}) 
\ No newline at end of file
+    return _STATUS_STYLES.get(status, {})
+
+def get_validation_styles(statuses: pd.Series) -> pd.Series:
+    """Map a status column to CSS style strings in a single vectorized pass"""
+    colors = (
+        statuses.map(_VALIDATION_COLOR_MAP)
+        .astype(object)
+        .fillna(VALIDATION_COLORS["DEFAULT"])
+        .astype(str)
+    )
+    return "background-color: " + colors + "; color: white; border-radius: 4px; padding: 2px 6px"
\ No newline at end of file
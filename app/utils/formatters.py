@@ -1,11 +1,23 @@
 """Formatting utilities for UI display"""
 from typing import List, Dict
 from datetime import datetime
+from functools import lru_cache
+import pandas as pd
 from models.service.enums import PaymentType
+# Shared with the service layer so amounts read the same everywhere (R$ 1.234,56)
+from utils.helpers import format_currency
 
-def format_currency(value: float) -> str:
-    """Format currency values"""
-    return f"R$ {value:,.2f}"
+PAYMENT_TYPE_COLORS = {
+    PaymentType.PC: "blue",
+    PaymentType.BONUS: "green",
+    PaymentType.REEMBOLSO: "orange"
+}
+
+STATUS_COLORS = {
+    "VALID": "green",
+    "INVALID": "red",
+    "PENDING": "yellow"
+}
 
 def format_date(date: datetime, format_str: str = "%d/%m/%Y %H:%M:%S") -> str:
     """Format datetime objects
@@ -30,24 +42,23 @@ def format_validation_errors(errors: List[Dict]) -> str:
         for error in errors
     ])
 
+def format_validation_errors_df(errors: pd.DataFrame) -> str:
+    """Format a DataFrame of validation errors (field/error columns) for display"""
+    if errors.empty:
+        return ""
+    return ("• " + errors["field"].astype(str) + ": " + errors["error"].astype(str)).str.cat(sep="\n")
+
+@lru_cache(maxsize=None)
 def get_payment_type_color(payment_type: str) -> str:
     """Get color for payment type"""
-    colors = {
-        PaymentType.PC: "blue",
-        PaymentType.BONUS: "green",
-        PaymentType.REEMBOLSO: "orange"
-    }
-    return colors.get(payment_type, "gray")
+    return PAYMENT_TYPE_COLORS.get(payment_type, "gray")
 
+@lru_cache(maxsize=None)
 def get_status_color(status: str) -> str:
     """Get color for validation status"""
-    colors = {
-        "VALID": "green",
-        "INVALID": "red",
-        "PENDING": "yellow"
-    }
-    return colors.get(status, "gray")
+    return STATUS_COLORS.get(status, "gray")
 
+@lru_cache(maxsize=None)
 def format_status(status: str) -> str:
     """Format validation status for display"""
     return f":{get_status_color(status)}[{status}]" 
\ No newline at end of file
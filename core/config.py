@@ -19,6 +19,7 @@ BASE_DIR = Path(__file__).parent.parent
 DATA_DIR = BASE_DIR / "data"
 UPLOAD_DIR = DATA_DIR / "uploads"
 PROCESSED_DIR = DATA_DIR / "processed"
+EXTRACTION_CACHE_DIR = DATA_DIR / "extraction_cache"
 
 # Create directories if they don't exist
 UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
@@ -37,6 +38,32 @@ class Settings(BaseSettings):
     # Database
     SUPABASE_URL: str = Field(..., description="Supabase URL")
     SUPABASE_KEY: str = Field(..., description="Supabase key")
+    SUPABASE_PROBE_ON_INIT: bool = Field(
+        default=False,
+        description="Test and warm Supabase connections in the background at startup"
+    )
+    DB_CACHE_TTL: float = Field(
+        default=60.0,
+        description="Seconds a read result stays cached; 0 disables the read cache"
+    )
+    DB_CACHE_MAXSIZE: int = Field(default=10000, description="Cached read results kept per table")
+    DB_POOL_SIZE: int = Field(default=50, description="Maximum pooled Supabase HTTP connections")
+    DB_KEEPALIVE_EXPIRY: float = Field(
+        default=300.0,
+        description="Seconds an idle Supabase connection is kept open"
+    )
+    DB_CIRCUIT_FAILURE_THRESHOLD: int = Field(
+        default=5,
+        description="Consecutive transient database failures that open the circuit"
+    )
+    DB_CIRCUIT_RESET_TIMEOUT: float = Field(
+        default=30.0,
+        description="Seconds database calls fail fast before a probe is let through"
+    )
+    DB_WARMUP_CONNECTIONS: int = Field(
+        default=4,
+        description="Parallel requests opening Supabase connections when SUPABASE_PROBE_ON_INIT is set"
+    )
     
     # OpenAI
     OPENAI_API_KEY: str = Field(..., description="OpenAI API key")
@@ -61,6 +88,14 @@ class Settings(BaseSettings):
     # Validation
     AMOUNT_TOLERANCE: float = Field(default=0.01, description="Amount tolerance for validation")
     CNPJ_LENGTH: int = Field(default=14, description="CNPJ length")
+    VALIDATION_MAX_WORKERS: int = Field(
+        default=8,
+        description="Concurrent database writes when validating pending extractions"
+    )
+    VALIDATION_BATCH_SIZE: int = Field(
+        default=500,
+        description="Pending extractions fetched and validated per batch"
+    )
     
     # LLM Configuration
     MODEL_NAME: str = Field(
@@ -83,6 +118,11 @@ class Settings(BaseSettings):
         description="Text chunk overlap",
         env="MODEL_CHUNK_OVERLAP"  # Optional override via env
     )
+    PDF_BACKEND: str = Field(
+        default="pypdf",
+        description="PDF text extraction backend (pypdf, pypdfium2, pymupdf or pdfminer)",
+        env="PDF_BACKEND"  # Optional override via env
+    )
 
     # Use SettingsConfigDict instead of model_config
     model_config = SettingsConfigDict(
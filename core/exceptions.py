@@ -1,5 +1,6 @@
 """Core exception handling for the application"""
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Mapping
+from types import MappingProxyType
 from enum import Enum
 
 class ErrorSeverity(str, Enum):
@@ -45,134 +46,73 @@ class ErrorCode(str, Enum):
     API_TIMEOUT = "6003"
     API_AUTH = "6004"
 
+# Shared read-only details for errors raised without any
+_EMPTY_DETAILS: Mapping[str, Any] = MappingProxyType({})
+
 class BaseVPayError(Exception):
-    """Base exception class for VPay application"""
+    """Base exception class for VPay application
+    
+    Subclasses set ``_error_code`` and ``_severity`` as class attributes;
+    explicit ``error_code``/``severity`` arguments override them.
+    """
+    
+    _error_code: ErrorCode = ErrorCode.CONFIG_ERROR
+    _severity: ErrorSeverity = ErrorSeverity.ERROR
+    
     def __init__(
         self,
         message: str,
-        error_code: ErrorCode,
-        severity: ErrorSeverity,
+        error_code: Optional[ErrorCode] = None,
+        severity: Optional[ErrorSeverity] = None,
         details: Optional[Dict[str, Any]] = None,
         original_error: Optional[Exception] = None
     ):
         self.message = message
-        self.error_code = error_code
-        self.severity = severity
-        self.details = details or {}
+        self.error_code = self._error_code if error_code is None else error_code
+        self.severity = self._severity if severity is None else severity
+        self.details = details if details is not None else _EMPTY_DETAILS
         self.original_error = original_error
         super().__init__(self.message)
 
 class ConfigurationError(BaseVPayError):
     """Raised when there's a configuration error"""
-    def __init__(
-        self,
-        message: str,
-        details: Optional[Dict[str, Any]] = None,
-        original_error: Optional[Exception] = None
-    ):
-        super().__init__(
-            message=message,
-            error_code=ErrorCode.CONFIG_ERROR,
-            severity=ErrorSeverity.CRITICAL,
-            details=details,
-            original_error=original_error
-        )
+    _error_code = ErrorCode.CONFIG_ERROR
+    _severity = ErrorSeverity.CRITICAL
 
 class InitializationError(BaseVPayError):
     """Raised when component initialization fails"""
-    def __init__(
-        self,
-        message: str,
-        details: Optional[Dict[str, Any]] = None,
-        original_error: Optional[Exception] = None
-    ):
-        super().__init__(
-            message=message,
-            error_code=ErrorCode.INITIALIZATION_ERROR,
-            severity=ErrorSeverity.CRITICAL,
-            details=details,
-            original_error=original_error
-        )
+    _error_code = ErrorCode.INITIALIZATION_ERROR
+    _severity = ErrorSeverity.CRITICAL
 
 class DatabaseError(BaseVPayError):
     """Raised when database operations fail"""
-    def __init__(
-        self,
-        message: str,
-        details: Optional[Dict[str, Any]] = None,
-        original_error: Optional[Exception] = None
-    ):
-        super().__init__(
-            message=message,
-            error_code=ErrorCode.DB_ERROR,
-            severity=ErrorSeverity.ERROR,
-            details=details,
-            original_error=original_error
-        )
+    _error_code = ErrorCode.DB_ERROR
+    _severity = ErrorSeverity.ERROR
+
+class CircuitOpenError(DatabaseError):
+    """Raised instead of calling the database while its circuit is open"""
+    _error_code = ErrorCode.DB_CONNECTION
+    _severity = ErrorSeverity.WARNING
 
 class PDFError(BaseVPayError):
     """Raised when PDF processing fails"""
-    def __init__(
-        self,
-        message: str,
-        details: Optional[Dict[str, Any]] = None,
-        original_error: Optional[Exception] = None
-    ):
-        super().__init__(
-            message=message,
-            error_code=ErrorCode.PDF_ERROR,
-            severity=ErrorSeverity.ERROR,
-            details=details,
-            original_error=original_error
-        )
+    _error_code = ErrorCode.PDF_ERROR
+    _severity = ErrorSeverity.ERROR
 
 class ExtractionError(BaseVPayError):
     """Raised when data extraction fails"""
-    def __init__(
-        self,
-        message: str,
-        details: Optional[Dict[str, Any]] = None,
-        original_error: Optional[Exception] = None
-    ):
-        super().__init__(
-            message=message,
-            error_code=ErrorCode.EXTRACTION_ERROR,
-            severity=ErrorSeverity.ERROR,
-            details=details,
-            original_error=original_error
-        )
+    _error_code = ErrorCode.EXTRACTION_ERROR
+    _severity = ErrorSeverity.ERROR
 
 class ValidationError(BaseVPayError):
     """Raised when validation fails"""
-    def __init__(
-        self,
-        message: str,
-        details: Optional[Dict[str, Any]] = None,
-        original_error: Optional[Exception] = None
-    ):
-        super().__init__(
-            message=message,
-            error_code=ErrorCode.VALIDATION_ERROR,
-            severity=ErrorSeverity.ERROR,
-            details=details,
-            original_error=original_error
-        )
+    _error_code = ErrorCode.VALIDATION_ERROR
+    _severity = ErrorSeverity.ERROR
 
 class APIError(BaseVPayError):
     """Raised when API operations fail"""
-    def __init__(
-        self,
-        message: str,
-        details: Optional[Dict[str, Any]] = None,
-        original_error: Optional[Exception] = None
-    ):
-        super().__init__(
-            message=message,
-            error_code=ErrorCode.API_ERROR,
-            severity=ErrorSeverity.ERROR,
-            details=details,
-            original_error=original_error
-        )
+    _error_code = ErrorCode.API_ERROR
+    _severity = ErrorSeverity.ERROR
 
 # Export all exceptions
 __all__ = [
@@ -182,6 +122,7 @@ __all__ = [
     'ConfigurationError',
     'InitializationError',
     'DatabaseError',
+    'CircuitOpenError',
     'PDFError',
     'ExtractionError',
     'ValidationError',
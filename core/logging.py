@@ -1,53 +1,92 @@
 """Core logging configuration for the application"""
+import copy
 import logging
 import logging.handlers
 import sys
+import queue
+import atexit
 from pathlib import Path
 from typing import Optional, Dict, Any
-import json
-from datetime import datetime
+from time import gmtime, strftime
+
+import orjson
 
 from core.config import settings
 
+_RESERVED_ATTRS = frozenset({
+    'args', 'asctime', 'created', 'exc_info', 'exc_text', 'filename',
+    'funcName', 'levelname', 'levelno', 'lineno', 'module', 'msecs',
+    'msg', 'name', 'pathname', 'process', 'processName', 'relativeCreated',
+    'stack_info', 'thread', 'threadName'
+})
+
 class SafeJSONFormatter(logging.Formatter):
     """Custom JSON formatter that handles reserved keywords"""
     
-    RESERVED_ATTRS = {
-        'args', 'asctime', 'created', 'exc_info', 'exc_text', 'filename',
-        'funcName', 'levelname', 'levelno', 'lineno', 'module', 'msecs',
-        'msg', 'name', 'pathname', 'process', 'processName', 'relativeCreated',
-        'stack_info', 'thread', 'threadName'
-    }
+    RESERVED_ATTRS = _RESERVED_ATTRS
     
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as JSON, safely handling reserved keywords"""
         # Create base log data
         log_data = {
-            "timestamp": datetime.utcnow().isoformat(),
+            # Reuse the timestamp captured by LogRecord instead of a new datetime
+            "timestamp": f"{strftime('%Y-%m-%dT%H:%M:%S', gmtime(record.created))}.{int(record.msecs):03d}Z",
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage()
         }
         
         # Add extra fields if available, avoiding reserved keywords
-        if hasattr(record, 'extra'):
-            extras = {}
-            for key, value in record.extra.items():
-                # If key is reserved, prefix it
-                if key in self.RESERVED_ATTRS:
-                    extras[f"extra_{key}"] = value
-                else:
-                    extras[key] = value
-            log_data.update(extras)
+        extra = getattr(record, 'extra', None)
+        if extra:
+            reserved = _RESERVED_ATTRS
+            if reserved.isdisjoint(extra):
+                log_data.update(extra)
+            else:
+                for key, value in extra.items():
+                    # If key is reserved, prefix it
+                    log_data[f"extra_{key}" if key in reserved else key] = value
             
-        # Add exception info if available
+        # Add exception info if available (pre-rendered by _RawQueueHandler)
         if record.exc_info:
             log_data["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            log_data["exception"] = record.exc_text
             
-        return json.dumps(log_data)
+        return orjson.dumps(
+            log_data,
+            default=str,
+            option=orjson.OPT_UTC_Z | orjson.OPT_NAIVE_UTC
+        ).decode()
+
+class _RawQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that enqueues records without formatting them.
+
+    The stock QueueHandler runs the full formatter on the calling thread.
+    Like it, this merges args into the message and renders exc_info to text
+    before enqueueing, so mutable args or a traceback holding live frames
+    never cross threads, but the JSON layout is still built by the
+    listener's handlers.
+    """
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.message = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = _EXCEPTION_FORMATTER.formatException(record.exc_info)
+        record.exc_info = None
+        return record
+
+_EXCEPTION_FORMATTER = logging.Formatter()
+
+# Background listener that performs handler I/O off the logging threads
+_listener: Optional[logging.handlers.QueueListener] = None
 
 def setup_logging() -> None:
     """Configure application logging"""
+    global _listener
+    
     # Create logs directory if it doesn't exist
     log_dir = Path("logs")
     log_dir.mkdir(exist_ok=True)
@@ -59,8 +98,10 @@ def setup_logging() -> None:
     root_logger = logging.getLogger()
     root_logger.setLevel(logging.INFO)
     
-    # Clear any existing handlers
+    # Clear any existing handlers (and stop a previous listener)
     root_logger.handlers = []
+    if _listener is not None:
+        _listener.stop()
     
     # Create handlers for different log levels
     handlers = {
@@ -98,10 +139,16 @@ def setup_logging() -> None:
         if handler:
             handler.setFormatter(json_formatter)
     
-    # Add handlers to root logger
-    for handler in handlers.values():
-        if handler:
-            root_logger.addHandler(handler)
+    # Route records through a queue; the listener thread runs the real handlers
+    log_queue: queue.Queue = queue.Queue(-1)
+    root_logger.addHandler(_RawQueueHandler(log_queue))
+    _listener = logging.handlers.QueueListener(
+        log_queue,
+        *(handler for handler in handlers.values() if handler),
+        respect_handler_level=True
+    )
+    _listener.start()
+    atexit.register(_listener.stop)
     
     # Configure specific loggers
     loggers = {
@@ -1,53 +1,64 @@
 import os
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from typing import BinaryIO, List, Optional
 
-def read_file_content(file_path: Path) -> str:
-    """Read and return the content of a file"""
+def read_file_content(file_path: Path) -> Optional[bytes]:
+    """Read and return the raw content of a file (None if it doesn't exist)"""
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
+        with open(file_path, 'rb') as f:
             return f.read()
+    except FileNotFoundError:
+        return None
     except Exception as e:
-        return f"Error reading {file_path}: {str(e)}"
+        return f"Error reading {file_path}: {str(e)}".encode('utf-8')
 
-def get_all_project_files() -> str:
-    """Get contents of all relevant project files"""
-    # Define the project root (adjust as needed)
-    project_root = Path('.')
-    
-    # Initialize output
-    output = []
-    
+def collect_project_paths(project_root: Path) -> List[Path]:
+    """Collect paths of all relevant project files"""
     # Define folders and files to scan
     folders_to_scan = ['models', 'services', 'utils']
     root_files = ['app.py', 'config.py']
     
-    # Process root files
-    for file_name in root_files:
-        file_path = project_root / file_name
-        if file_path.exists():
-            output.append(f"\n{'='*80}\n")
-            output.append(f"File: {file_name}\n")
-            output.append(f"{'='*80}\n")
-            output.append(read_file_content(file_path))
+    paths = []
+    
+    # Root files (missing ones are skipped when opened)
+    paths.extend(project_root / file_name for file_name in root_files)
     
-    # Process folders
+    # Folders (rglob yields nothing for a missing folder)
     for folder in folders_to_scan:
-        folder_path = project_root / folder
-        if folder_path.exists():
-            for file_path in folder_path.glob('**/*.py'):
-                if file_path.name != '__pycache__':
-                    output.append(f"\n{'='*80}\n")
-                    output.append(f"File: {file_path}\n")
-                    output.append(f"{'='*80}\n")
-                    output.append(read_file_content(file_path))
+        for file_path in (project_root / folder).rglob('*.py'):
+            if '__pycache__' not in file_path.parts:
+                paths.append(file_path)
     
-    return '\n'.join(output)
+    return paths
 
-if __name__ == "__main__":
-    content = get_all_project_files()
+def write_all_project_files(out: BinaryIO) -> None:
+    """Stream contents of all relevant project files into a binary file handle"""
+    # Define the project root (adjust as needed)
+    project_root = Path('.')
+    
+    paths = collect_project_paths(project_root)
+    separator = f"\n{'='*80}\n".encode('utf-8')
     
+    # Workers read files concurrently; map() yields them in order so the
+    # main thread can drain each chunk straight into the output
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        written = 0
+        for file_path, content in zip(paths, executor.map(read_file_content, paths)):
+            if content is None:
+                continue
+            if written:
+                out.write(b'\n')
+            written += 1
+            out.write(separator)
+            out.write(f"\nFile: {file_path}\n\n".encode('utf-8'))
+            out.write(separator)
+            out.write(b'\n')
+            out.write(content)
+
+if __name__ == "__main__":
     # Save to file
-    with open('project_files.txt', 'w', encoding='utf-8') as f:
-        f.write(content)
+    with open('project_files.txt', 'wb') as f:
+        write_all_project_files(f)
     
-    print("Files have been extracted and saved to project_files.txt") 
\ No newline at end of file
+    print("Files have been extracted and saved to project_files.txt") 
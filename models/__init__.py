@@ -20,7 +20,12 @@ from .service.enums import (
     PaymentType,
     Status,
     ValidationStatus,
-    PaymentStatus
+    PaymentStatus,
+    PaymentTypeT,
+    StatusT,
+    ValidationStatusT,
+    PaymentStatusT,
+    PAYMENT_TYPE_VALUES
 )
 
 # Processing Models
@@ -43,6 +48,11 @@ __all__ = [
     'Status',
     'ValidationStatus',
     'PaymentStatus',
+    'PaymentTypeT',
+    'StatusT',
+    'ValidationStatusT',
+    'PaymentStatusT',
+    'PAYMENT_TYPE_VALUES',
     
     # Processing Models
     'GraphState',
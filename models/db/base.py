@@ -1,10 +1,21 @@
 """Base database model"""
-from typing import Optional
+from typing import Optional, Dict, Any
 from uuid import UUID, uuid4
+from datetime import datetime, timezone
+from functools import partial
 from pydantic import BaseModel, Field, ConfigDict
 
+# Default factory for UTC timestamps (C-level call, no lambda frame)
+utc_now = partial(datetime.now, timezone.utc)
+
 class DBModelBase(BaseModel):
-    """Base model for database entities"""
+    """Base model for database entities
+    
+    Construct with ``Model(**data)`` for untrusted input (LLM output, user
+    data) so every validator runs. Rows read back from Supabase have already
+    passed validation on write and are constrained by the table schema, so
+    they can be hydrated with ``Model.from_db(row)`` which skips validation.
+    """
     id: Optional[UUID] = Field(
         default_factory=uuid4,
         description="Primary key"
@@ -17,4 +28,9 @@ class DBModelBase(BaseModel):
                 "id": "123e4567-e89b-12d3-a456-426614174000"
             }
         }
-    )
\ No newline at end of file
+    )
+
+    @classmethod
+    def from_db(cls, row: Dict[str, Any]):
+        """Hydrate a trusted database row without re-running validation"""
+        return cls.model_construct(**row)
\ No newline at end of file
@@ -4,9 +4,16 @@ from decimal import Decimal
 from datetime import datetime, timezone
 from pydantic import Field, field_validator
 import re
+import sys
 
-from .base import DBModelBase
-from ..service.enums import Status, PaymentType
+from .base import DBModelBase, utc_now
+from ..service.enums import Status, StatusT, PaymentType, PaymentTypeT
+
+_CNPJ_NONDIGIT_RE = re.compile(r'[^0-9]')
+# Deletion table for every ASCII non-digit (fast path for CNPJ stripping)
+_ASCII_NONDIGITS = str.maketrans('', '', ''.join(
+    chr(i) for i in range(128) if not '0' <= chr(i) <= '9'
+))
 
 class PDFExtraction(DBModelBase):
     """
@@ -15,17 +22,17 @@ class PDFExtraction(DBModelBase):
     """
     file_name: str = Field(..., description="Original file name")
     raw_text: str = Field(..., description="Extracted text content")
-    cnpj: str = Field(..., description="CNPJ number", index=True)
+    cnpj: str = Field(..., description="CNPJ number")
     valor: Decimal = Field(..., gt=0, description="Payment amount")
-    competence: str = Field(default="", description="Payment period", index=True)
+    competence: str = Field(default="", description="Payment period")
     payee_name: str = Field(..., description="Provider name")
     description: str = Field(default="", description="Service description")
-    payment_type: PaymentType = Field(default=PaymentType.PC, description="Payment type", index=True)
-    status: Status = Field(default=Status.PENDING, description="Processing status", index=True)
+    payment_type: PaymentTypeT = Field(default=PaymentType.PC, description="Payment type")
+    status: StatusT = Field(default=Status.PENDING, description="Processing status")
     confidence_score: Decimal = Field(..., ge=0, le=1, description="Extraction confidence")
     error_message: Optional[str] = Field(default=None, description="Error message if failed")
     extracted_at: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc),
+        default_factory=utc_now,
         description="Extraction timestamp"
     )
 
@@ -33,15 +40,19 @@ class PDFExtraction(DBModelBase):
     @classmethod
     def validate_competence(cls, v: str) -> str:
         """Validate competence format (MM/YYYY)"""
-        if not re.match(r'^\d{2}/\d{4}$', v):
+        if len(v) != 7 or v[2] != '/' or not (v[:2].isdecimal() and v[3:].isdecimal()):
             raise ValueError("Competence must be in MM/YYYY format")
-        return v
+        # Few distinct periods across many rows: share one string object
+        return sys.intern(v)
 
     @field_validator('cnpj')
     @classmethod
     def validate_cnpj(cls, v: str) -> str:
         """Validate CNPJ format (14 digits)"""
-        cnpj = re.sub(r'[^0-9]', '', v)
+        cnpj = v.translate(_ASCII_NONDIGITS)
+        if not cnpj.isascii():
+            # Rare non-ASCII input: fall back to the full regex filter
+            cnpj = _CNPJ_NONDIGIT_RE.sub('', cnpj)
         if len(cnpj) != 14:
             raise ValueError("CNPJ must have exactly 14 digits")
         return cnpj 
\ No newline at end of file
@@ -2,21 +2,27 @@
 from typing import Optional, Dict
 from pydantic import Field, field_validator
 from datetime import datetime, timezone
+import sys
 
-from .base import DBModelBase
+from .base import DBModelBase, utc_now
 
 class ProcessingLog(DBModelBase):
     """
     Processing and audit logs.
     Maps to 'processing_logs' in database.
     """
-    component: str = Field(..., description="Component name", index=True)
+    component: str = Field(..., description="Component name")
     message: str = Field(..., description="Log message")
-    level: str = Field(..., description="Log level", index=True)
+    level: str = Field(..., description="Log level")
     details: Dict = Field(default_factory=dict, description="Additional log details")
     trace_id: Optional[str] = Field(default=None, description="Trace ID for request tracking")
     timestamp: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc),
-        description="Log timestamp",
-        index=True
-    )
\ No newline at end of file
+        default_factory=utc_now,
+        description="Log timestamp"
+    )
+
+    @field_validator('component', 'level', mode='after')
+    @classmethod
+    def intern_repeated(cls, v: str) -> str:
+        """Intern low-cardinality strings repeated across many log rows"""
+        return sys.intern(v)
\ No newline at end of file
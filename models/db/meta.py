@@ -1,14 +1,15 @@
 """Meta table model"""
 from typing import Optional
 from decimal import Decimal
-from pydantic import Field
+import sys
+from pydantic import Field, ConfigDict, field_validator
 
 from .base import DBModelBase
 
 class MetaTable(DBModelBase):
     """Provider metadata and payment information"""
     nome: str = Field(..., description="Provider name")
-    cpf_cnpj: str = Field(..., description="CPF or CNPJ", index=True)
+    cpf_cnpj: str = Field(..., description="CPF or CNPJ")
     tipo: str = Field(..., description="Provider type")
     pix: str = Field(..., description="PIX key")
     ago_pc: Optional[Decimal] = Field(default=None, description="August PC amount")
@@ -16,9 +17,16 @@ class MetaTable(DBModelBase):
     ago_re: Optional[Decimal] = Field(default=None, description="August Reembolso amount")
     out_pc: Optional[Decimal] = Field(default=None, description="Outubro PC amount")
 
-    class Config:
-        """Model configuration"""
-        json_schema_extra = {
+    @field_validator('tipo', mode='after')
+    @classmethod
+    def intern_tipo(cls, v: str) -> str:
+        """Intern provider type (PF/PJ) shared across many rows"""
+        return sys.intern(v)
+
+    # Meta rows are read-only reference data once loaded
+    model_config = ConfigDict(
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "nome": "Provider Name",
                 "cpf_cnpj": "12345678901234",
@@ -29,4 +37,5 @@ class MetaTable(DBModelBase):
                 "ago_re": None,
                 "out_pc": None
             }
-        } 
\ No newline at end of file
+        }
+    ) 
\ No newline at end of file
@@ -6,21 +6,20 @@ from uuid import UUID
 from pydantic import Field
 
 from .base import DBModelBase
-from ..service.enums import PaymentStatus
+from ..service.enums import PaymentStatus, PaymentStatusT
 
 class PaymentRecord(DBModelBase):
     """
     Payment transaction records.
     Maps to 'payment_records' in database.
     """
-    validation_id: UUID = Field(..., description="Reference to validation result", index=True)
+    validation_id: UUID = Field(..., description="Reference to validation result")
     pix_key: str = Field(..., description="PIX key for payment")
     amount: Decimal = Field(..., gt=0, description="Payment amount")
     scheduled_for: datetime = Field(..., description="Scheduled payment date")
-    status: PaymentStatus = Field(
+    status: PaymentStatusT = Field(
         default=PaymentStatus.PENDING,
-        description="Payment status",
-        index=True
+        description="Payment status"
     )
     transaction_id: Optional[str] = Field(default=None, description="Bank transaction ID")
     error_message: Optional[str] = Field(default=None, description="Error message if failed")
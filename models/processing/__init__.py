@@ -1,9 +1,14 @@
 """Processing models package"""
 from .states import GraphState, create_initial_state
-from .llm import InvoiceData
+from .llm import InvoiceData, parse_invoice_json
+from .invoice_parser import extract_invoice_fields, parse_invoice_text, payment_type_from_filename
 
 __all__ = [
     'GraphState',
     'create_initial_state',
-    'InvoiceData'
+    'InvoiceData',
+    'parse_invoice_json',
+    'extract_invoice_fields',
+    'parse_invoice_text',
+    'payment_type_from_filename'
 ] 
\ No newline at end of file
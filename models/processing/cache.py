@@ -0,0 +1,82 @@
+"""Content-addressable cache for LLM extraction results"""
+from pathlib import Path
+from typing import Dict, Optional
+import hashlib
+import json
+import logging
+import os
+import tempfile
+
+logger = logging.getLogger(__name__)
+
+class ExtractionCache:
+    """
+    Disk cache of structured extraction output, one JSON file per key.
+
+    Keys are derived from the model name, the prompt version, the raw PDF
+    bytes and a variant for any other input the output depends on, so a
+    cached result is only reused for the exact same document processed by
+    the same model and prompts.
+    """
+
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def make_key(model: str, prompt_version: str, content: bytes, variant: str = "") -> str:
+        """Build the cache key for a document"""
+        digest = hashlib.sha256()
+        # Length-prefix each part so differently split inputs can't collide
+        for part in (model.encode(), prompt_version.encode(), content, variant.encode()):
+            digest.update(len(part).to_bytes(8, "little"))
+            digest.update(part)
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get_bytes(self, key: str) -> Optional[bytes]:
+        """Return the raw JSON stored for key, or None on a miss"""
+        try:
+            with open(self._path(key), "rb") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.warning(f"Discarding unreadable cache entry {key}", exc_info=e)
+            self.evict(key)
+            return None
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Return the cached value for key, or None on a miss"""
+        raw = self.get_bytes(key)
+        if raw is None:
+            return None
+        try:
+            return json.loads(raw)
+        except ValueError as e:
+            logger.warning(f"Discarding unreadable cache entry {key}", exc_info=e)
+            self.evict(key)
+            return None
+
+    def put(self, key: str, value: Dict) -> None:
+        """Store value under key, replacing any previous entry atomically"""
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(value, f)
+                os.replace(tmp_path, self._path(key))
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Failed to write cache entry {key}", exc_info=e)
+
+    def evict(self, key: str) -> None:
+        """Remove the entry for key if present"""
+        try:
+            self._path(key).unlink()
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,108 @@
+"""Deterministic field extraction for national-layout NFS-e (DANFSe) text
+
+The DANFSe prints every field as a label line followed by its value on the
+next line, so fields are read by exact label rather than by searching the
+text. Other layouts are left to the LLM.
+"""
+from typing import Any, Dict, List, Optional
+import re
+import unicodedata
+
+from pydantic import ValidationError
+
+from .llm import InvoiceData
+
+_CNPJ_RE = re.compile(r'\d{2}\.?\d{3}\.?\d{3}/?\d{4}-?\d{2}')
+_AMOUNT_RE = re.compile(r'R\$\s*(\d{1,3}(?:\.\d{3})*,\d{2})')
+_DATE_RE = re.compile(r'\d{2}/(0[1-9]|1[0-2])/(\d{4})')
+_AMOUNT_TABLE = str.maketrans({'.': None, ',': '.'})
+_REQUIRED_FIELDS = ('cnpj', 'valor', 'competence', 'payee_name', 'description', 'payment_type')
+
+# Section headings and field labels, compared after _normalize
+_PROVIDER_HEADING = 'emitente da nfs-e'
+_CUSTOMER_HEADING = 'tomador do servico'
+_COMPETENCE_LABEL = 'competencia da nfs-e'
+_CNPJ_LABEL = 'cnpj / cpf / nif'
+_NAME_LABEL = 'nome / nome empresarial'
+_NET_AMOUNT_LABEL = 'valor liquido da nfs-e'
+_DESCRIPTION_LABEL = 'descricao do servico'
+
+# Values are copied verbatim from labelled fields, not inferred
+PARSED_CONFIDENCE = 1.0
+
+def _normalize(text: str) -> str:
+    """Lowercase ASCII form of text, so labels match with or without accents"""
+    return unicodedata.normalize('NFKD', text).encode('ascii', 'ignore').decode().strip().lower()
+
+def payment_type_from_filename(file_name: str) -> str:
+    """Apply the prompt's filename rule, ignoring accents (BÔNUS -> bonus)"""
+    name = _normalize(file_name)
+    if 'bonus' in name:
+        return 'bonus'
+    if 'reembolso' in name:
+        return 'reembolso'
+    return 'pc'
+
+def _label_index(labels: List[str], label: str, start: int = 0, end: Optional[int] = None) -> int:
+    """Position of the first line equal to label in [start, end), or -1"""
+    try:
+        return labels.index(label, start, len(labels) if end is None else end)
+    except ValueError:
+        return -1
+
+def _value_lines(lines: List[str], index: int) -> List[str]:
+    """The value printed under the label at index: lines up to the next blank one"""
+    values = []
+    for line in lines[index + 1:]:
+        if not line:
+            break
+        values.append(line)
+    return values
+
+def extract_invoice_fields(raw_text: str, file_name: str) -> Dict[str, Any]:
+    """Return the invoice fields that can be read from their labelled lines"""
+    fields: Dict[str, Any] = {"payment_type": payment_type_from_filename(file_name)}
+    lines = [line.strip() for line in raw_text.splitlines()]
+    labels = [_normalize(line) for line in lines]
+
+    # Provider data lives between the EMITENTE and TOMADOR (customer) headings
+    provider = _label_index(labels, _PROVIDER_HEADING)
+    customer = _label_index(labels, _CUSTOMER_HEADING, provider + 1)
+    if provider >= 0 and customer >= 0:
+        index = _label_index(labels, _CNPJ_LABEL, provider, customer)
+        value = _value_lines(lines, index) if index >= 0 else []
+        if len(value) == 1 and _CNPJ_RE.fullmatch(value[0]):
+            fields["cnpj"] = value[0]
+        index = _label_index(labels, _NAME_LABEL, provider, customer)
+        value = _value_lines(lines, index) if index >= 0 else []
+        if len(value) == 1 and value[0] != '-':
+            fields["payee_name"] = value[0]
+
+    index = _label_index(labels, _NET_AMOUNT_LABEL)
+    value = _value_lines(lines, index) if index >= 0 else []
+    amount = _AMOUNT_RE.fullmatch(value[0]) if len(value) == 1 else None
+    if amount:
+        fields["valor"] = float(amount.group(1).translate(_AMOUNT_TABLE))
+
+    index = _label_index(labels, _COMPETENCE_LABEL)
+    value = _value_lines(lines, index) if index >= 0 else []
+    date = _DATE_RE.fullmatch(value[0]) if len(value) == 1 else None
+    if date:
+        fields["competence"] = f"{date.group(1)}/{date.group(2)}"
+
+    index = _label_index(labels, _DESCRIPTION_LABEL)
+    value = _value_lines(lines, index) if index >= 0 else []
+    if value and value != ['-']:
+        fields["description"] = " ".join(value)
+
+    return fields
+
+def parse_invoice_text(raw_text: str, file_name: str) -> Optional[InvoiceData]:
+    """Build InvoiceData from the text alone, or None when any field is missing"""
+    fields = extract_invoice_fields(raw_text, file_name)
+    if not all(name in fields for name in _REQUIRED_FIELDS):
+        return None
+    try:
+        return InvoiceData.model_validate({**fields, "confidence": PARSED_CONFIDENCE})
+    except ValidationError:
+        return None
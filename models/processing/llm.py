@@ -1,15 +1,22 @@
 """LLM-specific models"""
-from typing import Optional, Dict, TypedDict, Any
+from dataclasses import dataclass
+from typing import Optional, Dict, Any, Union
 from pydantic import BaseModel, Field, ConfigDict, field_validator
 import re
 
-class ExtractionState(TypedDict):
+from ..service.enums import PAYMENT_TYPE_VALUES
+
+_CNPJ_NONDIGIT = re.compile(r'[^0-9]')
+_COMPETENCE_RE = re.compile(r'^\d{2}/\d{4}$')
+
+@dataclass(slots=True)
+class ExtractionState:
     """State for LLM extraction process"""
     file_name: str
     raw_text: str
-    llm_response: Optional[str]
-    structured_data: Optional[Dict]
-    error: Optional[str]
+    llm_response: Optional[str] = None
+    structured_data: Optional[Dict] = None
+    error: Optional[str] = None
 
 class LLMInput(BaseModel):
     """Input structure for LLM processing"""
@@ -19,7 +26,7 @@ class LLMInput(BaseModel):
     temperature: float = Field(default=0.0, description="LLM temperature")
     params: Dict[str, Any] = Field(default_factory=dict, description="Additional parameters")
 
-    model_config = ConfigDict(protected_namespaces=())
+    model_config = ConfigDict(protected_namespaces=(), defer_build=True)
 
 class LLMOutput(BaseModel):
     """Output structure from LLM"""
@@ -28,7 +35,7 @@ class LLMOutput(BaseModel):
     tokens_used: Optional[int] = Field(default=None, description="Number of tokens used")
     metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
 
-    model_config = ConfigDict(protected_namespaces=())
+    model_config = ConfigDict(protected_namespaces=(), defer_build=True)
 
 class InvoiceData(BaseModel):
     """Structure for invoice data extracted by LLM"""
@@ -45,11 +52,13 @@ class InvoiceData(BaseModel):
         description="Confidence score of extraction"
     )
 
+    model_config = ConfigDict(defer_build=True)
+
     @field_validator('cnpj')
     @classmethod
     def validate_cnpj(cls, v: str) -> str:
         """Validate CNPJ format"""
-        cnpj = re.sub(r'[^0-9]', '', v)
+        cnpj = _CNPJ_NONDIGIT.sub('', v)
         if len(cnpj) != 14:
             raise ValueError("CNPJ must have exactly 14 digits")
         return cnpj
@@ -58,7 +67,7 @@ class InvoiceData(BaseModel):
     @classmethod
     def validate_competence(cls, v: str) -> str:
         """Validate competence format"""
-        if not re.match(r'^\d{2}/\d{4}$', v):
+        if not _COMPETENCE_RE.match(v):
             raise ValueError("Competence must be in MM/YYYY format")
         return v
 
@@ -66,17 +75,19 @@ class InvoiceData(BaseModel):
     @classmethod
     def validate_payment_type(cls, v: str) -> str:
         """Validate payment type"""
-        valid_types = {'pc', 'reembolso', 'bonus'}
-        if v.lower() not in valid_types:
-            raise ValueError(f"Payment type must be one of: {', '.join(valid_types)}")
-        return v.lower()
+        payment_type = v.lower()
+        if payment_type not in PAYMENT_TYPE_VALUES:
+            raise ValueError(f"Payment type must be one of: {', '.join(sorted(PAYMENT_TYPE_VALUES))}")
+        return payment_type
+
+def parse_invoice_json(raw: Union[bytes, str]) -> InvoiceData:
+    """Parse and validate invoice JSON in a single pydantic-core pass
+    
+    Goes through the model rather than a module-level TypeAdapter, so the
+    schema is still only built on first use (defer_build).
+    """
+    return InvoiceData.model_validate_json(raw)
 
 def create_initial_state(file_name: str, raw_text: str) -> ExtractionState:
     """Create initial state for LLM processing"""
-    return {
-        "file_name": file_name,
-        "raw_text": raw_text,
-        "llm_response": None,
-        "structured_data": None,
-        "error": None
-    }
\ No newline at end of file
+    return ExtractionState(file_name=file_name, raw_text=raw_text)
\ No newline at end of file
@@ -1,35 +1,31 @@
 """State management models for LLM processing flow"""
-from typing import TypedDict, Dict, Optional, List
+from dataclasses import dataclass
+from typing import Dict, Optional
 
-class GraphState(TypedDict):
+@dataclass(slots=True)
+class GraphState:
     """
     Represents the state of the invoice processing graph.
     
     Attributes:
         file_name: Name of the PDF file
-        content: Raw PDF content in bytes
+        content: Raw PDF content in bytes, released once text is extracted
         raw_text: Extracted text from PDF
-        llm_analysis: First LLM analysis of the invoice
         json_output: Final structured JSON data
         error: Error message if any step fails
-        documents: List of document chunks
+        cache_key: Extraction cache key for the document, if caching is enabled
     """
     file_name: str
-    content: bytes
-    raw_text: Optional[str]
-    llm_analysis: Optional[str]
-    json_output: Optional[Dict]
-    error: Optional[str]
-    documents: List[str]
+    content: Optional[bytes]
+    raw_text: Optional[str] = None
+    json_output: Optional[Dict] = None
+    error: Optional[str] = None
+    cache_key: Optional[str] = None
 
-def create_initial_state(filename: str, content: bytes) -> GraphState:
+def create_initial_state(
+    filename: str,
+    content: bytes,
+    cache_key: Optional[str] = None
+) -> GraphState:
     """Create initial state for processing graph"""
-    return {
-        "file_name": filename,
-        "content": content,
-        "raw_text": None,
-        "documents": [],
-        "llm_analysis": None,
-        "json_output": None,
-        "error": None
-    }
\ No newline at end of file
+    return GraphState(file_name=filename, content=content, cache_key=cache_key)
\ No newline at end of file
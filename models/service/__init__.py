@@ -1,5 +1,15 @@
 """Service models for business logic"""
-from .enums import PaymentType, Status, ValidationStatus, PaymentStatus
+from .enums import (
+    PaymentType,
+    Status,
+    ValidationStatus,
+    PaymentStatus,
+    PaymentTypeT,
+    StatusT,
+    ValidationStatusT,
+    PaymentStatusT,
+    PAYMENT_TYPE_VALUES
+)
 from .base import ServiceResult, ServiceContext
 
 __all__ = [
@@ -7,6 +17,11 @@ __all__ = [
     'Status',
     'ValidationStatus',
     'PaymentStatus',
+    'PaymentTypeT',
+    'StatusT',
+    'ValidationStatusT',
+    'PaymentStatusT',
+    'PAYMENT_TYPE_VALUES',
     'ServiceResult',
     'ServiceContext'
 ] 
\ No newline at end of file
@@ -1,9 +1,11 @@
 """Base service models"""
 from typing import Optional, Dict, Generic, TypeVar
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ConfigDict
 from uuid import UUID
 
+from ..db.base import utc_now
+
 T = TypeVar('T')
 
 class ServiceResult(BaseModel, Generic[T]):
@@ -12,12 +14,16 @@ class ServiceResult(BaseModel, Generic[T]):
     data: Optional[T] = Field(default=None, description="Operation result data")
     error: Optional[str] = Field(default=None, description="Error message if failed")
     trace_id: Optional[str] = Field(default=None, description="Operation trace ID")
-    timestamp: datetime = Field(default_factory=datetime.utcnow, description="Operation timestamp")
+    timestamp: datetime = Field(default_factory=utc_now, description="Operation timestamp")
     metadata: Dict = Field(default_factory=dict, description="Additional metadata")
 
+    model_config = ConfigDict(defer_build=True)
+
 class ServiceContext(BaseModel):
     """Context for service operations"""
     user_id: Optional[UUID] = Field(default=None, description="User ID")
     trace_id: Optional[str] = Field(default=None, description="Trace ID")
     metadata: Dict = Field(default_factory=dict, description="Operation metadata")
-    start_time: datetime = Field(default_factory=datetime.utcnow, description="Operation start time") 
\ No newline at end of file
+    start_time: datetime = Field(default_factory=utc_now, description="Operation start time")
+
+    model_config = ConfigDict(defer_build=True) 
\ No newline at end of file
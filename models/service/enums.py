@@ -1,35 +1,56 @@
-"""Enumeration types for the application"""
-from enum import Enum
+"""Enumeration types for the application
 
-class PaymentType(str, Enum):
+Values are plain string constants rather than ``Enum`` members: comparisons
+are bare ``str`` equality and model fields validate against the ``Literal``
+aliases, which pydantic-core checks without an enum value table lookup.
+"""
+from typing import Final, Literal, get_args
+
+PaymentTypeT = Literal["pc", "reembolso", "bonus"]
+StatusT = Literal["pending", "processing", "extracted", "failed", "validated"]
+ValidationStatusT = Literal[
+    "valid",
+    "invalid",
+    "already_validated",
+    "failed",
+    "pending",
+    "processing",
+    "amount_mismatch",
+    "meta_not_found",
+]
+PaymentStatusT = Literal["pending", "scheduled", "processing", "completed", "failed"]
+
+PAYMENT_TYPE_VALUES: Final = frozenset(get_args(PaymentTypeT))
+
+class PaymentType:
     """Payment type enumeration"""
-    PC = "pc"
-    REEMBOLSO = "reembolso"
-    BONUS = "bonus"
+    PC: Final = "pc"
+    REEMBOLSO: Final = "reembolso"
+    BONUS: Final = "bonus"
 
-class Status(str, Enum):
+class Status:
     """Processing status enumeration"""
-    PENDING = "pending"
-    PROCESSING = "processing"
-    EXTRACTED = "extracted"
-    FAILED = "failed"
-    VALIDATED = "validated"
+    PENDING: Final = "pending"
+    PROCESSING: Final = "processing"
+    EXTRACTED: Final = "extracted"
+    FAILED: Final = "failed"
+    VALIDATED: Final = "validated"
 
-class ValidationStatus(str, Enum):
+class ValidationStatus:
     """Enhanced validation status tracking"""
-    VALID = "valid"                      # Validation passed all checks
-    INVALID = "invalid"                  # Failed validation rules
-    ALREADY_VALIDATED = "already_validated"  # Document already validated
-    FAILED = "failed"                    # System/process failure
-    PENDING = "pending"                  # Initial validation state
-    PROCESSING = "processing"            # During validation process
-    AMOUNT_MISMATCH = "amount_mismatch"  # Specific validation failure
-    META_NOT_FOUND = "meta_not_found"    # No matching meta record
+    VALID: Final = "valid"                      # Validation passed all checks
+    INVALID: Final = "invalid"                  # Failed validation rules
+    ALREADY_VALIDATED: Final = "already_validated"  # Document already validated
+    FAILED: Final = "failed"                    # System/process failure
+    PENDING: Final = "pending"                  # Initial validation state
+    PROCESSING: Final = "processing"            # During validation process
+    AMOUNT_MISMATCH: Final = "amount_mismatch"  # Specific validation failure
+    META_NOT_FOUND: Final = "meta_not_found"    # No matching meta record
 
-class PaymentStatus(str, Enum):
+class PaymentStatus:
     """Payment status enumeration"""
-    PENDING = "pending"
-    SCHEDULED = "scheduled"
-    PROCESSING = "processing"
-    COMPLETED = "completed"
-    FAILED = "failed" 
\ No newline at end of file
+    PENDING: Final = "pending"
+    SCHEDULED: Final = "scheduled"
+    PROCESSING: Final = "processing"
+    COMPLETED: Final = "completed"
+    FAILED: Final = "failed"
@@ -1,10 +1,19 @@
-"""Repository package initialization"""
+"""Repository package initialization
+
+Repository singletons are imported on first access so that importing one
+repository does not build every other repository and model schema.
+"""
+from importlib import import_module
+
 from .base import BaseRepository
-from .extraction import extraction_repository
-from .meta import meta_repository
-from .validation import validation_repository
-from .payment import payment_repository
-from .logs import log_repository
+
+_REPOSITORY_MODULES = {
+    'extraction_repository': '.extraction',
+    'meta_repository': '.meta',
+    'validation_repository': '.validation',
+    'payment_repository': '.payment',
+    'log_repository': '.logs'
+}
 
 __all__ = [
     'BaseRepository',
@@ -14,3 +23,12 @@ __all__ = [
     'payment_repository',
     'log_repository'
 ]
+
+def __getattr__(name: str):
+    """Import and cache repository singletons on demand"""
+    module_name = _REPOSITORY_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    repository = getattr(import_module(module_name, __name__), name)
+    globals()[name] = repository
+    return repository
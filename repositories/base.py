@@ -1,84 +1,162 @@
 """Base repository implementation"""
-from typing import Optional, Dict, List, TypeVar, Generic, Type
+from typing import Optional, Dict, Iterable, Iterator, List, TypeVar, Generic, Type
 from datetime import datetime
+from functools import wraps
 from uuid import UUID
 
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
+from models.db.base import DBModelBase
 from core.exceptions import DatabaseError
 from core.logging import get_logger
-from utils.db_utils import get_records, get_record_by_id, insert_record, update_record
+from utils.db_utils import (
+    get_records,
+    get_record_by_id,
+    get_records_by_ids,
+    insert_record,
+    insert_records,
+    update_record
+)
 
-T = TypeVar('T', bound=BaseModel)
+T = TypeVar('T', bound=DBModelBase)
+
+# Shared by every repository; records carry the table name in extra
+logger = get_logger("repositories")
+
+def db_error(action: str, target: str, with_record_id: bool = False):
+    """Translate repository failures into DatabaseError
+    
+    The error details are only built on the failure path, so successful
+    calls pay for a single wrapper frame.
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(self, *args, **kwargs):
+            try:
+                return func(self, *args, **kwargs)
+            except Exception as e:
+                logger.error(
+                    f"Failed to {action} {target}",
+                    exc_info=e,
+                    extra={"table": self.table_name}
+                )
+                if with_record_id:
+                    record_id = kwargs['record_id'] if 'record_id' in kwargs else args[0]
+                    details = {"record_id": str(record_id)}
+                else:
+                    details = {"error": str(e)}
+                raise DatabaseError(
+                    message=f"Failed to {action} {self.table_name} {target}",
+                    details=details,
+                    original_error=e
+                )
+        return wrapper
+    return decorator
 
 class BaseRepository(Generic[T]):
     """Base repository with common CRUD operations"""
     
+    # Reused by every dump instead of building a new set per call
+    _dump_exclude = frozenset({'id'})
+    _dump_exclude_created = frozenset({'id', 'created_at'})
+    # Whether create()/create_many() send the model's UUID, making retried
+    # inserts idempotent; tables with non-UUID keys let the database assign them
+    client_generated_ids = True
+    
     def __init__(self, table_name: str, model_class: Type[T]):
         self.table_name = table_name
         self.model_class = model_class
-        self.logger = get_logger(f"repositories.{table_name}")
-        self.logger.info(f"Initialized repository for {table_name}")
+        self._list_adapter = TypeAdapter(List[model_class])
+        logger.info(f"Initialized repository for {table_name}", extra={"table": table_name})
     
+    @db_error("fetch", "record", with_record_id=True)
     def get_by_id(self, record_id: UUID) -> Optional[T]:
         """Get a record by ID"""
-        try:
-            result = get_record_by_id(self.table_name, record_id)
-            return self.model_class(**result) if result else None
-        except Exception as e:
-            self.logger.error(f"Failed to fetch record", exc_info=e)
-            raise DatabaseError(
-                message=f"Failed to fetch {self.table_name} record",
-                details={"record_id": str(record_id)},
-                original_error=e
-            )
+        result = get_record_by_id(self.table_name, record_id)
+        return self.model_class.from_db(result) if result else None
+    
+    @db_error("fetch", "records")
+    def get_by_ids(self, record_ids: Iterable[UUID]) -> List[T]:
+        """Get several records by ID in one query, in request order; missing ids are skipped"""
+        record_ids = list(record_ids)
+        rows = get_records_by_ids(self.table_name, record_ids)
+        from_db = self.model_class.from_db
+        return [
+            from_db(rows[key])
+            for key in dict.fromkeys(str(record_id) for record_id in record_ids)
+            if key in rows
+        ]
     
+    @db_error("fetch", "records")
     def get_all(
         self,
         filters: Optional[Dict] = None,
         limit: Optional[int] = None,
-        order: Optional[Dict[str, Dict[str, str]]] = None
+        order: Optional[Dict[str, Dict[str, str]]] = None,
+        validate: bool = False,
+        after_id: Optional[UUID] = None
     ) -> List[T]:
-        """Get all records matching filters"""
-        try:
-            results = get_records(
-                self.table_name,
+        """Get all records matching filters
+        
+        Rows are hydrated without validation by default. Pass validate=True
+        to run the whole result set through the model schema in one call.
+        """
+        results = get_records(
+            self.table_name,
+            filters=filters,
+            limit=limit,
+            order=order,
+            after_id=after_id
+        )
+        if validate:
+            return self._list_adapter.validate_python(results)
+        from_db = self.model_class.from_db
+        return [from_db(record) for record in results]
+    
+    @db_error("check", "records")
+    def exists(self, filters: Dict) -> bool:
+        """Whether any record matches filters, fetching at most one id"""
+        return bool(get_records(self.table_name, filters=filters, limit=1, select="id"))
+    
+    def iter_all(self, filters: Optional[Dict] = None, batch_size: int = 500) -> Iterator[List[T]]:
+        """Yield records matching filters in id-ordered batches
+        
+        Pages continue after the last id seen instead of using offsets, so
+        rows that stop matching filters while iterating don't shift later
+        pages.
+        """
+        after_id = None
+        while True:
+            batch = self.get_all(
                 filters=filters,
-                limit=limit,
-                order=order
-            )
-            return [self.model_class(**record) for record in results]
-        except Exception as e:
-            self.logger.error("Failed to fetch records", exc_info=e)
-            raise DatabaseError(
-                message=f"Failed to fetch {self.table_name} records",
-                details={"error": str(e)},
-                original_error=e
+                limit=batch_size,
+                order={"field": "id", "direction": "asc"},
+                after_id=after_id
             )
+            if batch:
+                yield batch
+            if len(batch) < batch_size:
+                return
+            after_id = batch[-1].id
     
+    @db_error("create", "record")
     def create(self, model: T) -> T:
         """Create a new record"""
-        try:
-            data = model.model_dump(exclude={'id'})
-            result = insert_record(self.table_name, data)
-            return self.model_class(**result)
-        except Exception as e:
-            self.logger.error("Failed to create record", exc_info=e)
-            raise DatabaseError(
-                message=f"Failed to create {self.table_name} record",
-                details={"error": str(e)},
-                original_error=e
-            )
+        exclude = None if self.client_generated_ids else self._dump_exclude
+        data = model.model_dump(exclude=exclude, mode='python')
+        result = insert_record(self.table_name, data)
+        return self.model_class.from_db(result)
+    
+    @db_error("create", "records")
+    def create_many(self, models: List[T]) -> List[T]:
+        """Create several records in one round-trip, returned in input order"""
+        exclude = None if self.client_generated_ids else self._dump_exclude
+        rows = [model.model_dump(exclude=exclude, mode='python') for model in models]
+        from_db = self.model_class.from_db
+        return [from_db(result) for result in insert_records(self.table_name, rows)]
     
+    @db_error("update", "record", with_record_id=True)
     def update(self, record_id: UUID, model: T) -> T:
         """Update an existing record"""
-        try:
-            data = model.model_dump(exclude={'id'})
-            result = update_record(self.table_name, record_id, data)
-            return self.model_class(**result)
-        except Exception as e:
-            self.logger.error("Failed to update record", exc_info=e)
-            raise DatabaseError(
-                message=f"Failed to update {self.table_name} record",
-                details={"record_id": str(record_id)},
-                original_error=e
-            )
\ No newline at end of file
+        data = model.model_dump(exclude=self._dump_exclude, mode='python')
+        result = update_record(self.table_name, record_id, data)
+        return self.model_class.from_db(result)
@@ -1,15 +1,13 @@
 """Repository for PDF extractions"""
-from typing import Dict, Optional
-from datetime import datetime, timezone
+from typing import Dict, List, Optional
+from uuid import UUID
 
 from models.db.extraction import PDFExtraction
-from models.service.enums import Status
+from models.service.enums import Status, StatusT
 from core.exceptions import DatabaseError
-from core.logging import get_logger
-from .base import BaseRepository
-from .mixins import TransactionMixin
-
-logger = get_logger(__name__)
+from utils.db_utils import update_record, update_records
+from .base import BaseRepository, db_error, logger
+from .mixins import TransactionMixin, Op
 
 class ExtractionRepository(BaseRepository[PDFExtraction], TransactionMixin):
     """Repository for PDF extractions"""
@@ -22,7 +20,7 @@ class ExtractionRepository(BaseRepository[PDFExtraction], TransactionMixin):
         """Create extraction with transaction support"""
         try:
             # Validate input type
-            if not isinstance(extraction, PDFExtraction):
+            if extraction.__class__ is not PDFExtraction:
                 raise DatabaseError(
                     message=f"Expected PDFExtraction model, got {type(extraction)}",
                     details={"model_type": str(type(extraction))}
@@ -30,22 +28,14 @@ class ExtractionRepository(BaseRepository[PDFExtraction], TransactionMixin):
             
             # Convert model to dict and exclude unnecessary fields
             data = extraction.model_dump(
-                exclude={'id', 'created_at'},  # Explicitly exclude fields
-                exclude_unset=True
+                exclude=self._dump_exclude_created,  # Explicitly exclude fields
+                exclude_unset=True,
+                mode='python'
             )
             
             # Define operations
-            operations = [{
-                "table": self.table_name,
-                "action": "insert",
-                "data": data
-            }]
-            
-            rollback_operations = [{
-                "table": self.table_name,
-                "action": "delete",
-                "data": {"id": None}
-            }]
+            operations = [Op(self.table_name, "insert", data)]
+            rollback_operations = [Op(self.table_name, "delete", {"id": None})]
             
             # Execute transaction
             results = self.execute_transaction(operations, rollback_operations)
@@ -59,7 +49,7 @@ class ExtractionRepository(BaseRepository[PDFExtraction], TransactionMixin):
             
             logger.info(
                 "Extraction record created successfully",
-                extra={"record_id": result.get("id")}
+                extra={"table": self.table_name, "record_id": result.get("id")}
             )
             
             return result
@@ -76,5 +66,15 @@ class ExtractionRepository(BaseRepository[PDFExtraction], TransactionMixin):
                 original_error=e
             )
 
+    @db_error("update", "record status", with_record_id=True)
+    def update_status(self, record_id: UUID, status: StatusT) -> PDFExtraction:
+        """Set the status of one extraction, sending only that column"""
+        return self.model_class.from_db(update_record(self.table_name, record_id, {"status": status}))
+
+    @db_error("update", "record statuses")
+    def update_status_many(self, record_ids: List[UUID], status: StatusT) -> int:
+        """Set the status of several extractions in one request, returning the row count"""
+        return len(update_records(self.table_name, record_ids, {"status": status}))
+
 # Create singleton instance
 extraction_repository = ExtractionRepository()
\ No newline at end of file
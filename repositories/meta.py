@@ -1,9 +1,18 @@
 """Meta table repository"""
+from typing import Iterable, List
+
 from models.db.meta import MetaTable
 from .base import BaseRepository
 
 class MetaRepository(BaseRepository[MetaTable]):
     def __init__(self):
         super().__init__("meta_table", MetaTable)
+    
+    def get_all_in(self, cnpjs: Iterable[str]) -> List[MetaTable]:
+        """Get the meta records for several CPF/CNPJs in one query"""
+        cnpjs = list(cnpjs)
+        if not cnpjs:
+            return []
+        return self.get_all(filters={"cpf_cnpj": cnpjs})
 
-meta_repository = MetaRepository() 
\ No newline at end of file
+meta_repository = MetaRepository()
@@ -1,28 +1,23 @@
 """Repository mixins for extended functionality"""
 from typing import Dict, Optional, List
 from datetime import datetime, timezone
-import logging
 
 from core.exceptions import DatabaseError, ErrorCode, ErrorSeverity
-from utils.db_utils import start_transaction
-
-logger = logging.getLogger(__name__)
+from utils.db_utils import Op, start_transaction
+from .base import logger
 
 class TransactionMixin:
     """Mixin for transaction support in repositories"""
     
     def execute_transaction(
         self,
-        operations: List[Dict],
-        rollback_operations: List[Dict]
+        operations: List[Op],
+        rollback_operations: List[Op]
     ) -> List[Dict]:
         """Execute a transaction with rollback support"""
         try:
             transaction = start_transaction()
-            
-            for op, rollback in zip(operations, rollback_operations):
-                transaction.add_operation(op, rollback)
-                
+            transaction.add_operations(operations, rollback_operations)
             return transaction.execute()
             
         except Exception as e:
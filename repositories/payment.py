@@ -3,6 +3,9 @@ from models.db.payment import PaymentRecord
 from .base import BaseRepository
 
 class PaymentRepository(BaseRepository[PaymentRecord]):
+    # payment_records has a bigint primary key
+    client_generated_ids = False
+    
     def __init__(self):
         super().__init__("payment_records", PaymentRecord)
 
@@ -1,17 +1,14 @@
 """Repository for validation operations"""
-from typing import Dict, Optional, List
-from datetime import datetime, timezone
+from typing import Dict, Iterable, Optional, List, Set, Tuple
 from uuid import UUID
 
+from models.db.base import utc_now
 from models.db.validation import ValidationResult, ValidationControl
-from models.service.enums import PaymentType
+from models.service.enums import PaymentTypeT
 from core.exceptions import DatabaseError
-from core.logging import get_logger
-from utils.db_utils import get_records
-from .base import BaseRepository
-from .mixins import TransactionMixin
-
-logger = get_logger(__name__)
+from utils.db_utils import get_records, insert_records
+from .base import BaseRepository, logger
+from .mixins import TransactionMixin, Op
 
 class ValidationRepository(BaseRepository[ValidationResult], TransactionMixin):
     """Repository for validation operations"""
@@ -21,13 +18,22 @@ class ValidationRepository(BaseRepository[ValidationResult], TransactionMixin):
         self.validation_control_table = "validation_control"
         logger.info("ValidationRepository initialized")
     
+    @staticmethod
+    def control_key(meta_table_id: UUID, payment_type: PaymentTypeT, competence: str) -> Tuple[str, str, str]:
+        """Build the key identifying a validation control period"""
+        return (str(meta_table_id), payment_type, competence)
+    
     def get_control(
         self,
         meta_table_id: UUID,
-        payment_type: PaymentType,
+        payment_type: PaymentTypeT,
         competence: str
     ) -> Optional[Dict]:
-        """Get validation control entry"""
+        """Get validation control entry
+        
+        Read uncached, like get_controls_bulk: this guards against validating
+        a period twice, so a control another process just wrote must be seen.
+        """
         try:
             results = get_records(
                 self.validation_control_table,
@@ -35,7 +41,9 @@ class ValidationRepository(BaseRepository[ValidationResult], TransactionMixin):
                     "meta_table_id": meta_table_id,
                     "payment_type": payment_type,
                     "competence": competence
-                }
+                },
+                cache=False,
+                raise_errors=True
             )
             return results[0] if results else None
             
@@ -51,26 +59,74 @@ class ValidationRepository(BaseRepository[ValidationResult], TransactionMixin):
                 original_error=e
             )
     
+    def get_controls_bulk(self, meta_ids: Iterable[UUID]) -> Set[Tuple[str, str, str]]:
+        """Return the control keys recorded for any of the given meta records
+        
+        Keys have the (meta_table_id, payment_type, competence) shape of
+        control_key, so callers can test periods without further queries.
+        Reads bypass the cache and raise DatabaseError on failure: an empty
+        set would let already validated periods be validated again.
+        """
+        meta_ids = [str(meta_id) for meta_id in meta_ids]
+        if not meta_ids:
+            return set()
+        try:
+            rows = get_records(
+                self.validation_control_table,
+                filters={"meta_table_id": meta_ids},
+                select="meta_table_id,payment_type,competence",
+                cache=False,
+                raise_errors=True
+            )
+            return {
+                self.control_key(row["meta_table_id"], row["payment_type"], row["competence"])
+                for row in rows
+            }
+        except Exception as e:
+            logger.error("Failed to get validation controls", exc_info=e)
+            raise DatabaseError(
+                message="Failed to get validation controls",
+                details={"meta_table_ids": meta_ids},
+                original_error=e
+            )
+    
+    def get_by_extraction_ids(self, extraction_ids: Iterable[UUID]) -> List[ValidationResult]:
+        """Return the stored results for any of the given extractions
+        
+        Like get_controls_bulk, reads bypass the cache and raise
+        DatabaseError on failure, since a missed result would be stored twice.
+        """
+        extraction_ids = [str(extraction_id) for extraction_id in extraction_ids]
+        if not extraction_ids:
+            return []
+        try:
+            rows = get_records(
+                self.table_name,
+                filters={"pdf_extraction_id": extraction_ids},
+                cache=False,
+                raise_errors=True
+            )
+            from_db = self.model_class.from_db
+            return [from_db(row) for row in rows]
+        except Exception as e:
+            logger.error("Failed to get stored validation results", exc_info=e)
+            raise DatabaseError(
+                message="Failed to get stored validation results",
+                details={"count": len(extraction_ids)},
+                original_error=e
+            )
+    
     def create_control(self, control: ValidationControl) -> Dict:
         """Create validation control entry"""
         try:
             # Convert model to dict and ensure validated_at
-            data = control.model_dump(exclude={'id'})
+            data = control.model_dump(exclude=self._dump_exclude, mode='python')
             if 'validated_at' not in data:
-                data['validated_at'] = datetime.now(timezone.utc)
+                data['validated_at'] = utc_now()
             
             # Define operations
-            operations = [{
-                "table": self.validation_control_table,
-                "action": "insert",
-                "data": data
-            }]
-            
-            rollback_operations = [{
-                "table": self.validation_control_table,
-                "action": "delete",
-                "data": {"id": None}
-            }]
+            operations = [Op(self.validation_control_table, "insert", data)]
+            rollback_operations = [Op(self.validation_control_table, "delete", {"id": None})]
             
             # Execute transaction
             results = self.execute_transaction(operations, rollback_operations)
@@ -87,7 +143,7 @@ class ValidationRepository(BaseRepository[ValidationResult], TransactionMixin):
             
             logger.info(
                 "Validation control created successfully",
-                extra={"record_id": result.get("id")}
+                extra={"table": self.validation_control_table, "record_id": result.get("id")}
             )
             
             return result
@@ -103,6 +159,38 @@ class ValidationRepository(BaseRepository[ValidationResult], TransactionMixin):
                 original_error=e
             )
 
+    def create_controls(self, controls: List[ValidationControl]) -> List[Dict]:
+        """Create several validation control entries with a single insert"""
+        if not controls:
+            return []
+        try:
+            now = utc_now()
+            # Sending the ids keeps a retried insert from duplicating controls
+            exclude = None if self.client_generated_ids else self._dump_exclude
+            rows = []
+            for control in controls:
+                data = control.model_dump(exclude=exclude, mode='python')
+                if 'validated_at' not in data:
+                    data['validated_at'] = now
+                rows.append(data)
+            
+            results = insert_records(self.validation_control_table, rows)
+            
+            logger.info(
+                f"Created {len(results)} validation controls",
+                extra={"table": self.validation_control_table}
+            )
+            
+            return results
+            
+        except Exception as e:
+            logger.error("Failed to create validation controls", exc_info=e)
+            raise DatabaseError(
+                message="Failed to create validation controls",
+                details={"count": len(controls)},
+                original_error=e
+            )
+
     def get_validation_history(
         self,
         limit: int = 20
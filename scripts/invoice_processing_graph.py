@@ -7,6 +7,7 @@ import os
 from typing import TypedDict, Dict, Optional
 from pathlib import Path
 from datetime import datetime
+from functools import lru_cache
 import json
 import logging
 
@@ -27,6 +28,17 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Both nodes use the same model; reformatting JSON is easier than the analysis
+MODEL_NAME = "gpt-4o-mini"
+
+@lru_cache(maxsize=1)
+def get_llm() -> ChatOpenAI:
+    """Shared chat client so both nodes reuse one HTTP connection pool"""
+    return ChatOpenAI(
+        model=MODEL_NAME,
+        temperature=0
+    )
+
 # Add InvoiceData model
 class InvoiceData(BaseModel):
     """Structure for invoice data"""
@@ -47,6 +59,37 @@ class InvoiceState(TypedDict):
     structured_data: Optional[Dict]
     error: Optional[str]
 
+# Prompts and the output parser are pure values, so build them once at import
+_ANALYZE_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", """You are an expert in analyzing Brazilian invoices (Notas Fiscais).
+    Analyze this invoice and extract the following information:
+    - CNPJ number (14 digits)
+    - Payment amount (valor)
+    - Competence period (MM/YYYY)
+    - Provider name
+    - Service description
+    - Payment type (check if 'bonus' or 'reembolso' appears, otherwise use 'pc')
+    
+    Return the information in a clear, structured format."""),
+    ("human", "{text}")
+])
+
+_PARSER = JsonOutputParser(pydantic_object=InvoiceData)
+_INVOICE_SCHEMA_FORMAT_INSTRUCTIONS = _PARSER.get_format_instructions()
+
+_PARSE_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", """Convert the following invoice analysis into a JSON object with these exact fields:
+    
+    {format_instructions}
+    
+    Important:
+    - CNPJ should be exactly 14 digits
+    - valor should be a number (remove 'R$' and convert)
+    - competence must be MM/YYYY format
+    - payment_type must be one of: pc, reembolso, bonus"""),
+    ("human", "Convert this analysis to JSON:\n{text}")
+]).partial(format_instructions=_INVOICE_SCHEMA_FORMAT_INSTRUCTIONS)
+
 def create_initial_state(file_path: str) -> InvoiceState:
     """Create initial state for processing"""
     return {
@@ -95,25 +138,7 @@ def extract_text_node():
 
 def llm_node():
     """Create LLM processing node"""
-    llm = ChatOpenAI(
-        model="gpt-4o-mini",
-        temperature=0
-    )
-    
-    # Create prompt
-    prompt = ChatPromptTemplate.from_messages([
-        ("system", """You are an expert in analyzing Brazilian invoices (Notas Fiscais).
-        Analyze this invoice and extract the following information:
-        - CNPJ number (14 digits)
-        - Payment amount (valor)
-        - Competence period (MM/YYYY)
-        - Provider name
-        - Service description
-        - Payment type (check if 'bonus' or 'reembolso' appears, otherwise use 'pc')
-        
-        Return the information in a clear, structured format."""),
-        ("human", "{text}")
-    ])
+    llm = get_llm()
     
     def process_with_llm(state: InvoiceState) -> Dict:
         """Process text with LLM"""
@@ -124,7 +149,7 @@ def llm_node():
             logger.info(f"Processing with LLM: {state['file_name']}")
             
             # Get LLM response
-            messages = prompt.format_messages(text=state['raw_text'])
+            messages = _ANALYZE_PROMPT.format_messages(text=state['raw_text'])
             response = llm.invoke(messages)
             
             # Log the raw response
@@ -142,30 +167,7 @@ def llm_node():
 
 def json_parsing_node():
     """Create JSON parsing node"""
-    llm = ChatOpenAI(
-        model="gpt-4",
-        temperature=0
-    )
-    
-    # Create parser
-    parser = JsonOutputParser(pydantic_object=InvoiceData)
-    
-    # Create prompt
-    prompt = ChatPromptTemplate.from_messages([
-        ("system", """Convert the following invoice analysis into a JSON object with these exact fields:
-        
-        {format_instructions}
-        
-        Important:
-        - CNPJ should be exactly 14 digits
-        - valor should be a number (remove 'R$' and convert)
-        - competence must be MM/YYYY format
-        - payment_type must be one of: pc, reembolso, bonus"""),
-        ("human", "Convert this analysis to JSON:\n{text}")
-    ])
-    
-    # Add format instructions
-    prompt = prompt.partial(format_instructions=parser.get_format_instructions())
+    chain = _PARSE_PROMPT | get_llm() | _PARSER
     
     def parse_to_json(state: InvoiceState) -> Dict:
         """Convert LLM response to structured JSON"""
@@ -176,7 +178,6 @@ def json_parsing_node():
             logger.info(f"Parsing response to JSON for {state['file_name']}")
             
             # Get structured data
-            chain = prompt | llm | parser
             structured_data = chain.invoke({"text": state['llm_response']})
             
             logger.info("Successfully parsed to JSON")
@@ -191,8 +192,9 @@ def json_parsing_node():
     
     return parse_to_json
 
+@lru_cache(maxsize=1)
 def create_graph() -> StateGraph:
-    """Create the processing graph"""
+    """Create the processing graph once; later calls reuse the compiled graph"""
     workflow = StateGraph(state_schema=InvoiceState)
     
     # Add nodes
@@ -211,7 +213,7 @@ def create_graph() -> StateGraph:
 def process_invoice(file_path: str) -> Dict:
     """Process a single invoice"""
     try:
-        # Create graph
+        # Get the shared compiled graph
         graph = create_graph()
         
         # Create initial state
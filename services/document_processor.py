@@ -1,30 +1,104 @@
 """Document processing service using LangGraph"""
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 from datetime import datetime, timezone
-from pathlib import Path
-import tempfile
-import shutil
+import io
 import json
 
+import openai
 from langgraph.graph import StateGraph
 from langgraph.constants import START, END
+from langgraph.types import RetryPolicy
 from langchain_openai import ChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate
-from langchain_community.document_loaders import PDFMinerLoader
-from langchain.text_splitter import RecursiveCharacterTextSplitter
-from langchain_core.output_parsers import JsonOutputParser
+from pdfminer.converter import TextConverter
+from pdfminer.layout import LAParams
+from pdfminer.pdfinterp import PDFPageInterpreter, PDFResourceManager
+from pdfminer.pdfpage import PDFPage
 
 from models.db.extraction import PDFExtraction
-from models.service.enums import Status, PaymentType
-from models.processing.llm import InvoiceData
+from models.service.enums import Status
+from models.processing.llm import InvoiceData, parse_invoice_json
 from models.processing.states import GraphState, create_initial_state
+from models.processing.cache import ExtractionCache
+from models.processing.invoice_parser import parse_invoice_text, payment_type_from_filename
 from core.exceptions import PDFError, ExtractionError, ErrorCode, ErrorSeverity, InitializationError, ConfigurationError
 from core.logging import get_logger
 from core.interfaces import ProcessorInterface
-from core.config import settings
+from core.config import settings, EXTRACTION_CACHE_DIR
 
 logger = get_logger(__name__)
 
+# Bump whenever the extraction prompts change so stale cache entries are not reused
+PROMPT_VERSION = "4"
+
+# Provider hiccups that the graph retries on the LLM node instead of failing the document.
+# The client itself is built with max_retries=0, so this policy is the whole
+# budget: at most max_attempts calls per document.
+TRANSIENT_LLM_ERRORS = (openai.RateLimitError, openai.APIConnectionError, openai.APITimeoutError)
+LLM_RETRY_POLICY = RetryPolicy(
+    max_attempts=3,
+    initial_interval=1.0,
+    backoff_factor=2.0,
+    retry_on=TRANSIENT_LLM_ERRORS
+)
+
+# Text extraction backends selectable through settings.PDF_BACKEND
+PDF_BACKENDS = ("pypdf", "pypdfium2", "pymupdf", "pdfminer")
+
+EXTRACTION_INSTRUCTIONS = """You are an expert in analyzing Brazilian invoices (Notas Fiscais).
+Extract the following information from the invoice:
+
+1. cnpj: The provider's CNPJ (exactly 14 digits)
+2. valor: The payment amount as a number (no currency symbols)
+3. competence: The month/year in MM/YYYY format
+4. payee_name: The complete name of the service provider
+5. description: A brief description of services
+6. payment_type: Determine based on these rules:
+    - If filename contains 'bonus' → use 'bonus'
+    - If filename contains 'reembolso' → use 'reembolso'
+    - Otherwise → use 'pc'
+7. confidence: A value between 0.0 and 1.0 indicating extraction confidence"""
+
+# Prompts keep all static text in a byte-identical leading system message and
+# only the per-invoice content in the trailing human message, so the provider
+# can reuse its cached prefix across calls.
+EXTRACTION_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", EXTRACTION_INSTRUCTIONS),
+    ("human", "File Name: {file_name}\nContent: {text}")
+])
+
+class _TextOnlyConverter(TextConverter):
+    """TextConverter that skips graphics; invoices only need their text"""
+
+    def paint_path(self, gstate, stroke, fill, evenodd, path) -> None:
+        pass
+
+    def render_image(self, name, stream) -> None:
+        pass
+
+    def begin_figure(self, name, bbox, matrix) -> None:
+        # Keep figure text on the page instead of building LTFigure containers
+        pass
+
+    def end_figure(self, name) -> None:
+        pass
+
+def _pdfminer_pages(content: bytes) -> List[str]:
+    """Extract the text of each page with pdfminer, ignoring drawing operators"""
+    laparams = LAParams(detect_vertical=False, all_texts=False)
+    rsrcmgr = PDFResourceManager(caching=True)
+    pages = []
+    with io.StringIO() as output:
+        device = _TextOnlyConverter(rsrcmgr, output, laparams=laparams)
+        interpreter = PDFPageInterpreter(rsrcmgr, device)
+        for page in PDFPage.get_pages(io.BytesIO(content), caching=True):
+            interpreter.process_page(page)
+            pages.append(output.getvalue())
+            output.seek(0)
+            output.truncate()
+        device.close()
+    return pages
+
 class DocumentProcessor(ProcessorInterface[PDFExtraction]):
     """Document processor using LangGraph"""
     
@@ -38,15 +112,16 @@ class DocumentProcessor(ProcessorInterface[PDFExtraction]):
         try:
             self.validate_config()
             # Initialize components
-            self.text_splitter = RecursiveCharacterTextSplitter(
-                chunk_size=settings.MODEL_CHUNK_SIZE,
-                chunk_overlap=settings.MODEL_CHUNK_OVERLAP
-            )
             self.llm = ChatOpenAI(
                 model_name=settings.MODEL_NAME,
-                temperature=settings.MODEL_TEMPERATURE
+                temperature=settings.MODEL_TEMPERATURE,
+                # Retries belong to the graph's LLM_RETRY_POLICY; client retries
+                # would multiply with it
+                max_retries=0
             )
-            self.parser = JsonOutputParser(pydantic_object=InvoiceData)
+            # Single call that returns InvoiceData directly instead of prose + reformat
+            self.structured_llm = self.llm.with_structured_output(InvoiceData)
+            self.cache = ExtractionCache(EXTRACTION_CACHE_DIR)
             self.graph = self._create_graph()
             logger.info("DocumentProcessor initialized successfully")
         except Exception as e:
@@ -61,9 +136,7 @@ class DocumentProcessor(ProcessorInterface[PDFExtraction]):
         """Validate required configuration settings"""
         required_settings = [
             'MODEL_NAME',
-            'MODEL_TEMPERATURE',
-            'MODEL_CHUNK_SIZE',
-            'MODEL_CHUNK_OVERLAP'
+            'MODEL_TEMPERATURE'
         ]
         
         missing_settings = [
@@ -77,137 +150,207 @@ class DocumentProcessor(ProcessorInterface[PDFExtraction]):
                 details={"missing_settings": missing_settings}
             )
 
+        if settings.PDF_BACKEND not in PDF_BACKENDS:
+            raise ConfigurationError(
+                message=f"Unsupported PDF backend: {settings.PDF_BACKEND}",
+                details={"supported_backends": list(PDF_BACKENDS)}
+            )
+
     def _create_graph(self) -> StateGraph:
         """Create the processing graph"""
         workflow = StateGraph(GraphState)
         
         # Add nodes
         workflow.add_node("extract_text", self._extract_text)
-        workflow.add_node("analyze_text", self._analyze_text)
-        workflow.add_node("parse_json", self._parse_json)
+        workflow.add_node("parse_json", self._parse_json, retry_policy=LLM_RETRY_POLICY)
         
         # Add edges
         workflow.add_edge(START, "extract_text")
-        workflow.add_edge("extract_text", "analyze_text")
-        workflow.add_edge("analyze_text", "parse_json")
+        workflow.add_edge("extract_text", "parse_json")
         workflow.add_edge("parse_json", END)
         
         return workflow.compile()
 
+    @staticmethod
+    def _read_pages(content: bytes) -> List[str]:
+        """Return the text of each PDF page using the configured backend"""
+        backend = settings.PDF_BACKEND
+        if backend == "pypdf":
+            from pypdf import PdfReader
+            return [page.extract_text() or "" for page in PdfReader(io.BytesIO(content)).pages]
+        if backend == "pypdfium2":
+            import pypdfium2 as pdfium
+            pdf = pdfium.PdfDocument(content)
+            try:
+                return [page.get_textpage().get_text_range() for page in pdf]
+            finally:
+                pdf.close()
+        if backend == "pymupdf":
+            import fitz
+            with fitz.open(stream=content, filetype="pdf") as pdf:
+                return [page.get_text() for page in pdf]
+        return _pdfminer_pages(content)
+
     def _extract_text(self, state: GraphState) -> Dict:
-        """Extract text from PDF using PDFMiner"""
-        temp_dir = None
+        """Extract text from PDF using the configured backend
+        
+        Like every node, returns only the fields it changes; the PDF bytes are
+        dropped from the state once their text has been extracted.
+        """
         try:
-            logger.info(f"Extracting text from {state['file_name']}")
-            
-            # Create temporary directory for PDF processing
-            temp_dir = tempfile.mkdtemp(prefix='pdf_processing_')
-            temp_path = Path(temp_dir) / "temp.pdf"
-            
-            # Write content to temporary file
-            with open(temp_path, 'wb') as f:
-                f.write(state['content'])
+            logger.info(f"Extracting text from {state.file_name}")
             
-            # Extract text using PDFMiner
-            loader = PDFMinerLoader(str(temp_path))
-            documents = loader.load()
-            
-            # Split text into chunks
-            splits = self.text_splitter.split_documents(documents)
-            raw_text = "\n".join(doc.page_content for doc in splits)
+            # Invoices fit well inside the model context, so the page text goes
+            # to the prompt as-is instead of being chunked and re-joined
+            raw_text = "\n".join(self._read_pages(state.content))
             
             if not raw_text.strip():
-                return {**state, "error": "No text content found in PDF"}
+                return {"error": "No text content found in PDF"}
             
             logger.debug(f"Extracted text preview: {raw_text[:500]}...")
-            return {
-                **state,
-                "raw_text": raw_text,
-                "documents": [doc.page_content for doc in splits]
-            }
+            return {"raw_text": raw_text, "content": None}
             
         except Exception as e:
             logger.error("Text extraction failed", exc_info=e)
-            return {**state, "error": f"Text extraction failed: {str(e)}"}
-            
-        finally:
-            # Clean up temporary directory
-            if temp_dir and Path(temp_dir).exists():
-                shutil.rmtree(temp_dir, ignore_errors=True)
+            return {"error": f"Text extraction failed: {str(e)}"}
 
-    def _analyze_text(self, state: GraphState) -> Dict:
-        """Analyze text with first LLM call"""
-        try:
-            if state.get('error'):
-                return state
-                
-            prompt = ChatPromptTemplate.from_messages([
-                ("system", """You are an expert in analyzing Brazilian invoices (Notas Fiscais).
-                Extract and analyze the following information:
-                
-                Required Information:
-                1. CNPJ: Extract the provider's CNPJ (exactly 14 digits)
-                2. Amount (Valor): Extract the payment amount (numeric value)
-                3. Period (Competência): Extract the month/year in MM/YYYY format
-                4. Provider Name: Extract the complete name of the service provider
-                5. Description: Extract a brief description of services
-                6. Payment Type: Determine based on these rules:
-                    - If filename contains 'bonus' → use 'bonus'
-                    - If filename contains 'reembolso' → use 'reembolso'
-                    - Otherwise → use 'pc'
-                
-                Present each piece of information with a clear label."""),
-                ("human", "Please analyze this invoice:\nFile Name: {file_name}\nContent: {text}")
-            ])
-            
-            messages = prompt.format_messages(
-                file_name=state['file_name'],
-                text=state['raw_text']
-            )
-            
-            response = self.llm.invoke(messages)
-            return {**state, "llm_analysis": response.content}
-            
-        except Exception as e:
-            logger.error("LLM analysis failed", exc_info=e)
-            return {**state, "error": str(e)}
+    def _extraction_messages(self, state: GraphState) -> List:
+        """Build the single-invoice extraction prompt"""
+        return EXTRACTION_PROMPT.format_messages(
+            file_name=state.file_name,
+            text=state.raw_text
+        )
+
+    def _with_output(self, state: GraphState, invoice: InvoiceData) -> Dict:
+        """Cache extracted invoice data and return it as a state update"""
+        json_output = invoice.model_dump()
+        if state.cache_key:
+            self.cache.put(state.cache_key, json_output)
+            self.cache.put(self._text_cache_key(state.raw_text, state.file_name), json_output)
+        return {"json_output": json_output}
 
     def _parse_json(self, state: GraphState) -> Dict:
-        """Convert analysis to structured JSON"""
+        """Extract structured invoice data from the raw text in one LLM call"""
         try:
-            if state.get('error'):
-                return state
-                
-            prompt = ChatPromptTemplate.from_messages([
-                ("system", """Convert the following invoice analysis into a JSON object with these exact fields:
-                
-                {format_instructions}
-                
-                Important:
-                - CNPJ should be exactly 14 digits
-                - valor should be a number (no currency symbols)
-                - competence must be MM/YYYY format
-                - payment_type must be one of: pc, reembolso, bonus
-                - Add a confidence field between 0.0 and 1.0 indicating extraction confidence"""),
-                ("human", "Convert this analysis to JSON:\n{text}")
-            ])
-            
-            # Add format instructions
-            prompt = prompt.partial(format_instructions=self.parser.get_format_instructions())
-            
-            # Create and execute chain
-            chain = prompt | self.llm | self.parser
-            json_output = chain.invoke({"text": state['llm_analysis']})
-            
-            # Ensure confidence score exists
-            if 'confidence' not in json_output:
-                json_output['confidence'] = 0.85  # Default confidence score
+            if state.error:
+                return {}
+
+            known = self._known_output(state)
+            if known is not None:
+                return {"json_output": known}
             
-            return {**state, "json_output": json_output}
+            invoice = self.structured_llm.invoke(self._extraction_messages(state))
+            return self._with_output(state, invoice)
             
+        except TRANSIENT_LLM_ERRORS:
+            # Let the node's retry policy handle it
+            raise
         except Exception as e:
-            logger.error("JSON parsing failed", exc_info=e)
-            return {**state, "error": str(e)}
+            logger.error("Structured extraction failed", exc_info=e)
+            return {"error": str(e)}
+
+    def _known_output(self, state: GraphState) -> Optional[Dict]:
+        """Invoice data available without an LLM call: parsed from the text or cached"""
+        invoice = parse_invoice_text(state.raw_text, state.file_name)
+        if invoice is not None:
+            logger.info(f"Parsed {state.file_name} without the LLM")
+            return invoice.model_dump()
+        cached = self._lookup_cache(state)
+        if cached is not None:
+            logger.info(f"Using cached extraction for {state.file_name}")
+        return cached
+
+    @staticmethod
+    def _text_cache_key(raw_text: str, file_name: str) -> str:
+        """Cache key for the extracted text, shared by PDFs that differ only in bytes
+        
+        Like the byte key it includes the filename-derived payment type, so
+        a text hit never hands one file's payment_type to another.
+        """
+        return ExtractionCache.make_key(
+            settings.MODEL_NAME,
+            f"{PROMPT_VERSION}/text",
+            raw_text.encode(),
+            payment_type_from_filename(file_name)
+        )
+
+    def _lookup_cache(self, state: GraphState) -> Optional[Dict]:
+        """Return cached invoice data for the PDF bytes, else for its extracted text"""
+        if not state.cache_key:
+            return None
+        cached = self._get_cached_output(state.cache_key)
+        if cached is None and state.raw_text:
+            cached = self._get_cached_output(self._text_cache_key(state.raw_text, state.file_name))
+            if cached is not None:
+                # Remember the new PDF bytes so the next lookup hits directly
+                self.cache.put(state.cache_key, cached)
+        return cached
+
+    def _get_cached_output(self, cache_key: Optional[str]) -> Optional[Dict]:
+        """Return a cached extraction that still matches the InvoiceData schema"""
+        if not cache_key:
+            return None
+        raw = self.cache.get_bytes(cache_key)
+        if raw is None:
+            return None
+        try:
+            return parse_invoice_json(raw).model_dump()
+        except ValueError:
+            logger.info(f"Evicting stale cache entry {cache_key}")
+            self.cache.evict(cache_key)
+            return None
+
+    @staticmethod
+    def _build_extraction(filename: str, raw_text: str, json_data: Dict) -> PDFExtraction:
+        """Create the PDFExtraction record for extracted invoice data"""
+        return PDFExtraction(
+            file_name=filename,
+            raw_text=raw_text,
+            cnpj=json_data['cnpj'],
+            valor=float(json_data['valor']),
+            competence=json_data['competence'],
+            payee_name=json_data['payee_name'],
+            description=json_data['description'],
+            payment_type=json_data['payment_type'],
+            status=Status.EXTRACTED,
+            extracted_at=datetime.now(timezone.utc),
+            confidence_score=json_data.get('confidence', 0.0)
+        )
+
+    @staticmethod
+    def _initial_state(content: bytes, filename: str) -> GraphState:
+        """Create the graph input, keyed for the extraction cache
+        
+        The prompt derives payment_type from the filename, so the same PDF
+        uploaded under a bonus or reembolso name must not share an entry.
+        """
+        cache_key = ExtractionCache.make_key(
+            settings.MODEL_NAME,
+            PROMPT_VERSION,
+            content,
+            payment_type_from_filename(filename)
+        )
+        return create_initial_state(filename, content, cache_key=cache_key)
+
+    def _finish(self, filename: str, final_state: Dict) -> PDFExtraction:
+        """Turn the final graph state into a PDFExtraction"""
+        # Check for errors
+        if final_state.get('error'):
+            raise ExtractionError(
+                message=final_state['error'],
+                details={"filename": filename},
+                original_error=None
+            )
+        
+        # Create PDFExtraction from final state
+        extraction = self._build_extraction(
+            filename,
+            final_state['raw_text'],
+            final_state['json_output']
+        )
+        
+        logger.info(f"Processing completed for {filename}")
+        return extraction
 
     def process_document(
         self,
@@ -217,39 +360,11 @@ class DocumentProcessor(ProcessorInterface[PDFExtraction]):
     ) -> PDFExtraction:
         """Process document and extract information"""
         try:
-            # Create initial state with both filename and content
-            state = create_initial_state(filename, content)
+            state = self._initial_state(content, filename)
             
             # Process through graph
             logger.info(f"Starting processing for {filename}")
-            final_state = self.graph.invoke(state)
-            
-            # Check for errors
-            if final_state.get('error'):
-                raise ExtractionError(
-                    message=final_state['error'],
-                    details={"filename": filename},
-                    original_error=None
-                )
-            
-            # Create PDFExtraction from final state
-            json_data = final_state['json_output']
-            extraction = PDFExtraction(
-                file_name=filename,
-                raw_text=final_state['raw_text'],
-                cnpj=json_data['cnpj'],
-                valor=float(json_data['valor']),
-                competence=json_data['competence'],
-                payee_name=json_data['payee_name'],
-                description=json_data['description'],
-                payment_type=PaymentType(json_data['payment_type']),
-                status=Status.EXTRACTED,
-                extracted_at=datetime.now(timezone.utc),
-                confidence_score=json_data.get('confidence', 0.0)
-            )
-            
-            logger.info(f"Processing completed for {filename}")
-            return extraction
+            return self._finish(filename, self.graph.invoke(state))
             
         except Exception as e:
             logger.error(f"Processing failed for {filename}", exc_info=e)
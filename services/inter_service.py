@@ -1,13 +1,25 @@
 import os
-import requests
+import ssl
+import asyncio
 import logging
+import time
+import weakref
 from datetime import datetime
+from functools import cached_property
 from typing import Dict, Optional
 
+import httpx
+
 from config.settings import settings
 
 logger = logging.getLogger(__name__)
 
+# Seconds before expiry at which a cached token is refreshed
+TOKEN_EXPIRY_MARGIN = 30.0
+
+# Seconds allowed for each Inter API request
+REQUEST_TIMEOUT = 30.0
+
 class InterAPIError(Exception):
     """Custom exception for Inter API errors"""
     pass
@@ -18,59 +30,159 @@ class InterBankService:
     def __init__(self):
         self.base_url = "https://cdpj.partners.bancointer.com.br"
         self.token = None
+        self._token_scope: Optional[str] = None
+        self._token_expiry = 0.0
         self.cert = (settings.INTER_CERT_FILE, settings.INTER_KEY_FILE)
         self.account_number = settings.INTER_ACCOUNT_NUMBER
         
-    def _get_token(self, scope: str) -> str:
-        """Get OAuth token for API access"""
-        try:
-            url = f"{self.base_url}/oauth/v2/token"
-            
-            data = {
+        # Async connections belong to the event loop that opened them, so each
+        # loop (e.g. each asyncio.run) gets its own client
+        self._aclients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+            weakref.WeakKeyDictionary()
+        )
+    
+    @cached_property
+    def _ssl_context(self) -> ssl.SSLContext:
+        """mTLS context, loaded on first use so only API calls need the certificate files"""
+        context = ssl.create_default_context()
+        context.load_cert_chain(*self.cert)
+        return context
+    
+    @cached_property
+    def client(self) -> httpx.Client:
+        """Sync HTTP client, created on first use
+        
+        HTTP/2 clients multiplex concurrent calls over one mTLS connection,
+        so the client-certificate handshake is paid once per client.
+        """
+        return httpx.Client(http2=True, verify=self._ssl_context, timeout=REQUEST_TIMEOUT)
+    
+    def _aclient(self) -> httpx.AsyncClient:
+        """Get the async client for the running event loop"""
+        loop = asyncio.get_running_loop()
+        client = self._aclients.get(loop)
+        if client is None:
+            client = httpx.AsyncClient(http2=True, verify=self._ssl_context, timeout=REQUEST_TIMEOUT)
+            self._aclients[loop] = client
+        return client
+    
+    def _cached_token(self, scope: str) -> Optional[str]:
+        """Return the cached token for scope if it is not about to expire"""
+        if (
+            self.token
+            and scope == self._token_scope
+            and time.monotonic() < self._token_expiry - TOKEN_EXPIRY_MARGIN
+        ):
+            return self.token
+        return None
+    
+    def _token_request(self, scope: str) -> Dict:
+        """Build the OAuth token request"""
+        # Log request details (without sensitive info)
+        logger.info(f"Requesting token for scope: {scope}")
+        logger.info(f"Using certificates: {self.cert}")
+        return {
+            "url": f"{self.base_url}/oauth/v2/token",
+            "data": {
                 "client_id": settings.INTER_CLIENT_ID,
                 "client_secret": settings.INTER_CLIENT_SECRET,
                 "scope": scope,
                 "grant_type": "client_credentials"
-            }
-            
-            headers = {
+            },
+            "headers": {
                 "Content-Type": "application/x-www-form-urlencoded"
             }
-            
-            # Log request details (without sensitive info)
-            logger.info(f"Requesting token for scope: {scope}")
-            logger.info(f"Using certificates: {self.cert}")
-            
-            response = requests.post(
-                url,
-                headers=headers,
-                data=data,
-                cert=self.cert,
-                verify=True  # Ensure SSL verification
-            )
-            
-            # Log response details
-            logger.info(f"Token request status code: {response.status_code}")
-            if response.status_code != 200:
-                logger.error(f"Token request failed: {response.text}")
-                raise InterAPIError(f"Failed to get token: {response.text}")
-            
-            token_data = response.json()
-            if 'access_token' not in token_data:
-                raise InterAPIError("No access token in response")
-                
-            self.token = token_data['access_token']
-            return self.token
-            
-        except requests.exceptions.SSLError as e:
-            logger.error(f"SSL Error: {str(e)}")
-            raise InterAPIError(f"SSL Certificate error: {str(e)}")
-        except requests.exceptions.RequestException as e:
+        }
+    
+    def _store_token(self, response: httpx.Response, scope: str) -> str:
+        """Validate the token response and cache the token with its expiry"""
+        # Log response details
+        logger.info(f"Token request status code: {response.status_code}")
+        if response.status_code != 200:
+            logger.error(f"Token request failed: {response.text}")
+            raise InterAPIError(f"Failed to get token: {response.text}")
+        
+        token_data = response.json()
+        if 'access_token' not in token_data:
+            raise InterAPIError("No access token in response")
+            
+        self.token = token_data['access_token']
+        self._token_scope = scope
+        self._token_expiry = time.monotonic() + float(token_data.get('expires_in', 0))
+        return self.token
+    
+    @staticmethod
+    def _token_error(e: Exception) -> InterAPIError:
+        """Translate a token request failure into InterAPIError"""
+        if isinstance(e, InterAPIError):
+            return e
+        if isinstance(e, httpx.ConnectError):
+            logger.error(f"Connection/SSL Error: {str(e)}")
+            return InterAPIError(f"SSL Certificate error: {str(e)}")
+        if isinstance(e, httpx.HTTPError):
             logger.error(f"Request Error: {str(e)}")
-            raise InterAPIError(f"Request failed: {str(e)}")
+            return InterAPIError(f"Request failed: {str(e)}")
+        logger.error(f"Error getting token: {str(e)}")
+        return InterAPIError(f"Failed to get token: {str(e)}")
+    
+    def _get_token(self, scope: str) -> str:
+        """Get OAuth token for API access, reusing the cached token while valid"""
+        token = self._cached_token(scope)
+        if token:
+            return token
+        try:
+            response = self.client.post(**self._token_request(scope))
+            return self._store_token(response, scope)
         except Exception as e:
-            logger.error(f"Error getting token: {str(e)}")
-            raise InterAPIError(f"Failed to get token: {str(e)}")
+            raise self._token_error(e)
+    
+    async def _aget_token(self, scope: str) -> str:
+        """Async variant of _get_token"""
+        token = self._cached_token(scope)
+        if token:
+            return token
+        try:
+            response = await self._aclient().post(**self._token_request(scope))
+            return self._store_token(response, scope)
+        except Exception as e:
+            raise self._token_error(e)
+    
+    def _statement_request(
+        self,
+        token: str,
+        start_date: datetime,
+        end_date: datetime,
+        account_number: Optional[str]
+    ) -> Dict:
+        """Build the account statement request"""
+        headers = {
+            "Authorization": f"Bearer {token}",
+            "Content-Type": "application/json"
+        }
+        
+        # Add account number if provided in parameters or settings
+        if account_number or self.account_number:
+            headers["x-conta-corrente"] = account_number or self.account_number
+        
+        # Log request details
+        logger.info(f"Requesting statement from {start_date} to {end_date}")
+        
+        return {
+            "url": f"{self.base_url}/banking/v2/extrato",
+            "headers": headers,
+            "params": {
+                "dataInicio": start_date.strftime("%Y-%m-%d"),
+                "dataFim": end_date.strftime("%Y-%m-%d")
+            }
+        }
+    
+    @staticmethod
+    def _statement_result(response: httpx.Response) -> Dict:
+        """Return the statement JSON or raise for a failed request"""
+        if response.status_code != 200:
+            logger.error(f"Statement request failed: {response.text}")
+            raise InterAPIError(f"Failed to get statement: {response.text}")
+        return response.json()
     
     def get_account_statement(
         self,
@@ -92,45 +204,32 @@ class InterBankService:
         try:
             # Get token with correct scope
             token = self._get_token("extrato.read")
-            
-            # Prepare request
-            url = f"{self.base_url}/banking/v2/extrato"
-            
-            headers = {
-                "Authorization": f"Bearer {token}",
-                "Content-Type": "application/json"
-            }
-            
-            # Add account number if provided in parameters or settings
-            if account_number or self.account_number:
-                headers["x-conta-corrente"] = account_number or self.account_number
-            
-            # Format dates
-            params = {
-                "dataInicio": start_date.strftime("%Y-%m-%d"),
-                "dataFim": end_date.strftime("%Y-%m-%d")
-            }
-            
-            # Log request details
-            logger.info(f"Requesting statement from {start_date} to {end_date}")
-            
-            # Make request
-            response = requests.get(
-                url,
-                headers=headers,
-                params=params,
-                cert=self.cert
+            response = self.client.get(
+                **self._statement_request(token, start_date, end_date, account_number)
             )
+            return self._statement_result(response)
             
-            if response.status_code != 200:
-                logger.error(f"Statement request failed: {response.text}")
-                raise InterAPIError(f"Failed to get statement: {response.text}")
-            
-            return response.json()
+        except Exception as e:
+            logger.error(f"Error getting account statement: {str(e)}")
+            raise InterAPIError(f"Failed to get account statement: {str(e)}")
+    
+    async def aget_account_statement(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        account_number: Optional[str] = None
+    ) -> Dict:
+        """Async variant of get_account_statement; concurrent calls share one connection"""
+        try:
+            token = await self._aget_token("extrato.read")
+            response = await self._aclient().get(
+                **self._statement_request(token, start_date, end_date, account_number)
+            )
+            return self._statement_result(response)
             
         except Exception as e:
             logger.error(f"Error getting account statement: {str(e)}")
             raise InterAPIError(f"Failed to get account statement: {str(e)}")
 
 # Create singleton instance
-inter_service = InterBankService() 
\ No newline at end of file
+inter_service = InterBankService()
@@ -1,236 +1,437 @@
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Set, Tuple
+from uuid import UUID
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 import re
 
+from core.config import settings
 from core.logging import get_logger
 from core.exceptions import ValidationError
 from models.db.extraction import PDFExtraction
-from models.db.validation import ValidationResult, ValidationControl, ValidationStatus
-from models.service.enums import Status, PaymentType
+from models.db.meta import MetaTable
+from models.db.validation import ValidationResult, ValidationControl
+from models.service.enums import Status, PaymentType, ValidationStatus
 from repositories.validation import validation_repository
 from repositories.extraction import extraction_repository
 from repositories.meta import meta_repository
+from utils.validators import is_valid_cnpj
 
 logger = get_logger(__name__)
 
-class ValidationService:
-    """Service for validating extracted data"""
+_COMPETENCE_RE = re.compile(r'(0[1-9]|1[0-2])/20\d{2}')
+
+# Deletes every Latin-1 character except ASCII digits
+_NON_DIGIT_TABLE = str.maketrans('', '', ''.join(
+    chr(c) for c in range(256) if not '0' <= chr(c) <= '9'
+))
+
+def _norm_cnpj(cnpj: str) -> str:
+    """Strip CPF/CNPJ formatting so lookups don't depend on punctuation"""
+    return cnpj.translate(_NON_DIGIT_TABLE)
+
+# Meta table amount column and error label for each payment type
+_AMOUNT_FIELD_BY_TYPE = {
+    PaymentType.PC: ("ago_pc", "PC"),
+    PaymentType.BONUS: ("ago_bn", "Bonus"),
+    PaymentType.REEMBOLSO: ("ago_re", "Reembolso")
+}
+
+def _to_cents(amount) -> int:
+    """Amount in integer cents; rows hydrated with from_db may hold float, str or Decimal"""
+    return round(float(amount) * 100)
+
+def _get_meta_by_cnpj(cnpj: str) -> Optional[MetaTable]:
+    """Meta record for a CPF/CNPJ, served from the db_utils read cache when fresh
     
-    def __init__(self):
-        logger.info("Initializing ValidationService")
+    Not cached here: that cache expires after DB_CACHE_TTL, so a meta row
+    added after a failed lookup is found without a restart.
+    """
+    rows = meta_repository.get_all(filters={"cpf_cnpj": cnpj})
+    return rows[0] if rows else None
+
+def check_validation_control(extraction: PDFExtraction) -> bool:
+    """Check validation control rules
     
-    def check_validation_control(self, extraction: PDFExtraction) -> bool:
-        """Check validation control rules"""
-        try:
-            # Check if already validated
-            existing_validations = validation_repository.get_all(
-                filters={"pdf_extraction_id": extraction.id}
-            )
-            if existing_validations:
-                logger.warning(f"Document {extraction.file_name} already validated")
-                return False
-            
-            # Check meta table
-            meta_records = meta_repository.get_all(
-                filters={"cpf_cnpj": extraction.cnpj}
-            )
-            if not meta_records:
-                logger.warning(f"No meta record found for CNPJ {extraction.cnpj}")
-                return False
-            
-            # Check validation control
-            meta_record = meta_records[0]
-            existing_control = validation_repository.get_control(
-                meta_table_id=meta_record.id,
-                payment_type=extraction.payment_type,
-                competence=extraction.competence
+    The meta and control lookups are usually answered from cache, so
+    they run first; the remaining query only fetches a single id.
+    """
+    try:
+        # Check meta table
+        meta_record = _get_meta_by_cnpj(_norm_cnpj(extraction.cnpj))
+        if meta_record is None:
+            logger.warning(f"No meta record found for CNPJ {extraction.cnpj}")
+            return False
+        
+        # Check validation control
+        existing_control = validation_repository.get_control(
+            meta_table_id=meta_record.id,
+            payment_type=extraction.payment_type,
+            competence=extraction.competence
+        )
+        
+        if existing_control:
+            logger.warning(
+                f"Validation control already exists for {extraction.competence}"
             )
-            
-            if existing_control:
-                logger.warning(
-                    f"Validation control already exists for {extraction.competence}"
-                )
-                return False
-            
-            return True
-            
-        except Exception as e:
-            logger.error("Validation control check failed", exc_info=e)
             return False
+        
+        # Check if already validated
+        if validation_repository.exists({"pdf_extraction_id": extraction.id}):
+            logger.warning(f"Document {extraction.file_name} already validated")
+            return False
+        
+        return True
+        
+    except Exception as e:
+        logger.error("Validation control check failed", exc_info=e)
+        return False
+
+def _evaluate(
+    extraction: PDFExtraction,
+    validation_timestamp: datetime,
+    meta_index: Optional[Dict[str, MetaTable]] = None,
+    control_index: Optional[Set[Tuple[str, str, str]]] = None
+) -> Tuple[ValidationResult, bool]:
+    """Build the validation result for an extraction without writing it
     
-    def validate_extraction(
-        self,
-        extraction: PDFExtraction,
-        metadata: Optional[Dict] = None
-    ) -> ValidationResult:
-        """Validate a single extraction"""
-        validation_timestamp = datetime.now(timezone.utc)
-        try:
-            logger.info(f"Validating extraction: {extraction.file_name}")
-            
-            # Get meta table record
-            meta_records = meta_repository.get_all(
-                filters={"cpf_cnpj": extraction.cnpj}
-            )
+    Returns the result and whether it should be persisted; results for
+    unknown CNPJs and already validated periods are never stored.
+    meta_index (by CPF/CNPJ) and control_index (control keys) replace the
+    per-extraction meta and control queries when given.
+    """
+    # Field checks that need no database access come first
+    field_errors = _check_fields(extraction)
+    if field_errors:
+        return ValidationResult(
+            pdf_extraction_id=extraction.id,
+            is_valid=False,
+            status=ValidationStatus.INVALID,
+            validation_errors=field_errors,
+            details={"file_name": extraction.file_name},
+            validated_at=validation_timestamp
+        ), True
+    
+    # Get meta table record
+    if meta_index is not None:
+        meta_record = meta_index.get(_norm_cnpj(extraction.cnpj))
+    else:
+        meta_record = _get_meta_by_cnpj(_norm_cnpj(extraction.cnpj))
+    
+    if meta_record is None:
+        return ValidationResult(
+            pdf_extraction_id=extraction.id,
+            is_valid=False,
+            status=ValidationStatus.INVALID,
+            validation_errors=[{
+                "field": "cnpj",
+                "error": "CNPJ not found in meta table"
+            }],
+            validated_at=validation_timestamp
+        ), False
+    
+    # Only allocated when a check fails; None means the extraction is valid
+    validation_errors: Optional[List[Dict]] = None
+    
+    # Compare values based on payment type
+    field_name, label = _AMOUNT_FIELD_BY_TYPE.get(extraction.payment_type, ("", ""))
+    expected = getattr(meta_record, field_name, None)
+    if expected and _to_cents(expected) != _to_cents(extraction.valor):
+        validation_errors = [{
+            "field": "valor",
+            "error": f"Amount mismatch for {label}: expected {expected}"
+        }]
+    
+    # Check if already validated for this period
+    if control_index is not None:
+        existing_control = validation_repository.control_key(
+            meta_record.id, extraction.payment_type, extraction.competence
+        ) in control_index
+    else:
+        existing_control = validation_repository.get_control(
+            meta_table_id=meta_record.id,
+            payment_type=extraction.payment_type,
+            competence=extraction.competence
+        )
+    
+    if existing_control:
+        return _already_validated(extraction, meta_record.id, validation_timestamp), False
+    
+    return ValidationResult(
+        pdf_extraction_id=extraction.id,
+        meta_table_id=meta_record.id,
+        is_valid=validation_errors is None,
+        status=ValidationStatus.VALID if validation_errors is None else ValidationStatus.INVALID,
+        validation_errors=validation_errors or [],
+        details={
+            "file_name": extraction.file_name,
+            "meta_nome": meta_record.nome
+        },
+        validated_at=validation_timestamp
+    ), True
+
+def _check_fields(extraction: PDFExtraction) -> List[Dict]:
+    """Validate CNPJ check digits, amount and competence locally"""
+    errors = []
+    if not is_valid_cnpj(extraction.cnpj):
+        errors.append({"field": "cnpj", "error": "Invalid CNPJ check digits"})
+    # Compared in cents: from_db rows may hold valor as a str
+    try:
+        valor_cents = _to_cents(extraction.valor)
+    except (TypeError, ValueError):
+        valor_cents = None
+    if valor_cents is None or valor_cents <= 0:
+        errors.append({"field": "valor", "error": "Amount must be greater than zero"})
+    if not _COMPETENCE_RE.fullmatch(extraction.competence or ""):
+        errors.append({"field": "competence", "error": "Competence must be MM/YYYY"})
+    return errors
+
+def _already_validated(
+    extraction: PDFExtraction,
+    meta_table_id: UUID,
+    validation_timestamp: datetime
+) -> ValidationResult:
+    """Result for an extraction whose period already has a validation control"""
+    return ValidationResult(
+        pdf_extraction_id=extraction.id,
+        meta_table_id=meta_table_id,
+        is_valid=False,
+        status=ValidationStatus.ALREADY_VALIDATED,
+        validation_errors=[{
+            "field": "control",
+            "error": "Document already validated for this period"
+        }],
+        validated_at=validation_timestamp
+    )
+
+def _control_for(extraction: PDFExtraction, result: ValidationResult) -> ValidationControl:
+    """Validation control entry recorded for a valid result"""
+    return ValidationControl(
+        meta_table_id=result.meta_table_id,
+        payment_type=extraction.payment_type,
+        competence=extraction.competence,
+        validated_at=result.validated_at
+    )
+
+def validate_extraction(
+    extraction: PDFExtraction,
+    metadata: Optional[Dict] = None,
+    meta_index: Optional[Dict[str, MetaTable]] = None,
+    control_index: Optional[Set[Tuple[str, str, str]]] = None
+) -> ValidationResult:
+    """Validate a single extraction
+    
+    Pass meta_index/control_index (see validate_all_pending) to look the
+    meta record and validation control up in memory instead of querying.
+    """
+    validation_timestamp = datetime.now(timezone.utc)
+    try:
+        logger.info(f"Validating extraction: {extraction.file_name}")
+        
+        result, persist = _evaluate(
+            extraction, validation_timestamp, meta_index, control_index
+        )
+        if not persist:
+            return result
+        
+        # Save validation result
+        saved_result = validation_repository.create(result)
+        
+        # If valid, create validation control entry
+        if result.is_valid:
+            validation_repository.create_control(_control_for(extraction, result))
             
-            if not meta_records:
-                return ValidationResult(
-                    pdf_extraction_id=extraction.id,
-                    is_valid=False,
-                    status=ValidationStatus.INVALID,
-                    validation_errors=[{
-                        "field": "cnpj",
-                        "error": "CNPJ not found in meta table"
-                    }],
-                    validated_at=validation_timestamp
+            # Update extraction status
+            extraction.status = Status.VALIDATED
+        else:
+            extraction.status = Status.FAILED
+        # Only the status changed; re-dumping a from_db row would send
+        # every column back with its unvalidated JSON types
+        extraction_repository.update_status(extraction.id, extraction.status)
+        
+        return saved_result
+        
+    except Exception as e:
+        logger.error(f"Validation failed for {extraction.file_name}", exc_info=e)
+        raise ValidationError(
+            message=f"Validation failed: {str(e)}",
+            details={"file_name": extraction.file_name},
+            original_error=e
+        )
+
+def validate_all_pending() -> List[ValidationResult]:
+    """Validate all pending extractions
+    
+    Pending extractions are fetched in batches of VALIDATION_BATCH_SIZE
+    so the backlog never has to fit in memory at once; see
+    _validate_batch for the per-batch work. A failed batch is logged and
+    skipped so the others still run; ValidationError is raised at the
+    end if any failed, and a rerun resumes them.
+    """
+    try:
+        validation_timestamp = datetime.now(timezone.utc)
+        results: List[ValidationResult] = []
+        failed_batches = 0
+        for pending in extraction_repository.iter_all(
+            filters={"status": Status.EXTRACTED},
+            batch_size=settings.VALIDATION_BATCH_SIZE
+        ):
+            try:
+                results.extend(_validate_batch(pending, validation_timestamp))
+            except Exception as e:
+                failed_batches += 1
+                logger.error(
+                    f"Failed to validate a batch of {len(pending)} extractions",
+                    exc_info=e
                 )
-            
-            meta_record = meta_records[0]
-            validation_errors = []
-            
-            # Compare values based on payment type
-            if extraction.payment_type == PaymentType.PC and meta_record.ago_pc:
-                if meta_record.ago_pc != extraction.valor:
-                    validation_errors.append({
-                        "field": "valor",
-                        "error": f"Amount mismatch for PC: expected {meta_record.ago_pc}"
-                    })
-            elif extraction.payment_type == PaymentType.BONUS and meta_record.ago_bn:
-                if meta_record.ago_bn != extraction.valor:
-                    validation_errors.append({
-                        "field": "valor",
-                        "error": f"Amount mismatch for Bonus: expected {meta_record.ago_bn}"
-                    })
-            elif extraction.payment_type == PaymentType.REEMBOLSO and meta_record.ago_re:
-                if meta_record.ago_re != extraction.valor:
-                    validation_errors.append({
-                        "field": "valor",
-                        "error": f"Amount mismatch for Reembolso: expected {meta_record.ago_re}"
-                    })
-            
-            # Check if already validated for this period
-            existing_control = validation_repository.get_control(
-                meta_table_id=meta_record.id,
-                payment_type=extraction.payment_type,
-                competence=extraction.competence
-            )
-            
-            if existing_control:
-                return ValidationResult(
-                    pdf_extraction_id=extraction.id,
-                    meta_table_id=meta_record.id,
-                    is_valid=False,
-                    status=ValidationStatus.ALREADY_VALIDATED,
-                    validation_errors=[{
-                        "field": "control",
-                        "error": "Document already validated for this period"
-                    }],
-                    validated_at=validation_timestamp
+    
+    except Exception as e:
+        logger.error("Failed to validate pending extractions", exc_info=e)
+        raise ValidationError(
+            message="Failed to validate pending extractions",
+            details={"error": str(e)},
+            original_error=e
+        )
+    
+    if failed_batches:
+        raise ValidationError(
+            message=f"Failed to validate {failed_batches} batch(es) of pending extractions",
+            details={"failed_batches": failed_batches, "validated": len(results)}
+        )
+    return results
+
+def _validate_batch(
+    pending: List[PDFExtraction],
+    validation_timestamp: datetime
+) -> List[ValidationResult]:
+    """Validate and store one batch of pending extractions
+    
+    Meta records and validation controls are prefetched with one query
+    each, results are evaluated in memory, and then written with one bulk
+    insert per table and one status update per outcome instead of per
+    extraction.
+    
+    The stored results are the commit point: an extraction that already
+    has one (an earlier run failed after storing it) is not evaluated
+    again, only given the control and status writes it is missing, so
+    reruns never store a second result or control.
+    """
+    # Prefetch every meta record and control the batch can touch; a
+    # failed control read raises and aborts the run before any write
+    meta_index: Dict[str, MetaTable] = {}
+    for meta in meta_repository.get_all_in({_norm_cnpj(e.cnpj) for e in pending}):
+        meta_index.setdefault(_norm_cnpj(meta.cpf_cnpj), meta)
+    control_index = validation_repository.get_controls_bulk(
+        meta.id for meta in meta_index.values()
+    )
+    stored = {
+        str(result.pdf_extraction_id): result
+        for result in validation_repository.get_by_extraction_ids(e.id for e in pending)
+    }
+    
+    results: List[ValidationResult] = []
+    to_save: List[int] = []
+    controls: List[ValidationControl] = []
+    validated_ids: List[UUID] = []
+    failed_ids: List[UUID] = []
+    
+    for extraction in pending:
+        result = stored.get(str(extraction.id))
+        if result is not None:
+            persist, finish = False, True
+        else:
+            try:
+                result, persist = _evaluate(
+                    extraction, validation_timestamp, meta_index, control_index
                 )
-            
-            # Create validation result
-            result = ValidationResult(
-                pdf_extraction_id=extraction.id,
-                meta_table_id=meta_record.id,
-                is_valid=len(validation_errors) == 0,
-                status=ValidationStatus.VALID if len(validation_errors) == 0 else ValidationStatus.INVALID,
-                validation_errors=validation_errors,
-                details={
-                    "file_name": extraction.file_name,
-                    "meta_table": meta_record.model_dump()
-                },
-                validated_at=validation_timestamp
-            )
-            
-            # Save validation result
-            saved_result = validation_repository.create(result)
-            
-            # If valid, create validation control entry
+            except Exception as e:
+                logger.error(f"Failed to validate {extraction.file_name}", exc_info=e)
+                continue
+            finish = persist
+        
+        if persist:
+            to_save.append(len(results))
+        if finish:
             if result.is_valid:
-                control = ValidationControl(
-                    meta_table_id=meta_record.id,
-                    payment_type=extraction.payment_type,
-                    competence=extraction.competence,
-                    validated_at=validation_timestamp
+                key = validation_repository.control_key(
+                    result.meta_table_id, extraction.payment_type, extraction.competence
                 )
-                validation_repository.create_control(control)
-                
-                # Update extraction status
-                extraction.status = Status.VALIDATED
-                extraction_repository.update(extraction.id, extraction)
+                # Later extractions for the same period see it as already validated
+                if key not in control_index:
+                    control_index.add(key)
+                    controls.append(_control_for(extraction, result))
+                validated_ids.append(extraction.id)
             else:
-                extraction.status = Status.FAILED
-                extraction_repository.update(extraction.id, extraction)
-            
-            return saved_result
-            
-        except Exception as e:
-            logger.error(f"Validation failed for {extraction.file_name}", exc_info=e)
-            raise ValidationError(
-                message=f"Validation failed: {str(e)}",
-                details={"file_name": extraction.file_name},
-                original_error=e
-            )
+                failed_ids.append(extraction.id)
+        results.append(result)
     
-    def validate_all_pending(self) -> List[ValidationResult]:
-        """Validate all pending extractions"""
-        try:
-            # Get pending extractions
-            pending = extraction_repository.get_all(
-                filters={"status": Status.EXTRACTED}
-            )
-            
-            results = []
-            for extraction in pending:
-                try:
-                    result = self.validate_extraction(extraction)
-                    results.append(result)
-                except Exception as e:
-                    logger.error(f"Failed to validate {extraction.file_name}", exc_info=e)
-            
-            return results
-            
-        except Exception as e:
-            logger.error("Failed to validate pending extractions", exc_info=e)
-            raise ValidationError(
-                message="Failed to validate pending extractions",
-                details={"error": str(e)},
-                original_error=e
-            )
+    saved = validation_repository.create_many([results[i] for i in to_save])
+    for i, saved_result in zip(to_save, saved):
+        results[i] = saved_result
     
-    def get_combined_validation_status(self) -> List[Dict]:
-        """Get combined status of extractions and validations"""
-        try:
-            # Get all extractions with their validation results
-            extractions = extraction_repository.get_all()
-            validation_results = validation_repository.get_all()
-            
-            # Create a lookup dictionary for validation results
-            validation_lookup = {
-                result.pdf_extraction_id: result
-                for result in validation_results
-            }
-            
-            combined_results = []
-            for extraction in extractions:
-                validation = validation_lookup.get(extraction.id)
-                combined_results.append({
-                    "payee_name": extraction.payee_name,
-                    "filename": extraction.file_name,
-                    "cnpj": extraction.cnpj,
-                    "payment_type": extraction.payment_type,
-                    "competence": extraction.competence,
-                    "value": extraction.valor,
-                    "status": validation.status if validation else extraction.status,
-                    "validation_date": validation.validated_at if validation else None,
-                    "validation_errors": validation.validation_errors if validation else None,
-                    "is_valid": validation.is_valid if validation else None
-                })
-            
-            return combined_results
-        except Exception as e:
-            logger.error("Failed to get combined status", exc_info=e)
-            raise
+    # Controls go in before any extraction leaves EXTRACTED: a VALIDATED
+    # extraction is never revisited, so its control must already exist
+    validation_repository.create_controls(controls)
+    
+    # The two status updates are independent and only wait on the
+    # network, so they run concurrently
+    writes = [
+        (extraction_repository.update_status_many, validated_ids, Status.VALIDATED),
+        (extraction_repository.update_status_many, failed_ids, Status.FAILED)
+    ]
+    max_workers = max(1, min(len(writes), settings.VALIDATION_MAX_WORKERS))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(*write) for write in writes]
+        for future in futures:
+            future.result()
+    
+    return results
+
+def get_combined_validation_status() -> List[Dict]:
+    """Get combined status of extractions and validations"""
+    try:
+        # Get all extractions with their validation results
+        extractions = extraction_repository.get_all()
+        validation_results = validation_repository.get_all()
+        
+        # Create a lookup dictionary for validation results
+        validation_lookup = {
+            result.pdf_extraction_id: result
+            for result in validation_results
+        }
+        
+        combined_results = []
+        for extraction in extractions:
+            validation = validation_lookup.get(extraction.id)
+            combined_results.append({
+                "payee_name": extraction.payee_name,
+                "filename": extraction.file_name,
+                "cnpj": extraction.cnpj,
+                "payment_type": extraction.payment_type,
+                "competence": extraction.competence,
+                "value": extraction.valor,
+                "status": validation.status if validation else extraction.status,
+                "validation_date": validation.validated_at if validation else None,
+                "validation_errors": validation.validation_errors if validation else None,
+                "is_valid": validation.is_valid if validation else None
+            })
+        
+        return combined_results
+    except Exception as e:
+        logger.error("Failed to get combined status", exc_info=e)
+        raise
+
+class ValidationService:
+    """Thin facade over this module's functions, kept for existing callers
+    
+    It holds no state, so the singleton can be shared freely between threads.
+    """
+    
+    __slots__ = ()
+    
+    check_validation_control = staticmethod(check_validation_control)
+    validate_extraction = staticmethod(validate_extraction)
+    validate_all_pending = staticmethod(validate_all_pending)
+    get_combined_validation_status = staticmethod(get_combined_validation_status)
 
 # Create singleton instance
 validation_service = ValidationService()
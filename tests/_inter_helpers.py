@@ -0,0 +1,62 @@
+"""Shared Inter API access for the integration tests"""
+import sys
+from pathlib import Path
+from typing import Dict, Tuple
+import logging
+import time
+
+import orjson
+import requests
+
+# Add project root to Python path
+project_root = str(Path(__file__).parent.parent)
+sys.path.insert(0, project_root)
+
+from config import INTER_CLIENT_ID, INTER_CLIENT_SECRET, INTER_CERT_FILE, INTER_KEY_FILE
+
+logger = logging.getLogger(__name__)
+
+TOKEN_URL = "https://cdpj.partners.bancointer.com.br/oauth/v2/token"
+# Tokens are dropped this long before the server-side expiry, and never kept longer than TOKEN_TTL
+TOKEN_EXPIRY_MARGIN = 30.0
+TOKEN_TTL = 300.0
+
+# One keep-alive session so the mTLS handshake is done once per test run
+session = requests.Session()
+session.cert = (INTER_CERT_FILE, INTER_KEY_FILE)
+session.verify = True
+
+_tokens: Dict[str, Tuple[str, float]] = {}
+
+def get_token(scope: str) -> str:
+    """Get an OAuth token for scope, reusing it until shortly before it expires"""
+    cached = _tokens.get(scope)
+    if cached and time.monotonic() < cached[1]:
+        return cached[0]
+
+    try:
+        data = {
+            "client_id": INTER_CLIENT_ID,
+            "client_secret": INTER_CLIENT_SECRET,
+            "scope": scope,
+            "grant_type": "client_credentials"
+        }
+
+        headers = {
+            "Content-Type": "application/x-www-form-urlencoded"
+        }
+
+        response = session.post(TOKEN_URL, headers=headers, data=data)
+
+        if response.status_code != 200:
+            raise Exception(f"Failed to get token: {response.text}")
+
+        payload = orjson.loads(response.content)
+        token = payload.get("access_token")
+        lifetime = min(float(payload.get("expires_in", TOKEN_TTL)) - TOKEN_EXPIRY_MARGIN, TOKEN_TTL)
+        _tokens[scope] = (token, time.monotonic() + lifetime)
+        return token
+
+    except Exception as e:
+        logger.error(f"Error getting token: {str(e)}")
+        raise
@@ -0,0 +1,17 @@
+"""Shared pytest configuration"""
+import os
+from pathlib import Path
+
+# Placeholder settings so modules import without a .env; unit tests never
+# reach these services. A .env file or real environment values win.
+if not (Path(__file__).parent.parent / ".env").exists():
+    for name, value in {
+        "SUPABASE_URL": "https://example.supabase.co",
+        "SUPABASE_KEY": "eyJhbGciOiJIUzI1NiJ9.eyJyb2xlIjoiYW5vbiJ9.test",
+        "OPENAI_API_KEY": "sk-test",
+        "INTER_CLIENT_ID": "test",
+        "INTER_CLIENT_SECRET": "test",
+        "INTER_CERT_FILE": "api/InterAPICertificado.crt",
+        "INTER_KEY_FILE": "api/InterAPIChave.key"
+    }.items():
+        os.environ.setdefault(name, value)
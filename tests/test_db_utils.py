@@ -0,0 +1,164 @@
+"""Tests for the database circuit breaker, error classification and read cache"""
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add project root to Python path
+project_root = str(Path(__file__).parent.parent)
+sys.path.insert(0, project_root)
+
+import httpx
+import pytest
+from postgrest.exceptions import APIError
+
+from core.exceptions import CircuitOpenError, DatabaseError
+from utils import db_utils
+from utils.db_utils import CircuitBreaker, is_transient_error
+
+def _api_error(code):
+    return APIError({"code": code, "message": f"error {code}"})
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(db_utils, "time", SimpleNamespace(monotonic=clock.monotonic))
+    return clock
+
+def _fail(error):
+    def fn():
+        raise error
+    return fn
+
+@pytest.mark.parametrize("code", ["429", "503", "40001", "40P01", "57014", "08006"])
+def test_transient_api_errors(code):
+    assert is_transient_error(_api_error(code))
+
+@pytest.mark.parametrize("code", ["23505", "42501", "PGRST116", "400"])
+def test_permanent_api_errors(code):
+    assert not is_transient_error(_api_error(code))
+
+def test_transient_error_looks_through_database_errors():
+    wrapped = DatabaseError(message="wrapped", original_error=_api_error("503"))
+    assert is_transient_error(DatabaseError(message="outer", original_error=wrapped))
+    assert not is_transient_error(DatabaseError(message="outer", original_error=_api_error("23505")))
+    assert not is_transient_error(DatabaseError(message="no cause"))
+
+def test_transport_errors_are_transient():
+    assert is_transient_error(httpx.ConnectError("refused"))
+    assert is_transient_error(TimeoutError())
+    assert not is_transient_error(ValueError())
+
+def test_circuit_opens_after_threshold(clock):
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=30)
+    for _ in range(2):
+        with pytest.raises(APIError):
+            breaker.call(_fail(_api_error("503")))
+
+    calls = []
+    with pytest.raises(CircuitOpenError):
+        breaker.call(calls.append, 1)
+    assert calls == []
+
+def test_half_open_probe_closes_circuit(clock):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30)
+    with pytest.raises(APIError):
+        breaker.call(_fail(_api_error("503")))
+
+    clock.now += 29
+    with pytest.raises(CircuitOpenError):
+        breaker.call(lambda: "ok")
+
+    clock.now += 1
+    assert breaker.call(lambda: "ok") == "ok"
+    assert breaker.failure_count == 0
+    assert breaker.call(lambda: "again") == "again"
+
+def test_failed_probe_reopens_circuit(clock):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30)
+    with pytest.raises(APIError):
+        breaker.call(_fail(_api_error("503")))
+
+    clock.now += 30
+    with pytest.raises(APIError):
+        breaker.call(_fail(_api_error("503")))
+    with pytest.raises(CircuitOpenError):
+        breaker.call(lambda: "ok")
+    assert breaker.open_until == clock.now + 30
+
+def test_only_one_probe_while_half_open(clock):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30)
+    with pytest.raises(APIError):
+        breaker.call(_fail(_api_error("503")))
+    clock.now += 30
+
+    def probe():
+        # A concurrent call during the probe is still rejected
+        with pytest.raises(CircuitOpenError):
+            breaker.call(lambda: "ok")
+        return "probed"
+
+    assert breaker.call(probe) == "probed"
+
+def test_permanent_errors_count_as_success(clock):
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=30)
+    with pytest.raises(APIError):
+        breaker.call(_fail(_api_error("503")))
+    with pytest.raises(APIError):
+        breaker.call(_fail(_api_error("23505")))
+    assert breaker.failure_count == 0
+
+@pytest.fixture
+def cache(monkeypatch):
+    monkeypatch.setattr(db_utils.settings, "DB_CACHE_TTL", 60.0)
+    db_utils.cache_clear()
+    yield
+    db_utils.cache_clear()
+
+def test_cache_store_and_lookup(cache):
+    result, generation = db_utils._cache_lookup("t", "key")
+    assert result is db_utils._MISS
+    db_utils._cache_store("t", "key", [{"id": 1}], generation)
+    assert db_utils._cache_lookup("t", "key") == ([{"id": 1}], generation)
+
+def test_invalidate_cache_drops_entries(cache):
+    _, generation = db_utils._cache_lookup("t", "key")
+    db_utils._cache_store("t", "key", [{"id": 1}], generation)
+    db_utils._cache_store("other", "key", [{"id": 2}], db_utils._cache_lookup("other", "key")[1])
+
+    db_utils.invalidate_cache("t")
+    result, new_generation = db_utils._cache_lookup("t", "key")
+    assert result is db_utils._MISS
+    assert new_generation == generation + 1
+    assert db_utils._cache_lookup("other", "key")[0] == [{"id": 2}]
+
+def test_read_racing_a_write_is_not_cached(cache):
+    """A result read before a write must not be stored after it"""
+    _, generation = db_utils._cache_lookup("t", "key")
+    db_utils.invalidate_cache("t")
+    db_utils._cache_store("t", "key", [{"id": "stale"}], generation)
+    assert db_utils._cache_lookup("t", "key")[0] is db_utils._MISS
+
+def test_insert_invalidates_cache(cache, monkeypatch):
+    class FakeQuery:
+        def __init__(self, data):
+            self.data = data
+
+        def execute(self):
+            return SimpleNamespace(data=[self.data])
+
+    fake_client = SimpleNamespace(
+        table=lambda name: SimpleNamespace(insert=lambda data: FakeQuery(data))
+    )
+    monkeypatch.setattr(db_utils, "get_supabase_client", lambda: fake_client)
+
+    _, generation = db_utils._cache_lookup("t", "key")
+    db_utils._cache_store("t", "key", [], generation)
+    assert db_utils.insert_record("t", {"id": "1"}) == {"id": "1"}
+    assert db_utils._cache_lookup("t", "key")[0] is db_utils._MISS
@@ -2,56 +2,24 @@ import sys
 from pathlib import Path
 import logging
 from datetime import datetime, timedelta
-import requests
+
+import orjson
 
 # Add project root to Python path
 project_root = str(Path(__file__).parent.parent)
 sys.path.insert(0, project_root)
 
-from config import INTER_CLIENT_ID, INTER_CLIENT_SECRET, INTER_CERT_FILE, INTER_KEY_FILE
+from tests._inter_helpers import get_token, session
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-def get_token() -> str:
-    """Get OAuth token for API access"""
-    try:
-        url = "https://cdpj.partners.bancointer.com.br/oauth/v2/token"
-        
-        data = {
-            "client_id": INTER_CLIENT_ID,
-            "client_secret": INTER_CLIENT_SECRET,
-            "scope": "extrato.read",
-            "grant_type": "client_credentials"
-        }
-        
-        headers = {
-            "Content-Type": "application/x-www-form-urlencoded"
-        }
-        
-        response = requests.post(
-            url,
-            headers=headers,
-            data=data,
-            cert=(INTER_CERT_FILE, INTER_KEY_FILE),
-            verify=True
-        )
-        
-        if response.status_code != 200:
-            raise Exception(f"Failed to get token: {response.text}")
-        
-        return response.json().get("access_token")
-        
-    except Exception as e:
-        logger.error(f"Error getting token: {str(e)}")
-        raise
-
 def test_get_statement():
     """Test getting account statement"""
     try:
         # First get token
-        token = get_token()
+        token = get_token("extrato.read")
         logger.info("Successfully obtained access token")
         
         # Set date range for first 15 days of October 2024
@@ -73,18 +41,17 @@ def test_get_statement():
         
         # Make request
         logger.info(f"Requesting statement from {start_date.date()} to {end_date.date()}")
-        response = requests.get(
+        response = session.get(
             url,
             headers=headers,
-            params=params,
-            cert=(INTER_CERT_FILE, INTER_KEY_FILE)
+            params=params
         )
         
         # Log response details
         logger.info(f"Response status code: {response.status_code}")
         
         if response.status_code == 200:
-            statement = response.json()
+            statement = orjson.loads(response.content)
             transactions = statement.get("transacoes", [])
             logger.info(f"Successfully retrieved {len(transactions)} transactions")
             
@@ -92,21 +59,31 @@ def test_get_statement():
             if transactions:
                 logger.info("\nTransaction Summary:")
                 logger.info("-" * 50)
+                # Log each transaction and accumulate totals in a single pass
+                log_transactions = logger.isEnabledFor(logging.INFO)
+                credits = debits = 0.0
                 for tx in transactions:
-                    logger.info(f"""
-                    Date: {tx.get('dataEntrada')}
-                    Type: {tx.get('tipoTransacao')}
-                    Operation: {tx.get('tipoOperacao')}
-                    Value: R$ {float(tx.get('valor', '0'))}
-                    Title: {tx.get('titulo')}
-                    Description: {tx.get('descricao')}
-                    """)
+                    valor = float(tx.get('valor', 0))
+                    operation = tx.get('tipoOperacao')
+                    if operation == 'C':
+                        credits += valor
+                    elif operation == 'D':
+                        debits += valor
+                    if log_transactions:
+                        logger.info(
+                            """
+                    Date: %s
+                    Type: %s
+                    Operation: %s
+                    Value: R$ %s
+                    Title: %s
+                    Description: %s
+                    """,
+                            tx.get('dataEntrada'), tx.get('tipoTransacao'), operation,
+                            valor, tx.get('titulo'), tx.get('descricao')
+                        )
                 logger.info("-" * 50)
                 
-                # Calculate totals
-                credits = sum(float(tx.get('valor', 0)) for tx in transactions if tx.get('tipoOperacao') == 'C')
-                debits = sum(float(tx.get('valor', 0)) for tx in transactions if tx.get('tipoOperacao') == 'D')
-                
                 logger.info(f"\nSummary:")
                 logger.info(f"Total Credits: R$ {credits:.2f}")
                 logger.info(f"Total Debits: R$ {debits:.2f}")
@@ -123,7 +100,7 @@ def test_get_statement():
 def test_date_range_validation():
     """Test statement date range validation"""
     try:
-        token = get_token()
+        token = get_token("extrato.read")
         url = "https://cdpj.partners.bancointer.com.br/banking/v2/extrato"
         
         # Test cases
@@ -146,7 +123,7 @@ def test_date_range_validation():
         ]
         
         for case in test_cases:
-            logger.info(f"\nTesting {case['name']}...")
+            logger.info("\nTesting %s...", case['name'])
             
             headers = {
                 "Authorization": f"Bearer {token}",
@@ -158,15 +135,14 @@ def test_date_range_validation():
                 "dataFim": case['end'].strftime("%Y-%m-%d")
             }
             
-            response = requests.get(
+            response = session.get(
                 url,
                 headers=headers,
-                params=params,
-                cert=(INTER_CERT_FILE, INTER_KEY_FILE)
+                params=params
             )
             
-            logger.info(f"Response status code: {response.status_code}")
-            logger.info(f"Response: {response.text}")
+            logger.info("Response status code: %s", response.status_code)
+            logger.info("Response: %s", response.text)
             
     except Exception as e:
         logger.error(f"Date range validation test failed: {str(e)}")
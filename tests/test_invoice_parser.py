@@ -0,0 +1,128 @@
+"""Tests for deterministic NFS-e field extraction"""
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+project_root = str(Path(__file__).parent.parent)
+sys.path.insert(0, project_root)
+
+import pytest
+from pdfminer.high_level import extract_text
+from pdfminer.layout import LAParams
+
+from models.processing.invoice_parser import (
+    extract_invoice_fields,
+    parse_invoice_text,
+    payment_type_from_filename,
+    PARSED_CONFIDENCE
+)
+
+EXAMPLE_DIR = Path(project_root) / "example"
+CUSTOMER_CNPJ = "26846328000117"
+
+# Excerpt of a national-layout NFS-e (example ps-pj-05) as pdfminer extracts it
+SAMPLE_DANFSE_TEXT = """DANFSe v1.0
+Documento Auxiliar da NFS-e
+
+Competência da NFS-e
+27/08/2024
+
+EMITENTE DA NFS-e
+Prestador do Serviço
+
+CNPJ / CPF / NIF
+44.740.100/0001-20
+
+Nome / Nome Empresarial
+LUCA NEVES BANDEIRA 11134770405
+
+Simples Nacional na Data de Competência
+Optante - Microempreendedor Individual (MEI)
+
+TOMADOR DO SERVIÇO
+
+CNPJ / CPF / NIF
+26.846.328/0001-17
+
+Nome / Nome Empresarial
+EXPONENCIAL TI SOLUCOES DIGITAIS LTDA
+
+SERVIÇO PRESTADO
+
+Descrição do Serviço
+Atividade referente a serviços prestados no mês de Agosto/2024 descrevendo serviços de assistência técnica digital e manutenção.
+
+Valor do Serviço
+R$ 4.410,00
+
+Valor Líquido da NFS-e
+R$ 4.410,00
+"""
+
+def _example_text(path: Path) -> str:
+    """Extract text with the same layout settings as DocumentProcessor"""
+    return extract_text(path, laparams=LAParams(detect_vertical=False, all_texts=False))
+
+def _example_pdfs():
+    return sorted(EXAMPLE_DIR.glob("*.pdf"))
+
+def test_parse_danfse_sample():
+    """Each field is read from the line after its label"""
+    invoice = parse_invoice_text(SAMPLE_DANFSE_TEXT, "Agosto. 2024. Faturamento. Luca Neves Bandeira.pdf")
+    assert invoice is not None
+    assert invoice.cnpj == "44740100000120"
+    assert invoice.payee_name == "LUCA NEVES BANDEIRA 11134770405"
+    assert invoice.valor == 4410.0
+    assert invoice.competence == "08/2024"
+    assert invoice.description.startswith("Atividade referente a serviços prestados")
+    assert invoice.payment_type == "pc"
+    assert invoice.confidence == PARSED_CONFIDENCE
+
+def test_wrapped_description_is_joined():
+    """Values wrapped over several lines run up to the next blank line"""
+    text = SAMPLE_DANFSE_TEXT.replace(
+        "no mês de Agosto/2024 descrevendo",
+        "no mês de Agosto/2024\ndescrevendo"
+    )
+    fields = extract_invoice_fields(text, "nota.pdf")
+    assert fields["description"] == (
+        "Atividade referente a serviços prestados no mês de Agosto/2024 descrevendo "
+        "serviços de assistência técnica digital e manutenção."
+    )
+
+def test_missing_field_falls_back_to_llm():
+    """Any missing or malformed value leaves the invoice to the LLM"""
+    assert parse_invoice_text(SAMPLE_DANFSE_TEXT.replace("R$ 4.410,00\n", "-\n"), "nota.pdf") is None
+    assert parse_invoice_text(SAMPLE_DANFSE_TEXT.replace("TOMADOR DO SERVIÇO", "TOMADOR"), "nota.pdf") is None
+    assert parse_invoice_text("PRESTADOR DE SERVIÇOS\nNome/Razão Social: Teste\n", "nota.pdf") is None
+
+@pytest.mark.parametrize("file_name, expected", [
+    ("08.2024.BÔNUS.ALEXANDRE.pdf", "bonus"),
+    ("Agosto_2024_Reembolso_Arthur.pdf", "reembolso"),
+    ("Agosto. 2024. Faturamento. Erick Paiva.pdf", "pc")
+])
+def test_payment_type_from_filename(file_name, expected):
+    assert payment_type_from_filename(file_name) == expected
+
+@pytest.mark.parametrize("path", _example_pdfs(), ids=lambda path: path.name[:24])
+def test_example_invoices(path):
+    """National-layout examples parse with provider data; other layouts are left to the LLM"""
+    text = _example_text(path)
+    invoice = parse_invoice_text(text, path.name)
+    if "DANFSe" not in text:
+        assert invoice is None
+        return
+    assert invoice is not None
+    assert invoice.cnpj != CUSTOMER_CNPJ
+    assert invoice.payee_name.lower() not in ("empresarial", "nome empresarial")
+    assert invoice.valor > 0
+    assert invoice.competence == "08/2024"
+    assert invoice.payment_type == payment_type_from_filename(path.name)
+
+def test_example_invoice_values():
+    """Spot-check full values against one example"""
+    path = next(EXAMPLE_DIR.glob("*ps-pj-05-set24*.pdf"))
+    invoice = parse_invoice_text(_example_text(path), path.name)
+    assert (invoice.cnpj, invoice.valor, invoice.payee_name) == (
+        "44740100000120", 4410.0, "LUCA NEVES BANDEIRA 11134770405"
+    )
@@ -34,9 +34,9 @@ Valor do Serviço: R$ 5000,00
 Competência: 08/2024
 """
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def llm_extractor():
-    """Create LLMExtractor instance"""
+    """Create one LLMExtractor shared by the tests in this module"""
     return LLMExtractor()
 
 def test_parse_json_response():
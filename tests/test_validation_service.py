@@ -0,0 +1,154 @@
+"""Tests for batch validation of pending extractions"""
+import sys
+from pathlib import Path
+from decimal import Decimal
+from importlib import import_module
+from uuid import uuid4
+
+# Add project root to Python path
+project_root = str(Path(__file__).parent.parent)
+sys.path.insert(0, project_root)
+
+import pytest
+
+from core.exceptions import DatabaseError, ValidationError
+from models.db.extraction import PDFExtraction
+from models.db.meta import MetaTable
+from models.service.enums import Status, ValidationStatus
+
+# The services package re-exports the singleton under the module's name
+service_module = import_module("services.validation_service")
+
+VALID_CNPJ = "11222333000181"
+
+class FakeStore:
+    """In-memory stand-in for the tables validate_all_pending touches"""
+
+    def __init__(self, extractions, meta):
+        self.extractions = {extraction.id: extraction for extraction in extractions}
+        self.meta = meta
+        self.results = []
+        self.controls = []
+        # Write name -> calls left to fail
+        self.failing = {}
+
+    def _check(self, name):
+        if self.failing.get(name, 0) > 0:
+            self.failing[name] -= 1
+            raise DatabaseError(message=f"{name} failed")
+
+    def iter_all(self, filters, batch_size):
+        pending = [e for e in self.extractions.values() if e.status == filters["status"]]
+        for start in range(0, len(pending), batch_size):
+            yield pending[start:start + batch_size]
+
+    def update_status_many(self, record_ids, status):
+        self._check("update_status_many")
+        for record_id in record_ids:
+            self.extractions[record_id].status = status
+        return len(record_ids)
+
+    def get_all_in(self, cnpjs):
+        return [self.meta] if self.meta.cpf_cnpj in cnpjs else []
+
+    def get_controls_bulk(self, meta_ids):
+        meta_ids = {str(meta_id) for meta_id in meta_ids}
+        return {
+            (str(c.meta_table_id), c.payment_type, c.competence)
+            for c in self.controls if str(c.meta_table_id) in meta_ids
+        }
+
+    def get_by_extraction_ids(self, extraction_ids):
+        extraction_ids = set(extraction_ids)
+        return [r for r in self.results if r.pdf_extraction_id in extraction_ids]
+
+    def create_many(self, results):
+        self._check("create_many")
+        self.results.extend(results)
+        return results
+
+    def create_controls(self, controls):
+        self._check("create_controls")
+        self.controls.extend(controls)
+        return controls
+
+def _extraction(cnpj, valor, competence):
+    return PDFExtraction(
+        id=uuid4(),
+        file_name=f"{cnpj}-{competence[:2]}.pdf",
+        raw_text="x",
+        cnpj=cnpj,
+        valor=Decimal(valor),
+        competence=competence,
+        payee_name="Provider",
+        payment_type="pc",
+        status=Status.EXTRACTED,
+        confidence_score=Decimal("1")
+    )
+
+@pytest.fixture
+def store(monkeypatch):
+    meta = MetaTable(id=uuid4(), nome="Provider", cpf_cnpj=VALID_CNPJ, tipo="PJ", pix="k", ago_pc=Decimal("100"))
+    store = FakeStore([
+        _extraction(VALID_CNPJ, "100", "08/2024"),
+        _extraction(VALID_CNPJ, "100", "09/2024"),
+        # Bad check digits: stored as invalid
+        _extraction("11222333000182", "100", "08/2024")
+    ], meta)
+    extractions = service_module.extraction_repository
+    validations = service_module.validation_repository
+    monkeypatch.setattr(extractions, "iter_all", store.iter_all)
+    monkeypatch.setattr(extractions, "update_status_many", store.update_status_many)
+    monkeypatch.setattr(service_module.meta_repository, "get_all_in", store.get_all_in)
+    for name in ("get_controls_bulk", "get_by_extraction_ids", "create_many", "create_controls"):
+        monkeypatch.setattr(validations, name, getattr(store, name))
+    return store
+
+def test_validate_all_pending(store):
+    results = service_module.validate_all_pending()
+    assert sorted(r.status for r in results) == [
+        ValidationStatus.INVALID, ValidationStatus.VALID, ValidationStatus.VALID
+    ]
+    assert len(store.results) == 3
+    assert sorted(c.competence for c in store.controls) == ["08/2024", "09/2024"]
+    assert sorted(e.status for e in store.extractions.values()) == [
+        Status.FAILED, Status.VALIDATED, Status.VALIDATED
+    ]
+
+@pytest.mark.parametrize("write", ["create_many", "create_controls", "update_status_many"])
+def test_rerun_after_failed_write_stores_no_duplicates(store, write):
+    """A rerun only finishes the writes a failed run left out"""
+    store.failing[write] = 1
+    with pytest.raises(ValidationError):
+        service_module.validate_all_pending()
+
+    service_module.validate_all_pending()
+    assert len(store.results) == 3
+    assert len({r.pdf_extraction_id for r in store.results}) == 3
+    assert sorted(c.competence for c in store.controls) == ["08/2024", "09/2024"]
+    assert sorted(e.status for e in store.extractions.values()) == [
+        Status.FAILED, Status.VALIDATED, Status.VALIDATED
+    ]
+    assert service_module.validate_all_pending() == []
+
+def test_failed_batch_does_not_stop_the_run(store, monkeypatch):
+    monkeypatch.setattr(service_module.settings, "VALIDATION_BATCH_SIZE", 1)
+    store.failing["create_controls"] = 1
+    with pytest.raises(ValidationError) as error:
+        service_module.validate_all_pending()
+    assert error.value.details["failed_batches"] == 1
+    assert error.value.details["validated"] == 2
+    assert [e.status for e in store.extractions.values()].count(Status.EXTRACTED) == 1
+
+    assert len(service_module.validate_all_pending()) == 1
+    assert len(store.results) == 3
+    assert len(store.controls) == 2
+
+@pytest.mark.parametrize("valor, valid", [("100.00", True), (100.0, True), ("0", False), ("abc", False), (None, False)])
+def test_check_fields_normalises_valor(valor, valid):
+    """Rows hydrated with from_db may carry valor as a str"""
+    extraction = PDFExtraction.from_db({
+        "id": uuid4(), "cnpj": VALID_CNPJ, "valor": valor, "competence": "08/2024"
+    })
+    errors = service_module._check_fields(extraction)
+    assert (not any(error["field"] == "valor" for error in errors)) is valid
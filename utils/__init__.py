@@ -1,18 +1,35 @@
 """Utility functions package"""
 from .db_utils import (
     get_records,
+    aget_records,
+    get_extractions_with_validations,
     get_record_by_id,
+    get_records_by_ids,
+    aget_record_by_id,
     insert_record,
+    ainsert_record,
+    insert_records,
     update_record,
+    update_records,
     handle_response,
     serialize_data,
+    invalidate_cache,
+    cache_clear,
     init_supabase,
+    get_supabase_client,
+    get_async_supabase_client,
     supabase,
+    Op,
     start_transaction,
-    log_processing
+    log_processing,
+    flush_processing_logs,
+    CircuitBreaker,
+    db_circuit
 )
 from .validators import (
     validate_cnpj,
+    validate_cnpj_batch,
+    is_valid_cnpj,
     validate_date_format,
     validate_amount,
     validate_pix_key
@@ -27,18 +44,35 @@ from .helpers import (
 __all__ = [
     # Database utilities
     'get_records',
+    'aget_records',
+    'get_extractions_with_validations',
     'get_record_by_id',
+    'get_records_by_ids',
+    'aget_record_by_id',
     'insert_record',
+    'ainsert_record',
+    'insert_records',
     'update_record',
+    'update_records',
     'handle_response',
     'serialize_data',
+    'invalidate_cache',
+    'cache_clear',
     'init_supabase',
+    'get_supabase_client',
+    'get_async_supabase_client',
     'supabase',
+    'Op',
     'start_transaction',
     'log_processing',
+    'flush_processing_logs',
+    'CircuitBreaker',
+    'db_circuit',
     
     # Validators
     'validate_cnpj',
+    'validate_cnpj_batch',
+    'is_valid_cnpj',
     'validate_date_format',
     'validate_amount',
     'validate_pix_key',
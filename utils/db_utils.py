@@ -1,87 +1,347 @@
 # utils/db_utils.py
 """Database utilities"""
-from typing import Dict, List, Optional, Union, Any
+from typing import Callable, Dict, Iterable, List, Optional, Union, Any, NamedTuple, Tuple
+from collections import OrderedDict
 from datetime import datetime, timezone
 from enum import Enum
+import asyncio
+import atexit
 import json
-from decimal import Decimal
+import logging
+import threading
 import time
-from functools import wraps
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+from functools import lru_cache, singledispatch
 from uuid import UUID
 
+import httpx
+from postgrest import APIResponse
 from postgrest.exceptions import APIError
-from supabase import create_client, Client
+from tenacity import (
+    before_sleep_log,
+    retry,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_exponential_jitter
+)
+from supabase import acreate_client, create_client, AsyncClient, Client, ClientOptions
 
 from core.config import settings
-from core.exceptions import DatabaseError, ErrorCode, ErrorSeverity
+from core.exceptions import CircuitOpenError, DatabaseError, ErrorCode, ErrorSeverity
 from core.logging import get_logger
 
 logger = get_logger(__name__)
 
-def retry_on_error(retries: int = 3, delay: float = 1.0):
-    """Retry decorator for database operations"""
-    def decorator(func):
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            last_error = None
-            for attempt in range(retries):
-                try:
-                    return func(*args, **kwargs)
-                except Exception as e:
-                    last_error = e
-                    if attempt < retries - 1:
-                        logger.warning(
-                            f"Attempt {attempt + 1} failed, retrying in {delay} seconds",
-                            exc_info=e
-                        )
-                        time.sleep(delay)
-            logger.error(f"All {retries} attempts failed", exc_info=last_error)
-            raise last_error
-        return wrapper
-    return decorator
+# HTTP statuses and Postgres SQLSTATEs (plus class 08, connection
+# exceptions) worth retrying; anything else is raised on the first attempt
+_TRANSIENT_STATUSES = frozenset({"429", "500", "502", "503", "504"})
+_TRANSIENT_SQLSTATES = frozenset({"40001", "40P01", "53300", "57014"})
+
+def _root_error(error: BaseException) -> BaseException:
+    """The client error underneath any DatabaseError wrappers"""
+    while isinstance(error, DatabaseError) and error.original_error is not None:
+        error = error.original_error
+    return error
+
+def is_transient_error(error: BaseException) -> bool:
+    """Whether a database failure may succeed on retry
+    
+    Looks through DatabaseError wrappers to the underlying client error.
+    PostgREST reports its SQLSTATE as the APIError code, or the HTTP status
+    when the response body is not JSON (e.g. a gateway error page).
+    """
+    error = _root_error(error)
+    if isinstance(error, (httpx.TransportError, ConnectionError, TimeoutError)):
+        return True
+    if isinstance(error, APIError):
+        code = str(error.code)
+        return code in _TRANSIENT_STATUSES or code in _TRANSIENT_SQLSTATES or code.startswith("08")
+    return False
 
+def retry_on_error(
+    retries: int = 3,
+    delay: float = 1.0,
+    max_delay: float = 30.0,
+    retryable: Callable[[BaseException], bool] = is_transient_error
+):
+    """Retry decorator for database operations
+    
+    Only failures accepted by retryable are retried, with jittered
+    exponential backoff so concurrent callers don't retry in lockstep.
+    """
+    return retry(
+        stop=stop_after_attempt(retries),
+        wait=wait_exponential_jitter(initial=delay, max=max_delay),
+        retry=retry_if_exception(retryable),
+        before_sleep=before_sleep_log(logger, logging.WARNING),
+        reraise=True
+    )
+
+class CircuitBreaker:
+    """Fail fast while the database is unreachable
+    
+    After failure_threshold consecutive transient failures the circuit opens
+    and calls raise CircuitOpenError without touching the network, which
+    also stops retry_on_error since that error is not transient. Once
+    reset_timeout has passed a single probe call is let through: success
+    closes the circuit, another transient failure keeps it open. Errors the
+    database answered with (e.g. constraint violations) count as success.
+    """
+    __slots__ = (
+        'failure_threshold',
+        'reset_timeout',
+        'is_failure',
+        'failure_count',
+        'open_until',
+        '_probing',
+        '_lock'
+    )
+    
+    def __init__(
+        self,
+        failure_threshold: int,
+        reset_timeout: float,
+        is_failure: Callable[[BaseException], bool] = is_transient_error
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.is_failure = is_failure
+        self.failure_count = 0
+        self.open_until = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+    
+    def _before_call(self) -> None:
+        with self._lock:
+            if self.failure_count < self.failure_threshold:
+                return
+            if self._probing or time.monotonic() < self.open_until:
+                raise CircuitOpenError(
+                    message="Database circuit is open; skipping call",
+                    details={"failure_count": self.failure_count}
+                )
+            self._probing = True
+    
+    def _after_call(self, error: Optional[BaseException] = None) -> None:
+        with self._lock:
+            self._probing = False
+            if error is None or (isinstance(error, Exception) and not self.is_failure(error)):
+                if self.failure_count >= self.failure_threshold:
+                    logger.info("Database circuit closed")
+                self.failure_count = 0
+            elif isinstance(error, Exception):
+                self.failure_count += 1
+                if self.failure_count >= self.failure_threshold:
+                    self.open_until = time.monotonic() + self.reset_timeout
+                    logger.warning(
+                        f"Database circuit open for {self.reset_timeout:g}s",
+                        extra={"failure_count": self.failure_count}
+                    )
+    
+    def call(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Call fn through the breaker"""
+        self._before_call()
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as e:
+            self._after_call(e)
+            raise
+        self._after_call()
+        return result
+    
+    async def acall(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Await fn through the breaker"""
+        self._before_call()
+        try:
+            result = await fn(*args, **kwargs)
+        except BaseException as e:
+            self._after_call(e)
+            raise
+        self._after_call()
+        return result
+
+# Every query in this module executes through the breaker. Reads that
+# already degrade to an empty result keep doing so while it is open.
+db_circuit = CircuitBreaker(
+    settings.DB_CIRCUIT_FAILURE_THRESHOLD,
+    settings.DB_CIRCUIT_RESET_TIMEOUT
+)
+
+# Never written by the application; the database sets it
+_EXCLUDE_FIELDS = frozenset({'created_at'})
+# Already JSON-compatible, so serialize_data passes them through untouched
+_PLAIN_TYPES = frozenset({str, int, float, bool})
+
+@singledispatch
 def serialize_value(value: Any) -> Any:
-    """Serialize value for database operations with recursive UUID handling"""
-    if value is None:
-        return None
-    elif isinstance(value, datetime):
-        return value.isoformat()
-    elif isinstance(value, Decimal):
-        return float(value)
-    elif isinstance(value, Enum):
-        return value.value
-    elif isinstance(value, UUID):
-        return str(value)
-    elif isinstance(value, dict):
-        return {
-            k: serialize_value(v)
-            for k, v in value.items()
-        }
-    elif isinstance(value, (list, tuple)):
-        return [serialize_value(item) for item in value]
+    """Serialize value for database operations with recursive UUID handling
+    
+    Converters are registered per type, so each value costs one dispatch
+    lookup (cached by type) instead of a chain of isinstance checks.
+    """
     return value
 
+@serialize_value.register
+def _(value: datetime) -> str:
+    return value.isoformat()
+
+@serialize_value.register
+def _(value: Decimal) -> float:
+    return float(value)
+
+@serialize_value.register
+def _(value: Enum) -> Any:
+    return value.value
+
+@serialize_value.register
+def _(value: UUID) -> str:
+    return str(value)
+
+@serialize_value.register
+def _(value: dict) -> Dict[str, Any]:
+    return {k: serialize_value(v) for k, v in value.items()}
+
+@serialize_value.register(list)
+@serialize_value.register(tuple)
+def _(value) -> List[Any]:
+    return [serialize_value(item) for item in value]
+
 def serialize_data(data: Dict[str, Any]) -> Dict[str, Any]:
     """Serialize data for database operations"""
-    # Fields to exclude from serialization
-    exclude_fields = {'created_at'}
-    
+    plain = _PLAIN_TYPES
+    # Filtering inline beats data.keys() - _EXCLUDE_FIELDS, which hashes
+    # every key into a new set and then looks each value up again
     return {
-        key: serialize_value(value)
+        key: value if type(value) in plain else serialize_value(value)
         for key, value in data.items()
-        if value is not None and key not in exclude_fields
+        if value is not None and key not in _EXCLUDE_FIELDS
+    }
+
+# Read-through cache for get_records/get_record_by_id. Each table has its own
+# LRU of key -> (expires_at, result) so a write only drops that table's
+# entries; the generation counter stops a read that raced a write from
+# caching the pre-write result.
+_MISS = object()
+_read_cache: Dict[str, "OrderedDict[Any, Tuple[float, Any]]"] = {}
+_read_cache_generation: Dict[str, int] = {}
+_read_cache_lock = threading.Lock()
+
+def _freeze(value: Any) -> Any:
+    """Hashable form of a filter value for cache keys"""
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return frozenset(serialize_value(item) for item in value)
+    return serialize_value(value)
+
+def _cache_lookup(table_name: str, key: Any) -> Tuple[Any, int]:
+    """Return the cached result (or _MISS) and the table's cache generation"""
+    with _read_cache_lock:
+        generation = _read_cache_generation.get(table_name, 0)
+        entries = _read_cache.get(table_name)
+        entry = entries.get(key) if entries else None
+        if entry is None:
+            return _MISS, generation
+        if entry[0] <= time.monotonic():
+            del entries[key]
+            return _MISS, generation
+        entries.move_to_end(key)
+        return entry[1], generation
+
+def _cache_store(table_name: str, key: Any, result: Any, generation: int) -> None:
+    """Cache result unless the table was written since generation was read"""
+    ttl = settings.DB_CACHE_TTL
+    if ttl <= 0:
+        return
+    with _read_cache_lock:
+        if _read_cache_generation.get(table_name, 0) != generation:
+            return
+        entries = _read_cache.setdefault(table_name, OrderedDict())
+        entries[key] = (time.monotonic() + ttl, result)
+        entries.move_to_end(key)
+        while len(entries) > settings.DB_CACHE_MAXSIZE:
+            entries.popitem(last=False)
+
+def invalidate_cache(table_name: str) -> None:
+    """Drop cached reads for a table after it was written"""
+    with _read_cache_lock:
+        _read_cache_generation[table_name] = _read_cache_generation.get(table_name, 0) + 1
+        _read_cache.pop(table_name, None)
+
+def cache_clear() -> None:
+    """Drop every cached read"""
+    with _read_cache_lock:
+        for table_name in _read_cache_generation.keys() | _read_cache.keys():
+            _read_cache_generation[table_name] = _read_cache_generation.get(table_name, 0) + 1
+        _read_cache.clear()
+
+def _create_http_client() -> httpx.Client:
+    """HTTP client with a pool sized for concurrent workers"""
+    return httpx.Client(
+        limits=httpx.Limits(
+            max_connections=settings.DB_POOL_SIZE,
+            max_keepalive_connections=settings.DB_POOL_SIZE,
+            keepalive_expiry=settings.DB_KEEPALIVE_EXPIRY
+        ),
+        timeout=httpx.Timeout(10.0, connect=3.0),
+        follow_redirects=True,
+        http2=True
+    )
+
+def _warm_up(client: Client, http_client: httpx.Client) -> None:
+    """Open pooled connections ahead of business traffic
+    
+    The first request also tests the connection; a failure is only logged,
+    as the first real query surfaces it anyway. Over HTTP/2 the parallel
+    requests share one multiplexed connection; over HTTP/1.1 each opens its
+    own, so later requests skip the TCP and TLS handshakes.
+    """
+    def ping(_: int) -> None:
+        client.table("pdf_extractions").select("id").limit(1).execute()
+    
+    try:
+        ping(0)
+        if settings.DB_WARMUP_CONNECTIONS > 1:
+            with ThreadPoolExecutor(max_workers=settings.DB_WARMUP_CONNECTIONS) as executor:
+                list(executor.map(ping, range(settings.DB_WARMUP_CONNECTIONS)))
+    except Exception as e:
+        logger.error("Supabase connection probe failed", exc_info=e)
+        return
+    logger.info("Supabase connections warmed up", extra=_pool_stats(http_client))
+
+def _pool_stats(http_client: httpx.Client) -> Dict[str, Any]:
+    """Connection pool usage, for logging"""
+    # httpx has no public pool API; count what the transport holds
+    pool = getattr(getattr(http_client, "_transport", None), "_pool", None)
+    connections = list(getattr(pool, "connections", ()))
+    return {
+        "max_connections": settings.DB_POOL_SIZE,
+        "open_connections": len(connections),
+        "idle_connections": sum(1 for conn in connections if conn.is_idle())
     }
 
 @retry_on_error()
 def init_supabase() -> Client:
     """Initialize Supabase client with error handling and retries"""
+    http_client = _create_http_client()
     try:
-        client = create_client(settings.SUPABASE_URL, settings.SUPABASE_KEY)
-        # Test connection
-        client.table("pdf_extractions").select("id").limit(1).execute()
+        client = create_client(
+            settings.SUPABASE_URL,
+            settings.SUPABASE_KEY,
+            options=ClientOptions(httpx_client=http_client)
+        )
+        if settings.SUPABASE_PROBE_ON_INIT:
+            # Off the import path, so startup doesn't wait on a round trip
+            threading.Thread(
+                target=_warm_up,
+                args=(client, http_client),
+                name="supabase-warm-up",
+                daemon=True
+            ).start()
         logger.info("Supabase client initialized successfully")
         return client
     except Exception as e:
+        http_client.close()
         logger.critical("Failed to initialize Supabase client", exc_info=e)
         raise DatabaseError(
             message="Failed to initialize database connection",
@@ -90,60 +350,195 @@ def init_supabase() -> Client:
             original_error=e
         )
 
+@lru_cache()
+def get_supabase_client() -> Client:
+    """Get cached Supabase client shared across reruns and sessions"""
+    return init_supabase()
+
 # Initialize Supabase client
-supabase: Client = init_supabase()
+supabase: Client = get_supabase_client()
+
+# httpx connections belong to the event loop that opened them, so each loop
+# (e.g. each asyncio.run) gets its own async client
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+async def get_async_supabase_client() -> AsyncClient:
+    """Get the async Supabase client for the running event loop"""
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        client = await acreate_client(settings.SUPABASE_URL, settings.SUPABASE_KEY)
+        _async_clients[loop] = client
+    return client
 
 def handle_response(response: Any) -> Union[List[Dict], Dict]:
-    """Handle Supabase response with better error handling"""
-    try:
-        if hasattr(response, 'data'):
-            return response.data or []  # Return empty list for no data
-        return response or {}  # Return empty dict for no response
-    except Exception as e:
-        logger.error("Failed to handle database response", exc_info=e)
-        return []  # Return safe default
+    """Handle Supabase response
+    
+    Helpers in this module read APIResponse.data directly; this remains for
+    callers holding a response of unknown type.
+    """
+    if isinstance(response, APIResponse):
+        return response.data or []  # Return empty list for no data
+    return response or {}  # Return empty dict for no response
+
+def _records_cache_key(
+    filters: Optional[Dict],
+    limit: Optional[int],
+    select: str,
+    order: Optional[Dict[str, str]],
+    after_id: Optional[Any]
+) -> Tuple:
+    """Read cache key for a get_records query"""
+    return (
+        "records",
+        frozenset((name, _freeze(value)) for name, value in filters.items()) if filters else None,
+        limit,
+        select,
+        tuple(sorted(order.items())) if order else None,
+        serialize_value(after_id)
+    )
+
+def _filter_query(
+    query: Any,
+    filters: Optional[Dict],
+    limit: Optional[int],
+    order: Optional[Dict[str, str]],
+    after_id: Optional[Any]
+) -> Any:
+    """Apply get_records filters, cursor, order and limit to a select query
+    
+    Works for both the sync and async clients' request builders.
+    """
+    if filters:
+        for key, value in filters.items():
+            if isinstance(value, (list, tuple, set, frozenset)):
+                # Collection filters match any of the values: key=in.(...)
+                query = query.in_(key, [serialize_value(item) for item in value])
+                continue
+            if isinstance(value, Enum):
+                value = value.value
+            query = query.eq(key, value)
+    
+    if after_id is not None:
+        query = query.gt("id", serialize_value(after_id))
+    
+    if order and isinstance(order, dict):
+        field = order.get("field")
+        direction = order.get("direction", "asc")
+        if field:
+            query = query.order(field, desc=direction.lower() == "desc")
+    
+    if limit:
+        query = query.limit(limit)
+    return query
+
+@retry_on_error()
+def _execute(query: Any) -> APIResponse:
+    """Execute a built query through the breaker, retrying transient failures
+    
+    For readers that degrade to an empty result: retrying here, below their
+    error handling, lets transient failures be retried before one is
+    reported as "no rows".
+    """
+    return db_circuit.call(query.execute)
 
 @retry_on_error()
+async def _aexecute(query: Any) -> APIResponse:
+    """Async _execute"""
+    return await db_circuit.acall(query.execute)
+
 def get_records(
     table_name: str,
     filters: Optional[Dict] = None,
     limit: Optional[int] = None,
     select: str = "*",
-    order: Optional[Dict[str, str]] = None
+    order: Optional[Dict[str, str]] = None,
+    after_id: Optional[Any] = None,
+    cache: bool = True,
+    raise_errors: bool = False
 ) -> List[Dict]:
-    """Get records with enhanced error handling and retries"""
+    """Get records with enhanced error handling and retries
+    
+    after_id restricts the result to ids greater than it, for keyset
+    pagination over an id-ordered query. Results are served from the read
+    cache for up to DB_CACHE_TTL seconds unless cache=False. Transient
+    failures are retried first; a failure that persists returns an empty
+    list unless raise_errors=True, for callers that must not mistake a
+    failed read for an empty result.
+    """
     try:
+        if cache:
+            cache_key = _records_cache_key(filters, limit, select, order, after_id)
+            cached, generation = _cache_lookup(table_name, cache_key)
+            if cached is not _MISS:
+                return [dict(row) for row in cached]
+        
         logger.debug(
             f"Fetching records from {table_name}",
             extra={
                 "filters": filters,
                 "limit": limit,
                 "select": select,
-                "order": order
+                "order": order,
+                "after_id": after_id
             }
         )
         
-        query = supabase.table(table_name).select(select)
+        query = _filter_query(
+            get_supabase_client().table(table_name).select(select),
+            filters, limit, order, after_id
+        )
+        result = _execute(query).data or []
         
-        if filters:
-            for key, value in filters.items():
-                if isinstance(value, Enum):
-                    value = value.value
-                query = query.eq(key, value)
+        logger.info(f"Successfully retrieved {len(result)} records from {table_name}")
+        if cache:
+            _cache_store(table_name, cache_key, [dict(row) for row in result], generation)
+        return result
         
-        if order and isinstance(order, dict):
-            field = order.get("field")
-            direction = order.get("direction", "asc")
-            if field:
-                query = query.order(field, desc=direction.lower() == "desc")
+    except Exception as e:
+        logger.error(
+            f"Failed to retrieve records from {table_name}",
+            exc_info=e,
+            extra={"filters": filters}
+        )
+        if raise_errors:
+            raise DatabaseError(
+                message=f"Failed to retrieve records from {table_name}",
+                error_code=ErrorCode.DB_QUERY,
+                details={"table": table_name},
+                original_error=e
+            )
+        return []  # Return empty list instead of raising error
+
+async def aget_records(
+    table_name: str,
+    filters: Optional[Dict] = None,
+    limit: Optional[int] = None,
+    select: str = "*",
+    order: Optional[Dict[str, str]] = None,
+    after_id: Optional[Any] = None,
+    cache: bool = True
+) -> List[Dict]:
+    """Async get_records; independent reads can be overlapped with asyncio.gather"""
+    try:
+        if cache:
+            cache_key = _records_cache_key(filters, limit, select, order, after_id)
+            cached, generation = _cache_lookup(table_name, cache_key)
+            if cached is not _MISS:
+                return [dict(row) for row in cached]
         
-        if limit:
-            query = query.limit(limit)
-            
-        response = query.execute()
-        result = handle_response(response)
+        client = await get_async_supabase_client()
+        query = _filter_query(
+            client.table(table_name).select(select),
+            filters, limit, order, after_id
+        )
+        result = (await _aexecute(query)).data or []
         
         logger.info(f"Successfully retrieved {len(result)} records from {table_name}")
+        if cache:
+            _cache_store(table_name, cache_key, [dict(row) for row in result], generation)
         return result
         
     except Exception as e:
@@ -154,9 +549,38 @@ def get_records(
         )
         return []  # Return empty list instead of raising error
 
+def get_extractions_with_validations(
+    limit: Optional[int] = None,
+    select: str = "*,validation_results(*)"
+) -> List[Dict]:
+    """Get extractions with their validation results embedded in a single query"""
+    try:
+        query = (
+            get_supabase_client().table("pdf_extractions")
+            .select(select)
+            .order("extracted_at", desc=True)
+        )
+        
+        if limit:
+            query = query.limit(limit)
+            
+        result = _execute(query).data or []
+        
+        logger.info(f"Successfully retrieved {len(result)} extractions with validations")
+        return result
+        
+    except Exception as e:
+        logger.error("Failed to retrieve extractions with validations", exc_info=e)
+        return []  # Return empty list instead of raising error
+
 @retry_on_error()
 def insert_record(table_name: str, data: Dict[str, Any]) -> Dict:
-    """Insert a single record with retries and better error handling"""
+    """Insert a single record with retries and better error handling
+    
+    When data carries its own id, retries are idempotent: if an earlier
+    attempt was committed but its response was lost, the retry's unique
+    violation is answered with the stored row instead of an error.
+    """
     try:
         logger.debug(
             f"Inserting record into {table_name}",
@@ -167,8 +591,11 @@ def insert_record(table_name: str, data: Dict[str, Any]) -> Dict:
         )
         
         serialized_data = serialize_data(data)
-        response = supabase.table(table_name).insert(serialized_data).execute()
-        result = handle_response(response)
+        response = db_circuit.call(
+            get_supabase_client().table(table_name).insert(serialized_data).execute
+        )
+        invalidate_cache(table_name)
+        result = response.data or []
         
         if isinstance(result, list) and result:
             logger.info(
@@ -183,6 +610,16 @@ def insert_record(table_name: str, data: Dict[str, Any]) -> Dict:
         )
         
     except Exception as e:
+        record_id = data.get("id")
+        root = _root_error(e)
+        if record_id is not None and isinstance(root, APIError) and str(root.code) == "23505":
+            existing = get_records(table_name, filters={"id": record_id}, limit=1, cache=False)
+            if existing:
+                logger.info(
+                    f"Record already inserted into {table_name} by an earlier attempt",
+                    extra={"record_id": str(record_id)}
+                )
+                return existing[0]
         logger.error(
             f"Failed to insert record into {table_name}",
             exc_info=e,
@@ -194,6 +631,42 @@ def insert_record(table_name: str, data: Dict[str, Any]) -> Dict:
             original_error=e
         )
 
+@retry_on_error()
+async def ainsert_record(table_name: str, data: Dict[str, Any]) -> Dict:
+    """Async insert_record"""
+    try:
+        client = await get_async_supabase_client()
+        response = await db_circuit.acall(
+            client.table(table_name).insert(serialize_data(data)).execute
+        )
+        invalidate_cache(table_name)
+        result = response.data or []
+        
+        if isinstance(result, list) and result:
+            logger.info(
+                f"Successfully inserted record into {table_name}",
+                extra={"record_id": result[0].get("id")}
+            )
+            return result[0]
+        
+        raise DatabaseError(
+            message="Failed to insert record: No result returned",
+            details={"table": table_name}
+        )
+        
+    except Exception as e:
+        logger.error(
+            f"Failed to insert record into {table_name}",
+            exc_info=e,
+            extra={"table": table_name}
+        )
+        raise DatabaseError(
+            message=f"Failed to insert record: {str(e)}",
+            details={"table": table_name},
+            original_error=e
+        )
+
+@retry_on_error()
 def update_record(table_name: str, record_id: str, data: Dict[str, Any]) -> Dict:
     """Update an existing record"""
     try:
@@ -210,13 +683,14 @@ def update_record(table_name: str, record_id: str, data: Dict[str, Any]) -> Dict
         serialized_data = serialize_data(data)
         
         # Update record
-        response = (
-            supabase.table(table_name)
+        response = db_circuit.call(
+            get_supabase_client().table(table_name)
             .update(serialized_data)
             .eq("id", record_id)
-            .execute()
+            .execute
         )
-        result = handle_response(response)
+        invalidate_cache(table_name)
+        result = response.data or []
         
         if isinstance(result, list) and result:
             logger.info(
@@ -240,9 +714,110 @@ def update_record(table_name: str, record_id: str, data: Dict[str, Any]) -> Dict
             original_error=e
         )
 
+@retry_on_error()
+def insert_records(table_name: str, rows: List[Dict[str, Any]]) -> List[Dict]:
+    """Insert several records in a single request, returning them in input order
+    
+    As with insert_record, retries are idempotent when every row carries its
+    own id: the insert is one statement, so a unique violation on a retry
+    means the earlier attempt stored all of them.
+    """
+    if not rows:
+        return []
+    try:
+        logger.debug(
+            f"Inserting {len(rows)} records into {table_name}",
+            extra={"table": table_name}
+        )
+        
+        serialized_rows = [serialize_data(row) for row in rows]
+        response = db_circuit.call(
+            get_supabase_client().table(table_name).insert(serialized_rows).execute
+        )
+        invalidate_cache(table_name)
+        result = response.data or []
+        
+        if isinstance(result, list) and len(result) == len(rows):
+            logger.info(
+                f"Successfully inserted {len(result)} records into {table_name}",
+                extra={"table": table_name}
+            )
+            return result
+        
+        raise DatabaseError(
+            message="Failed to insert records: unexpected result count",
+            details={"table": table_name, "expected": len(rows)}
+        )
+        
+    except Exception as e:
+        record_ids = [row.get("id") for row in rows]
+        root = _root_error(e)
+        if None not in record_ids and isinstance(root, APIError) and str(root.code) == "23505":
+            existing = get_records(table_name, filters={"id": record_ids}, cache=False)
+            by_id = {str(row["id"]): row for row in existing}
+            if len(by_id) == len(rows):
+                logger.info(
+                    f"Records already inserted into {table_name} by an earlier attempt",
+                    extra={"table": table_name}
+                )
+                return [by_id[str(record_id)] for record_id in record_ids]
+        logger.error(
+            f"Failed to insert records into {table_name}",
+            exc_info=e,
+            extra={"table": table_name}
+        )
+        raise DatabaseError(
+            message=f"Failed to insert records: {str(e)}",
+            details={"table": table_name},
+            original_error=e
+        )
+
+def update_records(table_name: str, record_ids: List[str], data: Dict[str, Any]) -> List[Dict]:
+    """Apply the same update to several records with a single id IN (...) request"""
+    if not record_ids:
+        return []
+    try:
+        logger.debug(
+            f"Updating {len(record_ids)} records in {table_name}",
+            extra={
+                "table": table_name,
+                "data_keys": list(data.keys())
+            }
+        )
+        
+        response = db_circuit.call(
+            get_supabase_client().table(table_name)
+            .update(serialize_data(data))
+            .in_("id", [serialize_value(record_id) for record_id in record_ids])
+            .execute
+        )
+        invalidate_cache(table_name)
+        result = response.data or []
+        
+        logger.info(
+            f"Successfully updated records in {table_name}",
+            extra={"table": table_name}
+        )
+        return result if isinstance(result, list) else [result]
+        
+    except Exception as e:
+        logger.error(f"Failed to update records in {table_name}", exc_info=e)
+        raise DatabaseError(
+            message=f"Failed to update records: {str(e)}",
+            error_code=ErrorCode.DB_ERROR,
+            severity=ErrorSeverity.ERROR,
+            original_error=e
+        )
+
+@retry_on_error()
 def get_record_by_id(table_name: str, record_id: str) -> Optional[Dict]:
-    """Get a single record by ID"""
+    """Get a single record by ID, served from the read cache when fresh"""
     try:
+        cache_key = ("id", serialize_value(record_id))
+        cached, generation = _cache_lookup(table_name, cache_key)
+        if cached is not _MISS:
+            return dict(cached) if cached is not None else None
+        
         logger.debug(
             f"Fetching record from {table_name}",
             extra={
@@ -251,27 +826,29 @@ def get_record_by_id(table_name: str, record_id: str) -> Optional[Dict]:
             }
         )
         
-        response = (
-            supabase.table(table_name)
+        response = db_circuit.call(
+            get_supabase_client().table(table_name)
             .select("*")
             .eq("id", record_id)
             .limit(1)
-            .execute()
+            .execute
         )
         
-        result = handle_response(response)
+        result = response.data or []
         
         if isinstance(result, list) and result:
             logger.info(
                 f"Successfully retrieved record from {table_name}",
                 extra={"record_id": record_id}
             )
+            _cache_store(table_name, cache_key, dict(result[0]), generation)
             return result[0]
         
         logger.warning(
             f"Record not found in {table_name}",
             extra={"record_id": record_id}
         )
+        _cache_store(table_name, cache_key, None, generation)
         return None
         
     except Exception as e:
@@ -294,35 +871,171 @@ def get_record_by_id(table_name: str, record_id: str) -> Optional[Dict]:
             original_error=e
         )
 
+@retry_on_error()
+def get_records_by_ids(table_name: str, record_ids: Iterable[Any]) -> Dict[str, Dict]:
+    """Get several records by ID with a single id IN (...) request
+    
+    Ids still in the read cache are not fetched again. Returns the rows
+    found, keyed by id as a string.
+    """
+    ids = list(dict.fromkeys(serialize_value(record_id) for record_id in record_ids))
+    try:
+        found: Dict[str, Dict] = {}
+        missing: List[str] = []
+        generation = None
+        for record_id in ids:
+            cached, current = _cache_lookup(table_name, ("id", record_id))
+            if generation is None:
+                generation = current
+            if cached is _MISS:
+                missing.append(record_id)
+            elif cached is not None:
+                found[record_id] = dict(cached)
+        if not missing:
+            return found
+        
+        logger.debug(
+            f"Fetching {len(missing)} records from {table_name}",
+            extra={"table": table_name}
+        )
+        
+        response = db_circuit.call(
+            get_supabase_client().table(table_name)
+            .select("*")
+            .in_("id", missing)
+            .execute
+        )
+        rows = {str(row["id"]): row for row in (response.data or [])}
+        
+        for record_id in missing:
+            row = rows.get(record_id)
+            _cache_store(table_name, ("id", record_id), dict(row) if row else None, generation)
+            if row:
+                found[record_id] = row
+        
+        logger.info(f"Successfully retrieved {len(found)} records from {table_name}")
+        return found
+        
+    except Exception as e:
+        logger.error(
+            f"Failed to retrieve records from {table_name}",
+            exc_info=e,
+            extra={"table": table_name}
+        )
+        raise DatabaseError(
+            message=f"Failed to retrieve records from {table_name}",
+            error_code=ErrorCode.DB_QUERY,
+            severity=ErrorSeverity.ERROR,
+            details={
+                "table": table_name,
+                "record_count": len(ids)
+            },
+            original_error=e
+        )
+
+@retry_on_error()
+async def aget_record_by_id(table_name: str, record_id: str) -> Optional[Dict]:
+    """Async get_record_by_id, sharing its read cache"""
+    try:
+        cache_key = ("id", serialize_value(record_id))
+        cached, generation = _cache_lookup(table_name, cache_key)
+        if cached is not _MISS:
+            return dict(cached) if cached is not None else None
+        
+        client = await get_async_supabase_client()
+        response = await db_circuit.acall(
+            client.table(table_name)
+            .select("*")
+            .eq("id", serialize_value(record_id))
+            .limit(1)
+            .execute
+        )
+        result = response.data or []
+        
+        if isinstance(result, list) and result:
+            _cache_store(table_name, cache_key, dict(result[0]), generation)
+            return result[0]
+        
+        logger.warning(
+            f"Record not found in {table_name}",
+            extra={"record_id": record_id}
+        )
+        _cache_store(table_name, cache_key, None, generation)
+        return None
+        
+    except Exception as e:
+        logger.error(
+            f"Failed to retrieve record from {table_name}",
+            exc_info=e,
+            extra={
+                "table": table_name,
+                "record_id": record_id
+            }
+        )
+        raise DatabaseError(
+            message=f"Failed to retrieve record from {table_name}",
+            error_code=ErrorCode.DB_QUERY,
+            severity=ErrorSeverity.ERROR,
+            details={
+                "table": table_name,
+                "record_id": record_id
+            },
+            original_error=e
+        )
+
+class Op(NamedTuple):
+    """Single transaction operation"""
+    table: str
+    action: str
+    data: Dict[str, Any]
+
 class DatabaseTransaction:
     """Context manager for database transactions"""
+    __slots__ = ('operations', 'rollback_operations')
     
     def __init__(self):
-        self.operations: List[Dict] = []
-        self.rollback_operations: List[Dict] = []
+        self.operations: List[Op] = []
+        self.rollback_operations: List[Op] = []
     
-    def add_operation(self, operation: Dict, rollback: Dict):
+    def add_operation(self, operation: Op, rollback: Op):
         """Add operation to transaction"""
         self.operations.append(operation)
         self.rollback_operations.append(rollback)
     
+    def add_operations(self, operations: List[Op], rollbacks: List[Op]):
+        """Add paired operations and rollbacks to transaction in bulk"""
+        if len(operations) != len(rollbacks):
+            raise ValueError("Each operation requires a matching rollback operation")
+        self.operations.extend(operations)
+        self.rollback_operations.extend(rollbacks)
+    
     def execute(self):
-        """Execute all operations in transaction"""
+        """Execute all operations in transaction
+        
+        Consecutive inserts into the same table are sent as one bulk insert;
+        results are returned in operation order.
+        """
         results = []
         try:
-            for operation in self.operations:
-                table = operation["table"]
-                action = operation["action"]
-                data = operation["data"]
-                
+            operations = self.operations
+            i = 0
+            while i < len(operations):
+                table, action, data = operations[i]
                 if action == "insert":
-                    result = insert_record(table, data)
-                elif action == "update":
-                    result = update_record(table, data["id"], data)
+                    end = i + 1
+                    while end < len(operations) and operations[end][:2] == (table, "insert"):
+                        end += 1
+                    if end - i > 1:
+                        results.extend(insert_records(table, [op.data for op in operations[i:end]]))
+                    else:
+                        results.append(insert_record(table, data))
+                    i = end
+                    continue
+                if action == "update":
+                    results.append(update_record(table, data["id"], data))
                 else:
                     raise ValueError(f"Unknown action: {action}")
-                    
-                results.append(result)
+                i += 1
                 
             return results
             
@@ -337,12 +1050,8 @@ class DatabaseTransaction:
     
     def _rollback(self):
         """Rollback transaction"""
-        for operation in reversed(self.rollback_operations):
+        for table, action, data in reversed(self.rollback_operations):
             try:
-                table = operation["table"]
-                action = operation["action"]
-                data = operation["data"]
-                
                 if action == "update":
                     update_record(table, data["id"], data)
                 elif action == "delete":
@@ -365,39 +1074,90 @@ def start_transaction() -> DatabaseTransaction:
             original_error=e
         )
 
+# processing_logs rows are buffered and written with one insert per batch,
+# when LOG_BATCH_SIZE rows are waiting or LOG_FLUSH_INTERVAL seconds after
+# the first buffered row, whichever comes first
+LOG_BATCH_SIZE = 100
+LOG_FLUSH_INTERVAL = 1.0  # seconds
+_log_buffer: List[Dict] = []
+_log_lock = threading.Lock()
+_log_timer: Optional[threading.Timer] = None
+
+def flush_processing_logs() -> None:
+    """Write buffered processing log rows now"""
+    global _log_buffer, _log_timer
+    with _log_lock:
+        batch, _log_buffer = _log_buffer, []
+        if _log_timer is not None:
+            _log_timer.cancel()
+            _log_timer = None
+    if not batch:
+        return
+    try:
+        db_circuit.call(get_supabase_client().table("processing_logs").insert(batch).execute)
+    except Exception as e:
+        # Logging is best-effort; never fail the caller's work over it
+        logger.error(f"Failed to write {len(batch)} processing logs: {str(e)}")
+
+atexit.register(flush_processing_logs)
+
 def log_processing(
     component: str,
     message: str,
     level: str = "INFO",
     details: Optional[Dict] = None
 ) -> Dict:
-    """Log processing step to database"""
-    try:
-        data = {
-            "component": component,
-            "message": message,
-            "level": level,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "details": details or {}
-        }
-        
-        response = supabase.table("processing_logs").insert(data).execute()
-        return handle_response(response)[0]
-        
-    except Exception as e:
-        logger.error(f"Failed to log processing: {str(e)}")
-        return {}
+    """Queue a processing step log for the database, returning the row
+    
+    Rows are timestamped here and written in batches; call
+    flush_processing_logs to write them immediately.
+    """
+    global _log_timer
+    # Rows are only encoded once per batch, at flush; copying a cached
+    # per-(component, level) template measured no faster than this display
+    data = {
+        "component": component,
+        "message": message,
+        "level": level,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "details": details or {}
+    }
+    with _log_lock:
+        _log_buffer.append(data)
+        full = len(_log_buffer) >= LOG_BATCH_SIZE
+        if not full and _log_timer is None:
+            _log_timer = threading.Timer(LOG_FLUSH_INTERVAL, flush_processing_logs)
+            _log_timer.daemon = True
+            _log_timer.start()
+    if full:
+        flush_processing_logs()
+    return data
 
 # Export all functions
 __all__ = [
     'get_records',
+    'aget_records',
+    'get_extractions_with_validations',
     'get_record_by_id',
+    'get_records_by_ids',
+    'aget_record_by_id',
     'insert_record',
+    'ainsert_record',
+    'insert_records',
     'update_record',
+    'update_records',
     'handle_response',
     'serialize_data',
+    'invalidate_cache',
+    'cache_clear',
     'init_supabase',
+    'get_supabase_client',
+    'get_async_supabase_client',
     'supabase',
+    'Op',
     'start_transaction',
-    'log_processing'
+    'log_processing',
+    'flush_processing_logs',
+    'CircuitBreaker',
+    'db_circuit'
 ]
@@ -1,17 +1,36 @@
 """Helper utilities"""
-import json
+import os
+import random
 from typing import Any, Optional
 from datetime import datetime
 import uuid
-from decimal import Decimal
+from decimal import Decimal, ROUND_HALF_UP
+
+import orjson
 
 from core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Trace ids only need to be unique, not unpredictable, so they come from a
+# process-local PRNG instead of os.urandom. Reseeded in forked children so
+# workers don't repeat the parent's sequence.
+_trace_rng = random.Random()
+os.register_at_fork(after_in_child=_trace_rng.seed)
+
 def format_currency(value: Decimal) -> str:
-    """Format currency values"""
-    return f"R$ {value:,.2f}"
+    """Format currency values the Brazilian way, e.g. R$ 1.234,56
+    
+    Rounds half up to whole cents, then formats the integer cents, which
+    avoids Decimal's slower grouping formatter.
+    """
+    amount = value if isinstance(value, Decimal) else Decimal(str(value))
+    if not amount.is_finite():
+        return f"R$ {amount}"
+    cents = int(amount.scaleb(2).to_integral_value(rounding=ROUND_HALF_UP))
+    sign = "-" if cents < 0 else ""
+    units, fraction = divmod(abs(cents), 100)
+    return f"R$ {sign}{units:,}".replace(",", ".") + f",{fraction:02d}"
 
 def format_date(
     date: datetime,
@@ -20,14 +39,19 @@ def format_date(
     """Format datetime objects"""
     return date.strftime(format)
 
-def generate_trace_id() -> str:
-    """Generate unique trace ID"""
-    return str(uuid.uuid4())
+def generate_trace_id(secure: bool = False) -> str:
+    """Generate unique trace ID in UUID4 format
+    
+    Pass secure=True where the id must also be unguessable.
+    """
+    if secure:
+        return str(uuid.uuid4())
+    return str(uuid.UUID(int=_trace_rng.getrandbits(128), version=4))
 
 def safe_json_loads(data: str) -> Optional[Any]:
     """Safely parse JSON string"""
     try:
-        return json.loads(data)
-    except json.JSONDecodeError as e:
+        return orjson.loads(data)
+    except orjson.JSONDecodeError as e:
         logger.error(f"JSON parse error: {str(e)}")
         return None 
\ No newline at end of file
@@ -2,14 +2,51 @@
 import re
 from datetime import datetime
 from decimal import Decimal, InvalidOperation
-from typing import Optional, Union
+from typing import Optional, Sequence, Union
+
+import numpy as np
 
 from core.exceptions import ValidationError, ErrorCode, ErrorSeverity
 
+_NON_DIGITS = re.compile(r'[^0-9]')
+# Deletes every Latin-1 character except ASCII digits
+_NON_DIGIT_TABLE = str.maketrans('', '', ''.join(
+    chr(c) for c in range(256) if not '0' <= chr(c) <= '9'
+))
+_CNPJ_WEIGHTS = (6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2)
+# One column per check digit over the first 13 digits (the first check digit
+# ignores the 13th), so a batch needs a single matrix product
+_CNPJ_WEIGHT_MATRIX = np.array(
+    [_CNPJ_WEIGHTS[1:] + (0,), _CNPJ_WEIGHTS],
+    dtype=np.int64
+).T
+# Brazilian amounts: drop thousands separators, comma becomes the decimal point
+_AMOUNT_TABLE = str.maketrans({'.': None, ',': '.'})
+# What strptime accepts for "%m/%Y", without its per-call lock and locale check
+_MONTH_YEAR_RE = re.compile(r'(1[0-2]|0[1-9]|[1-9])/(\d\d\d\d)')
+
+def _digits_only(value: str) -> str:
+    """Keep only the ASCII digits of value"""
+    digits = value.translate(_NON_DIGIT_TABLE)
+    # Anything left beyond ASCII is a non-Latin-1 character the table can't cover
+    return digits if digits.isascii() else _NON_DIGITS.sub('', digits)
+
+def _cnpj_check_digits_match(cnpj: str) -> bool:
+    """Check both mod-11 check digits of a 14-digit CNPJ"""
+    digits = [ord(c) - 48 for c in cnpj]
+    if digits.count(digits[0]) == 14:
+        return False
+    # The first check digit uses the weights 5..2,9..2; the second 6..2,9..2
+    for position in (12, 13):
+        total = sum(d * w for d, w in zip(digits[:position], _CNPJ_WEIGHTS[13 - position:]))
+        remainder = total % 11
+        if digits[position] != (0 if remainder < 2 else 11 - remainder):
+            return False
+    return True
+
 def validate_cnpj(cnpj: str) -> str:
-    """Validate CNPJ format and digits"""
-    # Remove non-digits
-    cnpj = re.sub(r'[^0-9]', '', cnpj)
+    """Validate CNPJ format and check digits, returning the bare digits"""
+    cnpj = _digits_only(cnpj)
     
     if len(cnpj) != 14:
         raise ValidationError(
@@ -18,12 +55,56 @@ def validate_cnpj(cnpj: str) -> str:
             severity=ErrorSeverity.ERROR
         )
     
+    if not _cnpj_check_digits_match(cnpj):
+        raise ValidationError(
+            message="Invalid CNPJ check digits",
+            error_code=ErrorCode.VALIDATION_ERROR,
+            severity=ErrorSeverity.ERROR
+        )
+    
     return cnpj
 
+def validate_cnpj_batch(cnpjs: Sequence[str]) -> np.ndarray:
+    """Check a batch of CNPJs, returning a boolean mask matching ``is_valid_cnpj``.
+
+    Digits are found over the fixed-width code-point matrix of the whole
+    batch, and both mod-11 check digits of every 14-digit entry come from a
+    single matrix product, so bulk reprocessing runs no per-item Python.
+    Valid entries can then be normalized with ``validate_cnpj``.
+    """
+    values = np.asarray(cnpjs, dtype=str)
+    if values.size == 0:
+        return np.zeros(0, dtype=bool)
+    codes = values.view(np.uint32).reshape(values.size, -1)
+    is_digit = (codes >= ord('0')) & (codes <= ord('9'))
+    valid = is_digit.sum(axis=1) == 14
+    
+    # Row-major boolean indexing keeps each entry's digits in order
+    digits = (codes[valid][is_digit[valid]].astype(np.int64) - ord('0')).reshape(-1, 14)
+    remainders = (digits[:, :13] @ _CNPJ_WEIGHT_MATRIX) % 11
+    expected = np.where(remainders < 2, 0, 11 - remainders)
+    valid[valid] = (
+        (digits[:, 12:] == expected).all(axis=1)
+        & (digits != digits[:, :1]).any(axis=1)
+    )
+    return valid
+
+def is_valid_cnpj(cnpj: str) -> bool:
+    """Check a CNPJ's length and both mod-11 check digits"""
+    cnpj = _digits_only(cnpj)
+    return len(cnpj) == 14 and _cnpj_check_digits_match(cnpj)
+
 def validate_date_format(date_str: str, format: str = "%m/%Y") -> str:
     """Validate date string format"""
     try:
-        datetime.strptime(date_str, format)
+        if format == "%m/%Y":
+            match = _MONTH_YEAR_RE.fullmatch(date_str)
+            if match is None:
+                raise ValueError(f"time data {date_str!r} does not match format {format!r}")
+            # Rejects year 0 exactly like strptime
+            datetime(int(match.group(2)), int(match.group(1)), 1)
+        else:
+            datetime.strptime(date_str, format)
         return date_str
     except ValueError as e:
         raise ValidationError(
@@ -39,11 +120,13 @@ def validate_amount(
 ) -> Decimal:
     """Validate and convert amount"""
     try:
-        if isinstance(amount, str):
+        if isinstance(amount, Decimal):
+            amount_decimal = amount
+        elif isinstance(amount, str):
             # Remove currency symbol and convert commas
-            amount = amount.replace('R$', '').replace('.', '').replace(',', '.')
-        
-        amount_decimal = Decimal(str(amount))
+            amount_decimal = Decimal(amount.replace('R$', '').translate(_AMOUNT_TABLE))
+        else:
+            amount_decimal = Decimal(str(amount))
         
         if amount_decimal <= min_value:
             raise ValidationError(